@@ -119,6 +119,22 @@ if not __worker__:
                 "Consider running `spy.cleanup()` to free up disk space."
             print(msg.format(tmpdir=__storage__, nfs=len(st_fles), sze=st_size))
 
+# Define location and upper bound (in GB) of cache for computational results
+__cache__ = os.path.join(__storage__, "cache")
+__cachelimit__ = 5
+
+# Define location of checkpoints of interrupted (resumable) computations
+__checkpoints__ = os.path.join(__storage__, "checkpoints")
+
+# Default HDF5 storage layout (chunking and compression) of computed results 
+# and saved objects (see `syncopy.shared.parsers.storage_parser` for details)
+__storageopts__ = {"chunks": None, "compression": None, "compression_opts": None,
+                   "shuffle": False}
+
+# Default FFT implementation of spectral estimation routines (see
+# `syncopy.specest.fft_backend.fft_backend_parser` for details)
+__fftbackend__ = {"backend": "numpy", "workers": None}
+
 # Establish ID and log-file for current session
 __sessionid__ = blake2b(digest_size=2, salt=os.urandom(blake2b.SALT_SIZE)).hexdigest()
 __sessionfile__ = os.path.join(__storage__, "session_{}.id".format(__sessionid__))
@@ -571,7 +571,8 @@ class BaseData(ABC):
     definetrial = _definetrial
 
     # Wrapper that makes saving routine usable as class method
-    def save(self, container=None, tag=None, filename=None, overwrite=False, memuse=100):
+    def save(self, container=None, tag=None, filename=None, overwrite=False, memuse=100,
+             storage=None):
         r"""Save data object as new ``spy`` container to disk (:func:`syncopy.save_data`)
         
         FIXME: update docu
@@ -593,6 +594,9 @@ class BaseData(ABC):
             memuse : scalar 
                  Approximate in-memory cache size (in MB) for writing data to disk
                  (only relevant for :class:`VirtualData` or memory map data sources)
+            storage : None or dict
+                 HDF5 chunking and compression settings (if `None`, the layout 
+                 of HDF5 datasets is kept, see :func:`syncopy.save`)
 
         Examples
         --------    
@@ -634,7 +638,7 @@ class BaseData(ABC):
             container = filename_parser(self.filename)["folder"]
             
         spy.save(self, filename=filename, container=container, tag=tag, 
-                 overwrite=overwrite, memuse=memuse)
+                 overwrite=overwrite, memuse=memuse, storage=storage)
 
     # Helper function generating pseudo-random temp file-names    
     def _gen_filename(self):
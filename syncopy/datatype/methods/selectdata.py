@@ -276,9 +276,21 @@ def selectdata(data, trials=None, channels=None, toi=None, toilim=None, foi=None
         
     # Fire up `ComputationalRoutine`-subclass to do the actual selecting/copying
     selectMethod = DataSelection()
-    selectMethod.initialize(data, chan_per_worker=kwargs.get("chan_per_worker"))
+    selectMethod.initialize(data, chan_per_worker=kwargs.get("chan_per_worker"),
+                            mem_thresh=kwargs.get("mem_thresh"))
     selectMethod.compute(data, out, parallel=kwargs.get("parallel"), 
-                         log_dict=actualSelection)
+                         log_dict=actualSelection,
+                         mem_thresh=kwargs.get("mem_thresh"),
+                         trials_per_task=kwargs.get("trials_per_task"),
+                         prefetch=kwargs.get("prefetch"),
+                         resume=kwargs.get("resume", False),
+                         retries=kwargs.get("retries", 0),
+                         profile=kwargs.get("profile", False),
+                         memory_resource=kwargs.get("memory_resource"),
+                         fail_fast=kwargs.get("fail_fast", False),
+                         parallel_store=kwargs.get("parallel_store"),
+                         consolidate=kwargs.get("consolidate", False),
+                         storage=kwargs.get("storage"))
     
     # Wipe data-selection slot to not alter input object
     data._selection = None
@@ -312,3 +324,8 @@ class DataSelection(ComputationalRoutine):
             selection = getattr(data._selection, prop)
             if selection is not None:
                 setattr(out, prop, getattr(data, prop)[selection])
+
+    def output_shapes(self, inShapes, inDtype, argIdx):
+
+        # Selections are copied as is
+        return inShapes, inDtype
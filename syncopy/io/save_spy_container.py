@@ -13,7 +13,8 @@ from collections import OrderedDict
 
 # Local imports
 from syncopy.shared.filetypes import FILE_EXT
-from syncopy.shared.parsers import filename_parser, data_parser, scalar_parser
+from syncopy.shared.parsers import filename_parser, data_parser, scalar_parser, storage_parser
+from syncopy.shared.tools import storage_kwargs
 from syncopy.shared.errors import SPYIOError, SPYTypeError, SPYError, SPYWarning
 from syncopy.io.utils import hash_file, startInfoDict
 from syncopy import __storage__
@@ -21,7 +22,8 @@ from syncopy import __storage__
 __all__ = ["save"]
 
 
-def save(out, container=None, tag=None, filename=None, overwrite=False, memuse=100):
+def save(out, container=None, tag=None, filename=None, overwrite=False, memuse=100,
+         storage=None):
     r"""Save Syncopy data object to disk
 
     The underlying array data object is stored in a HDF5 file, the metadata in
@@ -47,6 +49,14 @@ def save(out, container=None, tag=None, filename=None, overwrite=False, memuse=1
     memuse : scalar 
         Approximate in-memory cache size (in MB) for writing data to disk
         (only relevant for :class:`syncopy.VirtualData` or memory map data sources)
+    storage : None or dict
+        HDF5 chunking and compression settings of the saved datasets (see 
+        :func:`~syncopy.shared.parsers.storage_parser`), chunks are aligned 
+        with the longest trial if ``storage["chunks"]`` is `"trials"`. If `None`, 
+        HDF5 datasets are saved with their current layout (e.g., as chosen in 
+        the computation that created them or when they were saved before) and 
+        all other sources use the package-wide defaults (``syncopy.__storageopts__``). 
+        Ignored if `out` is quick-saved to its own on-disk representation.
         
     Returns
     -------
@@ -153,6 +163,8 @@ def save(out, container=None, tag=None, filename=None, overwrite=False, memuse=1
     
     if not isinstance(overwrite, bool):
         raise SPYTypeError(overwrite, varname="overwrite", expected="bool")
+
+    opts = storage_parser(storage)
     
     # Parse filename for validity and construct full path to HDF5 file
     fileInfo = filename_parser(filename)
@@ -170,6 +182,9 @@ def save(out, container=None, tag=None, filename=None, overwrite=False, memuse=1
     
     # Prevent `out` from trying to re-create its own data file
     if replace:
+        if storage is not None:
+            msg = "Cannot change storage layout of {} in place - `storage` is ignored"
+            SPYWarning(msg.format(dataFile))
         out.data.flush()
         h5f = out.data.file
         dat = out.data
@@ -199,8 +214,14 @@ def save(out, container=None, tag=None, filename=None, overwrite=False, memuse=1
         h5f = h5py.File(dataFile, mode="w")
         
         # Save each member of `_hdfFileDatasetProperties` in target HDF file
+        # (chunks of the storage layout are aligned with the longest trial)
+        trlLen = 1
+        if out.trialdefinition is not None and len(out.trialdefinition):
+            trlLen = max(1, int(np.max(np.diff(np.array(out.trialdefinition)[:, :2], axis=1))))
         for datasetName in out._hdfFileDatasetProperties:
             dataset = getattr(out, datasetName)
+            blockShape = (trlLen,) + tuple(dataset.shape[1:])
+            kwargs = storage_kwargs(opts, dataset.shape, dataset.dtype, blockShape)
             
             # Member is a memory map
             if isinstance(dataset, np.memmap):
@@ -214,14 +235,17 @@ def save(out, container=None, tag=None, filename=None, overwrite=False, memuse=1
                 # Write data block-wise to dataset (use `clear` to wipe blocks of
                 # mem-maps from memory)
                 dat = h5f.create_dataset(datasetName,
-                                        dtype=dataset.dtype, shape=dataset.shape)
+                                        dtype=dataset.dtype, shape=dataset.shape, **kwargs)
                 for m, M in enumerate(n_blocks):
                     dat[m * nrow: m * nrow + M, :] = out.data[m * nrow: m * nrow + M, :]
                     out.clear()
             
-            # Member is a HDF5 dataset
+            # Member is a HDF5 dataset: keep its layout unless told otherwise
             else:
-                dat = h5f.create_dataset(datasetName, data=dataset)
+                if storage is None and isinstance(dataset, h5py.Dataset) and \
+                    not dataset.is_virtual and dataset.chunks is not None:
+                    kwargs = _dataset_storage(dataset)
+                dat = h5f.create_dataset(datasetName, data=dataset, **kwargs)
 
     # Now write trial-related information
     trl_arr = np.array(out.trialdefinition)
@@ -298,6 +322,21 @@ def save(out, container=None, tag=None, filename=None, overwrite=False, memuse=1
 
     return
 
+def _dataset_storage(dataset):
+    """
+    Local helper returning the chunking and compression settings of a (chunked) 
+    HDF5 `dataset` as keywords of :meth:`h5py.Group.create_dataset`
+    """
+    kwargs = {"chunks": dataset.chunks}
+    if dataset.compression is not None:
+        kwargs["compression"] = dataset.compression
+        if dataset.compression_opts is not None:
+            kwargs["compression_opts"] = dataset.compression_opts
+    if dataset.shuffle:
+        kwargs["shuffle"] = True
+    return kwargs
+
+
 def _dict_converter(dct, firstrun=True):
     """
     Convert all dict values having NumPy dtypes to corresponding builtin types
@@ -20,7 +20,8 @@ if sys.platform == "win32":
     colorama.init(strip=False)
 
 # Local imports
-from syncopy import __storage__, __sessionid__, __checksum_algorithm__
+from syncopy import (__storage__, __sessionid__, __checksum_algorithm__, __cache__,
+                     __checkpoints__)
 from syncopy.datatype.base_data import BaseData
 from syncopy.shared.parsers import scalar_parser
 from syncopy.shared.errors import SPYTypeError
@@ -67,6 +68,14 @@ def cleanup(older_than=24, **kwargs):
     ----------
     older_than : int
         Files older than `older_than` hours will be removed
+
+    Notes
+    -----
+    Cached results of computational routines (stored in `syncopy.__cache__`) 
+    that have not been used in the last `older_than` hours are removed without 
+    prompting for confirmation. Similarly, checkpoints of interrupted resumable 
+    computations (stored in `syncopy.__checkpoints__`) are only removed if 
+    they have not been updated in the last `older_than` hours. 
         
     Examples
     --------
@@ -92,6 +101,22 @@ def cleanup(older_than=24, **kwargs):
     if not isinstance(interactive, bool):
         raise SPYTypeError(interactive, varname="interactive", expected="bool")
 
+    # Cached results can be re-computed anytime: evict stale entries without asking
+    numEvicted, szEvicted = _evict_cache(older_than=older_than)
+    if numEvicted:
+        cacheInfo = "{name:s} Removed {numc:d} cached results not used in the last " +\
+            "{age:d} hours freeing up {szc:4.1f} MB of disk space. "
+        print(cacheInfo.format(name=funcName, numc=numEvicted, age=older_than, 
+                               szc=szEvicted/1024**2))
+
+    # Checkpoints are not associated to sessions: only remove abandoned ones
+    numEvicted, szEvicted = _evict_checkpoints(older_than)
+    if numEvicted:
+        ckptInfo = "{name:s} Removed {numc:d} checkpoints of interrupted computations " +\
+            "not resumed in the last {age:d} hours freeing up {szc:4.1f} MB of disk space. "
+        print(ckptInfo.format(name=funcName, numc=numEvicted, age=older_than, 
+                              szc=szEvicted/1024**2))
+
     # Get current date + time and scan package's temp directory for session files
     now = datetime.now()
     sessions = glob(os.path.join(__storage__, "session*"))
@@ -288,3 +313,101 @@ def _rm_session(session_files):
      for file in session_files]
 
     return
+
+
+def _evict_cache(limit=None, older_than=None):
+    """
+    Local helper for removing cached results of computational routines
+
+    Parameters
+    ----------
+    limit : None or scalar
+        Maximal size of cache (in GB). Least recently used entries are removed
+        until the cache fits into `limit`. If `None`, the size of the cache 
+        is not checked. 
+    older_than : None or int
+        Entries not used in the last `older_than` hours are removed. If `None`, 
+        entries are not removed based on their age. 
+
+    Returns
+    -------
+    numEvicted : int
+        Number of removed cache entries
+    szEvicted : int
+        Total size (in bytes) of removed entries
+
+    Notes
+    -----
+    The modification time of cache entries is updated every time an entry is 
+    used (see :meth:`~syncopy.shared.computational_routine.ComputationalRoutine.fetch_cached`), 
+    i.e., it reflects the time of last usage. 
+    """
+
+    entries = []
+    for entry in glob(os.path.join(__cache__, "*.h5")):
+        try:
+            stat = os.stat(entry)
+        except FileNotFoundError:
+            continue
+        entries.append((stat.st_mtime, stat.st_size, entry))
+    entries.sort()
+
+    now = datetime.now().timestamp()
+    totalSize = sum(entry[1] for entry in entries)
+    numEvicted = 0
+    szEvicted = 0
+    for mtime, size, entry in entries:
+        tooOld = older_than is not None and (now - mtime) / 3600 >= older_than
+        tooBig = limit is not None and totalSize > limit * 1024**3
+        if not (tooOld or tooBig):
+            continue
+        try:
+            os.unlink(entry)
+        except FileNotFoundError:
+            continue
+        totalSize -= size
+        numEvicted += 1
+        szEvicted += size
+
+    return numEvicted, szEvicted
+
+
+def _evict_checkpoints(older_than):
+    """
+    Local helper for removing abandoned checkpoints of resumable computations
+
+    Parameters
+    ----------
+    older_than : int
+        Checkpoints not updated in the last `older_than` hours are removed
+
+    Returns
+    -------
+    numEvicted : int
+        Number of removed checkpoints
+    szEvicted : int
+        Total size (in bytes) of removed checkpoints
+
+    Notes
+    -----
+    The age of a checkpoint is determined by its most recently modified file 
+    (the manifest of completed tasks is re-written while the computation 
+    progresses, see :meth:`~syncopy.shared.computational_routine.ComputationalRoutine.compute`). 
+    """
+
+    now = datetime.now().timestamp()
+    numEvicted = 0
+    szEvicted = 0
+    for ckpt in glob(os.path.join(__checkpoints__, "*")):
+        try:
+            stats = [os.stat(ckpt)] + [os.stat(os.path.join(ckpt, fname)) 
+                                       for fname in os.listdir(ckpt)]
+        except (FileNotFoundError, NotADirectoryError):
+            continue
+        if (now - max(stat.st_mtime for stat in stats)) / 3600 < older_than:
+            continue
+        shutil.rmtree(ckpt, ignore_errors=True)
+        numEvicted += 1
+        szEvicted += sum(stat.st_size for stat in stats[1:])
+
+    return numEvicted, szEvicted
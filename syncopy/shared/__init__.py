@@ -5,17 +5,24 @@
 
 # Import __all__ routines from local modules
 from . import (queries, errors, parsers, kwarg_decorators,
-               computational_routine, tools)
+               computational_routine, pipeline, profiling, handle_pool,
+               tools)
 from .queries import *
 from .errors import *
 from .parsers import *
 from .kwarg_decorators import *
 from .computational_routine import *
+from .pipeline import *
+from .profiling import *
+from .handle_pool import *
 from .tools import *
 
 # Populate local __all__ namespace
 __all__ = []
 __all__.extend(computational_routine.__all__)
+__all__.extend(pipeline.__all__)
+__all__.extend(profiling.__all__)
+__all__.extend(handle_pool.__all__)
 __all__.extend(errors.__all__)
 __all__.extend(parsers.__all__)
 __all__.extend(kwarg_decorators.__all__)
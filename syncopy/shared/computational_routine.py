@@ -6,11 +6,17 @@
 # Builtin/3rd party package imports
 import os
 import sys
+import json
+import shutil
+import queue
+import threading
 import psutil
 import h5py
 import time
 import numpy as np
 from abc import ABC, abstractmethod
+from concurrent.futures import (ThreadPoolExecutor, ProcessPoolExecutor,
+                                wait, FIRST_COMPLETED)
 from copy import copy
 from glob import glob
 from numpy.lib.format import open_memmap
@@ -22,9 +28,17 @@ if sys.platform == "win32":
     colorama.init(strip=False)
 
 # Local imports
-from .tools import get_defaults
+from .tools import (get_defaults, nan_partial_sum, combine_partial_sums, partial_mean,
+                    storage_kwargs)
+from .parsers import scalar_parser, storage_parser
+from .filetypes import FILE_EXT
+from .profiling import summarize_profile, _peak_rss, _worker_name
+from .handle_pool import (workerPool, release_handles, read_chunk, read_selection,
+                          detach_result)
+import syncopy as spy
 from syncopy import __storage__, __dask__, __path__
-from syncopy.shared.errors import SPYIOError, SPYValueError, SPYParallelError, SPYWarning
+from syncopy.shared.errors import (SPYIOError, SPYValueError, SPYTypeError, 
+                                   SPYParallelError, SPYWarning)
 if __dask__:
     import dask.distributed as dd
     import dask.bag as db
@@ -34,6 +48,10 @@ if __dask__:
 
 __all__ = []
 
+# Parallel computations queued by `compute_batch` (if `None`, computations are
+# performed right away)
+_batchQueue = None
+
 
 class ComputationalRoutine(ABC):
     """Abstract class for encapsulating sequential/parallel algorithms
@@ -122,10 +140,19 @@ class ComputationalRoutine(ABC):
         # ``self.argv = [3, [0, 1, 1], ('a', 'b', 'c')]`` (compare to `self.ArgV` below)
         self.argv = list(argv)
 
+        # positional arguments as provided by the user (i.e., not duplicated 
+        # to fit trials by `initialize`), used for computing `self.computationKey`
+        self.inputArgv = list(argv)
+
         # list of positional keyword arguments split up for each worker w/format: 
         # ``self.ArgV = [(3,0,'a'), (3,1,'b'), (3,1,'c')`` (compare `self.argv` above)
         self.ArgV = None
 
+        # list of indices of positional arguments that are identical for all trials
+        # (e.g., ``self.sharedArgs = [0]`` for `self.argv` above); these are sent 
+        # to parallel workers only once instead of with every task
+        self.sharedArgs = []
+
         # dict of default keyword values accepted by `computeFunction`
         self.defaultCfg = get_defaults(self.computeFunction)
         
@@ -166,7 +193,28 @@ class ComputationalRoutine(ABC):
         
         # list of shape-tuples of trial-chunk results
         self.targetShapes = None
-        
+
+        # list of trial numbers of all trial-chunks (one entry per chunk)
+        self.chunkTrials = None
+
+        # list of slices (or `None`) for cropping the results of trial-chunks along 
+        # their first (time) axis, i.e., for discarding the overlap of time-blocks 
+        # of split trials (see `self._split_chunks`)
+        self.targetCrops = None
+
+        # list of lists of (neighboring) chunk indices processed by a single
+        # parallel task, e.g., ``self.taskLayout = [[0, 1], [2, 3], [4]]``
+        # (in parallel computations, tasks are ordered by decreasing cost)
+        self.taskLayout = None
+
+        # list of estimated memory footprints (in bytes) of the results of all 
+        # tasks in `self.taskLayout` (used as proxy for their computational cost)
+        self.taskMem = None
+
+        # name of worker resource that tasks are annotated with (their `self.taskMem`
+        # value); if `None`, tasks do not require any worker resources
+        self.memoryResource = None
+
         # binary flag: if `True`, use fancy array indexing via `np.ix_` to extract 
         # data from input via `self.sourceLayout` + `self.sourceSelectors`; if `False`,
         # only use `self.sourceLayout` (selections ordered, no reps)
@@ -180,22 +228,111 @@ class ComputationalRoutine(ABC):
         
         # h5py layout encoding shape/geometry of file sources within virtual output dataset
         self.VirtualDatasetLayout = None
+
+        # if `True`, every parallel worker appends its results to its own shard 
+        # file in `self.virtualDatasetDir` (instead of writing one file per task)
+        self.shardedStore = False
+
+        # if `True`, the virtual output dataset is re-written into a single 
+        # contiguous dataset once all parallel tasks are done
+        self.consolidate = False
+
+        # HDF5 storage options (chunking/compression) of output datasets
+        # (see `syncopy.shared.parsers.storage_parser`)
+        self.storage = None
         
         # name of output dataset
         self.datasetName = None
+
+        # hex-digest identifying computation in result cache (set by `fetch_cached`;
+        # if `None`, results are not cached)
+        self.cacheKey = None
+
+        # hex-digest identifying the calculation performed on `self.keyedInput`, 
+        # i.e., the input object, its selection and `self.keeptrials` (computed 
+        # only once by `_cache_key` and shared by result cache and checkpoints)
+        self.computationKey = None
+        self.keyedInput = None
         
         # tmp holding var for preserving original access mode of `data`
         self.dataMode = None
         
-        # time (in seconds) b/w querying state of futures ('pending' -> 'finished')
-        self.sleepTime = 0.1
+        # minimal time (in seconds) b/w consecutive updates of the checkpoint 
+        # manifest of resumable computations
+        self.manifestInterval = 1.0
+
+        # if `True`, all remaining parallel tasks are cancelled once a task failed
+        self.failFast = False
+
+        # indices of tasks in `self.taskLayout` scheduled in the current parallel
+        # run and futures of these tasks (set by `compute_parallel`)
+        self.pendingTasks = []
+        self.futures = []
+
+        # scheduler priorities of pending parallel tasks (if `None`, tasks are
+        # prioritized in order of `self.taskLayout`, see `compute_batch`)
+        self.taskPriority = None
+
+        # per-key scheduler priorities and worker resources of the tasks of the 
+        # current parallel run (passed on to `dask.distributed.Client.persist`)
+        self.keyPriorities = {}
+        self.keyResources = {}
 
         # if `True`, enforces use of single-threaded scheduler in `compute_parallel`
         self.parallelDebug = False
+
+        # number of local workers used by `compute_threads` and `compute_processes`
+        # (if `None`, all available CPU cores are used)
+        self.localWorkers = None
+
+        # fraction of available memory usable by chunks processed concurrently
+        # by local workers (set by `compute`)
+        self.memThresh = 0.5
+
+        # memory budget (in bytes) channel-blocks were sized for by 
+        # `_auto_chan_per_worker`; chunks within this budget are always accepted 
+        # by `compute` (if `None`, channel-blocks were not sized automatically)
+        self.chanBlockMem = None
+
+        # directory holding by-task HDF5 files of a resumable parallel computation 
+        # (if `None`, interrupted computations cannot be resumed)
+        self.checkpointDir = None
+
+        # indices of tasks in `self.taskLayout` completed by a previous (interrupted) run
+        self.completedTasks = []
+
+        # no. of times failed parallel tasks are re-scheduled before computation is aborted
+        self.retries = 0
+
+        # no. of trials read ahead (and results queued for writing) by background
+        # threads in `compute_sequential` (if 0, no prefetching is performed)
+        self.prefetchDepth = 0
+
+        # binary flag: if `True`, record timings and memory usage of every chunk
+        self.profile = False
+
+        # dict of per-chunk profiling records (keys are chunk indices)
+        self.profileRecords = {}
+
+        # aggregated profiling results stored in `out.cfg["profile"]` (if `None`,
+        # the computation was not profiled)
+        self.profileSummary = None
         
         # format string for tqdm progress bars in sequential and parallel computations
         self.tqdmFormat = "{desc}: {percentage:3.0f}% |{bar}| {n_fmt}/{total_fmt} [{elapsed}<{remaining}]"
 
+        # name of file recording completed tasks of resumable computations
+        self._manifestName = "manifest.json"
+
+        # max. no. of bytes held in memory when copying virtual datasets to the result cache
+        self._cacheBlockSize = 100 * 1024**2
+
+        # fan-in of the tree reduction combining partial trial sums in `compute_parallel`
+        self.reduceSplitEvery = 8
+
+        # minimal number of tasks per worker if chunks are batched automatically
+        self._tasksPerWorker = 4
+
         # maximal acceptable size (in MB) of any provided positional argument
         self._maxArgSize = 100
         
@@ -203,7 +340,7 @@ class ComputationalRoutine(ABC):
         self._callMax = 10000
         self._callCount = 0
 
-    def initialize(self, data, chan_per_worker=None, keeptrials=True):
+    def initialize(self, data, chan_per_worker=None, keeptrials=True, mem_thresh=None):
         """
         Perform dry-run of calculation to determine output shape
 
@@ -212,7 +349,7 @@ class ComputationalRoutine(ABC):
         data : syncopy data object
            Syncopy data object to be processed (has to be the same object 
            that is passed to :meth:`compute` for the actual calculation). 
-        chan_per_worker : None or int
+        chan_per_worker : None or int or "auto"
            Number of channels to be processed by each worker (only relevant in
            case of concurrent processing). If `chan_per_worker` is `None` (default) 
            by-trial parallelism is used, i.e., each worker processes 
@@ -220,9 +357,17 @@ class ComputationalRoutine(ABC):
            are split into channel-groups of size `chan_per_worker` (+ rest if the 
            number of channels is not divisible by `chan_per_worker` without 
            remainder) and workers are assigned by-trial channel-groups for 
-           processing. 
+           processing. If `chan_per_worker` is `"auto"`, the size of channel-groups 
+           is derived from the expected result size and the memory of the workers
+           of the active parallel computing client (see :meth:`_auto_chan_per_worker`). 
         keeptrials : bool
             Flag indicating whether to return individual trials or average
+        mem_thresh : None or float
+           Fraction of available (worker) memory a single result may occupy 
+           (see :meth:`compute`). Has to be provided here if `chan_per_worker` 
+           is `"auto"`, since channel-blocks are sized in this method. If 
+           `None`, the current value of `self.memThresh` (default: 0.5) is 
+           kept. 
         
         Returns
         -------
@@ -240,6 +385,9 @@ class ComputationalRoutine(ABC):
         
         # First store `keeptrial` keyword value (important for output shapes below)
         self.keeptrials = keeptrials
+        if mem_thresh is not None:
+            self.memThresh = mem_thresh
+        self.chanBlockMem = None
         
         # Determine if data-selection was provided; if so, extract trials and check
         # whether selection requires fancy array indexing
@@ -253,19 +401,24 @@ class ComputationalRoutine(ABC):
 
         # If lists/tuples are in positional arguments, ensure `len == numTrials`
         # Scalars are duplicated to fit trials, e.g., ``self.argv = [3, [0, 1, 1]]``
-        # then ``argv = [[3, 3, 3], [0, 1, 1]]``
+        # then ``argv = [[3, 3, 3], [0, 1, 1]]`` (all entries of a duplicated 
+        # argument reference the same object which is broadcast to parallel 
+        # workers only once, see `self.sharedArgs`)
+        self.sharedArgs = []
         for ak, arg in enumerate(self.argv):
-
-            # Ensure arguments are within reasonable size for distribution across workers
-            # (protect against circular object references by imposing max. calls)
-            self._callCount = 0
-            argsize = self._sizeof(arg)
-            if argsize > self._maxArgSize:
-                lgl = "positional arguments less than 100 MB each"
-                act = "positional argument with memory footprint of {0:4.2f} MB"
-                raise SPYValueError(legal=lgl, varname="argv", actual=act.format(argsize))
             
             if isinstance(arg, (list, tuple)):
+
+                # Ensure by-trial arguments are within reasonable size for distribution 
+                # across workers (protect against circular object references by 
+                # imposing max. calls)
+                self._callCount = 0
+                argsize = self._sizeof(arg)
+                if argsize > self._maxArgSize:
+                    lgl = "by-trial positional arguments less than 100 MB each"
+                    act = "positional argument with memory footprint of {0:4.2f} MB"
+                    raise SPYValueError(legal=lgl, varname="argv", actual=act.format(argsize))
+
                 if len(arg) != numTrials:
                     lgl = "list/tuple of positional arguments for each trial"
                     act = "length of list/tuple does not correspond to number of trials"
@@ -279,22 +432,13 @@ class ComputationalRoutine(ABC):
                         "a list or tuple instead!"
                     SPYWarning(msg)
             self.argv[ak] = [arg] * numTrials
+            self.sharedArgs.append(ak)
                 
         # Prepare dryrun arguments and determine geometry of trials in output
         dryRunKwargs = copy(self.cfg)
         dryRunKwargs["noCompute"] = True
-        chk_list = []
-        dtp_list = []
-        trials = []
-        for tk, trialno in enumerate(self.trialList):
-            trial = data._preview_trial(trialno)
-            trlArg = tuple(arg[tk] for arg in self.argv)
-            chunkShape, dtype = self.computeFunction(trial, 
-                                                     *trlArg,
-                                                     **dryRunKwargs)
-            chk_list.append(list(chunkShape))
-            dtp_list.append(dtype)
-            trials.append(trial)
+        trials = [data._preview_trial(trialno) for trialno in self.trialList]
+        chk_list, dtp_list = self._dry_run(trials, list(range(numTrials)), dryRunKwargs)
             
         # The aggregate shape is computed as max across all chunks                    
         chk_arr = np.array(chk_list)
@@ -310,7 +454,14 @@ class ComputationalRoutine(ABC):
         self.cfg["chunkShape"] = chunkShape
         self.dtype = np.dtype(dtp_list[0])
 
-        # Ensure channel parallelization can be done at all
+        # Ensure channel parallelization can be done at all (automatic channel-
+        # blocking silently falls back to by-trial parallelism)
+        if isinstance(chan_per_worker, str):
+            if chan_per_worker != "auto":
+                lgl = "positive integer or 'auto'"
+                raise SPYValueError(legal=lgl, varname="chan_per_worker", actual=chan_per_worker)
+            if "channel" not in data.dimord or self.keeptrials is False:
+                chan_per_worker = None
         if chan_per_worker is not None and "channel" not in data.dimord:
             msg = "input object does not contain `channel` dimension for parallelization!"
             SPYWarning(msg)
@@ -319,107 +470,85 @@ class ComputationalRoutine(ABC):
             msg = "trial-averaging does not support channel-block parallelization!"
             SPYWarning(msg)
             chan_per_worker = None
-        if data._selection is not None:
-            if chan_per_worker is not None and data._selection.channel != slice(None, None, 1):
-                msg = "channel selection and simultaneous channel-block " +\
-                    "parallelization not yet supported!"
-                SPYWarning(msg)
-                chan_per_worker = None
+        if chan_per_worker == "auto":
+            nChannels = trials[0].shape[data.dimord.index("channel")]
+            chan_per_worker = self._auto_chan_per_worker(nChannels, chunkShape)
             
         # Allocate control variables
-        trial = trials[0]
-        trlArg0 = tuple(arg[0] for arg in self.argv)
-        chunkShape0 = chk_arr[0, :]
-        lyt = [slice(0, stop) for stop in chunkShape0]
         sourceLayout = []
         targetLayout = []
         targetShapes = []
         ArgV = []
 
-        # If parallelization across channels is requested the first trial is 
-        # split up into several chunks that need to be processed/allocated
+        # If parallelization across channels is requested, trials are split 
+        # up into several chunks that need to be processed/allocated
         if chan_per_worker is not None:
 
-            # Set up channel-chunking
-            nChannels = data.channel.size
+            # Set up channel-chunking: blocks consist of consecutive (selected) channels
+            inchanidx = data.dimord.index("channel")
+            nChannels = trials[0].shape[inchanidx]
             rem = int(nChannels % chan_per_worker)
             n_blocks = [chan_per_worker] * int(nChannels//chan_per_worker) + [rem] * int(rem > 0)        
-            inchanidx = data.dimord.index("channel")
             
+            # Assemble channel-blocks of all trials
+            blockTrials = []
+            blockArgIdx = []
+            for tk, trial in enumerate(trials):
+                chanIdx = _channel_indices(trial.idx[inchanidx], data.channel.size)
+                blockstack = 0
+                for block in n_blocks:
+                    blockTrial = copy(trial)
+                    shp = list(trial.shape)
+                    idx = list(trial.idx)
+                    shp[inchanidx] = block
+                    idx[inchanidx] = _channel_block(chanIdx, blockstack, blockstack + block)
+                    blockTrial.shape = tuple(shp)
+                    blockTrial.idx = tuple(idx)
+                    blockTrials.append(blockTrial)
+                    blockArgIdx.append(tk)
+                    blockstack += block
+
             # Perform dry-run w/first channel-block of first trial to identify 
             # changes in output shape w.r.t. full-trial output (`chunkShape`)
-            shp = list(trial.shape)
-            idx = list(trial.idx)
-            shp[inchanidx] = n_blocks[0]
-            idx[inchanidx] = slice(0, n_blocks[0])
-            trial.shape = tuple(shp)
-            trial.idx = tuple(idx)
-            res, _ = self.computeFunction(trial, *trlArg0, **dryRunKwargs)
+            chunkShape0 = chk_list[0]
+            res, _ = self.computeFunction(blockTrials[0], *tuple(arg[0] for arg in self.argv), 
+                                          **dryRunKwargs)
             outchan = [dim for dim in res if dim not in chunkShape0]
             if len(outchan) != 1:
                 lgl = "exactly one output dimension to scale w/channel count"
                 act = "{0:d} dimensions affected by varying channel count".format(len(outchan))
                 raise SPYValueError(legal=lgl, varname="chan_per_worker", actual=act)
-            outchanidx = res.index(outchan[0])            
-            
-            # Get output chunks and grid indices for first trial
-            chanstack = 0
-            blockstack = 0
-            for block in n_blocks:
-                shp = list(trial.shape)
-                idx = list(trial.idx)
-                shp[inchanidx] = block
-                idx[inchanidx] = slice(blockstack, blockstack + block)
-                trial.shape = tuple(shp)
-                trial.idx = tuple(idx)
-                res, _ = self.computeFunction(trial, *trlArg0, **dryRunKwargs)
-                lyt[outchanidx] = slice(chanstack, chanstack + res[outchanidx])
-                targetLayout.append(tuple(lyt))
-                targetShapes.append(tuple([slc.stop - slc.start for slc in lyt]))
-                sourceLayout.append(trial.idx)
-                ArgV.append(trlArg0)
-                chanstack += res[outchanidx]
-                blockstack += block
-
-        # Simple: consume all channels simultaneously, i.e., just take the entire trial
-        else:
-            targetLayout.append(tuple(lyt))
-            targetShapes.append(chunkShape0)
-            sourceLayout.append(trial.idx)
-            ArgV.append(trlArg0)
+            outchanidx = list(res).index(outchan[0])
+            blockShapes, _ = self._dry_run(blockTrials, blockArgIdx, dryRunKwargs)
             
-        # Construct dimensional layout of output
-        stacking = targetLayout[0][0].stop
-        for tk in range(1, len(self.trialList)):
-            trial = trials[tk]
+        # Construct dimensional layout of output: trials are stacked along the
+        # first axis, channel-blocks (if any) along the output channel axis
+        stacking = 0
+        bk = 0
+        for tk, trial in enumerate(trials):
             trlArg = tuple(arg[tk] for arg in self.argv)
             chkshp = chk_list[tk]
             lyt = [slice(0, stop) for stop in chkshp]
             lyt[0] = slice(stacking, stacking + chkshp[0])
             stacking += chkshp[0]
+            
+            # Simple: consume all channels simultaneously, i.e., just take the entire trial
             if chan_per_worker is None:
                 targetLayout.append(tuple(lyt))
                 targetShapes.append(tuple([slc.stop - slc.start for slc in lyt]))
                 sourceLayout.append(trial.idx)
                 ArgV.append(trlArg)
-            else:
-                chanstack = 0
-                blockstack = 0
-                for block in n_blocks:
-                    shp = list(trial.shape)
-                    idx = list(trial.idx)
-                    shp[inchanidx] = block
-                    idx[inchanidx] = slice(blockstack, blockstack + block)
-                    trial.shape = tuple(shp)
-                    trial.idx = tuple(idx)
-                    res, _ = self.computeFunction(trial, *trlArg, **dryRunKwargs) # FauxTrial
-                    lyt[outchanidx] = slice(chanstack, chanstack + res[outchanidx])
-                    targetLayout.append(tuple(lyt))
-                    targetShapes.append(tuple([slc.stop - slc.start for slc in lyt]))
-                    sourceLayout.append(trial.idx)
-                    chanstack += res[outchanidx]
-                    blockstack += block
-                    ArgV.append(trlArg)
+                continue
+            chanstack = 0
+            for block in n_blocks:
+                res = blockShapes[bk]
+                lyt[outchanidx] = slice(chanstack, chanstack + res[outchanidx])
+                targetLayout.append(tuple(lyt))
+                targetShapes.append(tuple([slc.stop - slc.start for slc in lyt]))
+                sourceLayout.append(blockTrials[bk].idx)
+                ArgV.append(trlArg)
+                chanstack += res[outchanidx]
+                bk += 1
                     
         # If the determined source layout contains unordered lists and/or index 
         # repetitions, set `self.useFancyIdx` to `True` and prepare a separate
@@ -465,8 +594,15 @@ class ComputationalRoutine(ABC):
         self.sourceSelectors = sourceSelectors
         self.targetLayout = targetLayout
         self.targetShapes = targetShapes
+        self.targetCrops = [None] * len(sourceLayout)
+        chunksPerTrial = len(sourceLayout) // len(self.trialList)
+        self.chunkTrials = [int(trialno) for trialno in self.trialList
+                            for blk in range(chunksPerTrial)]
         self.ArgV = ArgV
 
+        # By default, every chunk is processed by its own parallel task
+        self.taskLayout = [[chk] for chk in range(len(sourceLayout))]
+
         # Compute max. memory footprint of chunks
         if chan_per_worker is None:
             self.chunkMem = np.prod(self.cfg["chunkShape"]) * self.dtype.itemsize
@@ -477,7 +613,10 @@ class ComputationalRoutine(ABC):
         self.dataMode = data.mode
 
     def compute(self, data, out, parallel=False, parallel_store=None,
-                method=None, mem_thresh=0.5, log_dict=None, parallel_debug=False):
+                method=None, mem_thresh=None, log_dict=None, parallel_debug=False,
+                trials_per_task=None, prefetch=None, resume=False, retries=0,
+                profile=False, memory_resource=None, fail_fast=False, 
+                consolidate=False, storage=None):
         """
         Central management and processing method
 
@@ -489,13 +628,17 @@ class ComputationalRoutine(ABC):
            dry-run). 
         out : syncopy data object
            Empty object for holding results
-        parallel : bool
+        parallel : bool or str
            If `True`, processing is performed in parallel (i.e., 
            :meth:`computeFunction` is executed concurrently across trials). 
            If `parallel` is `False`, :meth:`computeFunction` is executed 
            consecutively trial after trial (i.e., the calculation realized
            in :meth:`computeFunction` is performed sequentially). 
-        parallel_store : None or bool
+           If `parallel` is `"threads"` or `"processes"`, trials are processed
+           concurrently by a pool of local threads or processes (see 
+           :meth:`compute_threads` and :meth:`compute_processes`) that does 
+           not require a running dask client. 
+        parallel_store : None or bool or "shards"
            Flag controlling saving mechanism. If `None`,
            ``parallel_store = parallel``, i.e., the compute-paradigm 
            dictates the employed writing method. Thus, in case of parallel
@@ -505,7 +648,11 @@ class ComputationalRoutine(ABC):
            is `False` and `parallel` is `True` the processing result is saved 
            sequentially using a mutex. If both `parallel` and `parallel_store`
            are `False` standard single-process HDF5 writing is employed for
-           saving the result of the (sequential) computation. 
+           saving the result of the (sequential) computation. If `parallel_store`
+           is `"shards"` (only relevant if `parallel` is `True`), results are 
+           written concurrently as well, but every worker appends all of its 
+           results to a single shard file (instead of creating one file per 
+           task), which drastically reduces the number of created files. 
         method : None or str
            If `None` the predefined methods :meth:`compute_parallel` or
            :meth:`compute_sequential` are used to control the actual computation
@@ -513,11 +660,12 @@ class ComputationalRoutine(ABC):
            `parallel` is `True` or `False`, respectively. If `method` is a 
            string, it has to specify the name of an alternative (provided) 
            class method that is invoked using `getattr`.
-        mem_thresh : float
+        mem_thresh : None or float
            Fraction of available memory required to perform computation. By
            default, the largest single trial result must not occupy more than
            50% (``mem_thresh = 0.5``) of available single-machine or worker
-           memory (if `parallel` is `False` or `True`, respectively).
+           memory (if `parallel` is `False` or `True`, respectively). If `None`, 
+           the value provided to :meth:`initialize` (if any) is used.
         log_dict : None or dict
            If `None`, the `log` properties of `out` is populated with the employed 
            keyword arguments used in :meth:`computeFunction`. 
@@ -531,6 +679,71 @@ class ComputationalRoutine(ABC):
            Note that enabling parallel debugging effectively runs the given computation 
            on the calling local machine thereby requiring sufficient memory and 
            CPU capacity. 
+        trials_per_task : None or int or "auto"
+           Number of (neighboring) trial-chunks to be processed by a single 
+           parallel task (only relevant if `parallel` is `True`). If `None` 
+           (default), every trial (or trial-channel block if `chan_per_worker` 
+           was provided in :meth:`initialize`) is processed by its own task 
+           unless trials are averaged (``keeptrials = False``), in which case
+           `"auto"` is used. If `trials_per_task` is a positive integer, chunks are grouped into 
+           batches of (at most) that size: each task reads its source data 
+           once, loops over its chunks and writes all of its results in one go. 
+           If `trials_per_task` is `"auto"`, the batch size is chosen such that
+           every worker receives at least a few tasks and the results of 
+           a single task do not occupy more than `mem_thresh` of worker memory. 
+        prefetch : None or int
+           Number of trials to read ahead in sequential computations (only 
+           relevant if `parallel` is `False`). If `None` or 0 (default), 
+           trials are read, processed and written strictly one after another. 
+           If `prefetch` is a positive integer, a background thread loads up 
+           to `prefetch` upcoming trials while the current trial is processed
+           and a second background thread writes results to disk. Thus, at 
+           most ``2 * prefetch`` source and result arrays are kept in memory. 
+        resume : bool
+           If `True`, parallel computations using VDS storage (`parallel_store`
+           is `True`) are checkpointed: completed tasks are recorded in a 
+           manifest inside a checkpoint directory (in `syncopy.__checkpoints__`)
+           that is uniquely associated to the processed data and the settings 
+           of the computation. If an interrupted computation is started again 
+           with ``resume = True``, only tasks that have not been completed 
+           before are processed. 
+        retries : int
+           Number of times failed parallel tasks are re-scheduled before the 
+           entire computation is aborted (only relevant if `parallel` is `True`). 
+        profile : bool
+           If `True`, the time spent reading source data, calling 
+           :meth:`computeFunction` and writing results as well as the number of 
+           bytes read, the peak resident set size of the executing process and
+           the name of the executing worker are recorded for every trial-chunk. 
+           A summary of all records is stored in ``out.cfg["profile"]`` (see
+           :func:`~syncopy.shared.profiling.summarize_profile`) and can be 
+           exported via :func:`~syncopy.shared.profiling.export_profile`. 
+        memory_resource : None or str
+           Name of a worker resource (see dask's `Worker Resources 
+           <https://distributed.dask.org/en/latest/resources.html>`_) encoding
+           worker memory in bytes, e.g., `"MEMORY"` (only relevant if `parallel` 
+           is `True`). If provided, every task requires the estimated memory 
+           footprint of its result from this resource so that large trials are 
+           only scheduled on workers offering enough memory. Note that tasks 
+           cannot be executed if no worker provides the given resource. 
+        fail_fast : bool
+           If `True`, all remaining tasks are cancelled as soon as a single
+           task failed (only relevant if `parallel` is `True`). Otherwise, 
+           failures are reported immediately but all other tasks are 
+           processed before the computation is aborted (so that their results 
+           can be re-used if `resume` is `True`). 
+        consolidate : bool
+           If `True`, results of parallel computations using VDS storage 
+           (`parallel_store` is `True` or `"shards"`) are copied into a single 
+           contiguous dataset once all tasks are done and all intermediate 
+           files are removed. This takes additional time but yields a regular 
+           HDF5 file that is faster to read. 
+        storage : None or dict
+           HDF5 chunking and compression settings of the output dataset (and 
+           all VDS source files), e.g., ``{"chunks": "trials", "compression": "lzf", 
+           "shuffle": True}``. If `None`, the package-wide defaults in 
+           ``syncopy.__storageopts__`` are used (see 
+           :func:`~syncopy.shared.parsers.storage_parser` for details). 
         
         Returns
         -------
@@ -555,6 +768,19 @@ class ComputationalRoutine(ABC):
         4. :meth:`write_log` stores employed input arguments in `out.cfg`
            and `out.log` to reproduce all relevant computational steps that 
            generated `out`. 
+
+        In parallel computations, tasks are submitted in order of decreasing
+        cost (estimated by the size of their results) and prioritized 
+        accordingly, so that long trials do not hold up the end of a 
+        computation (see :meth:`_order_tasks`). If invoked from within
+        :func:`compute_batch`, parallel computations are only queued (steps
+        2-4 are performed once the tasks of all queued objects are done).
+
+        If the result of a single trial exceeds `mem_thresh` of the available
+        (worker) memory, trials are split into overlapping blocks along the 
+        time axis (see :meth:`time_splitting`). If the employed 
+        :meth:`computeFunction` does not support this, a `NotImplementedError`
+        is raised. 
         
         See also
         --------
@@ -562,19 +788,51 @@ class ComputationalRoutine(ABC):
         preallocate_output : storage provisioning
         compute_parallel : concurrent computation using :meth:`computeFunction`
         compute_sequential : sequential computation using :meth:`computeFunction`
+        compute_threads : multi-threaded computation on the local machine
+        compute_processes : multi-process computation on the local machine
         process_metadata : management of meta-information
         write_log : log-entry organization
+        syncopy.shared.profiling.export_profile : export profiling results
         """
 
+        # Local thread/process pools do not need a dask client and write
+        # results from a single thread, i.e., they do not use VDS storage
+        if isinstance(parallel, str):
+            if parallel not in ["threads", "processes"]:
+                lgl = "bool or 'threads' or 'processes'"
+                raise SPYValueError(legal=lgl, varname="parallel", actual=parallel)
+            if method is None:
+                method = parallel
+            parallel = False
+        if mem_thresh is None:
+            mem_thresh = self.memThresh
+        self.memThresh = mem_thresh
+        self.profile = bool(profile)
+        self.profileRecords = {}
+        self.profileSummary = None
+
         # By default, use VDS storage for parallel computing
         if parallel_store is None:
             parallel_store = parallel
+        if isinstance(parallel_store, str):
+            if parallel_store != "shards":
+                lgl = "bool or 'shards'"
+                raise SPYValueError(legal=lgl, varname="parallel_store", actual=parallel_store)
+            if not parallel:
+                msg = "sharded storage only affects parallel computations and is ignored"
+                SPYWarning(msg)
+                parallel_store = False
             
         # Do not spill trials on disk if they're supposed to be removed anyway
         if parallel_store and not self.keeptrials:
             msg = "trial-averaging only supports sequential writing!"
             SPYWarning(msg)
             parallel_store = False
+        self.shardedStore = parallel_store == "shards"
+        self.storage = storage_parser(storage)
+        if not isinstance(consolidate, bool):
+            raise SPYTypeError(consolidate, varname="consolidate", expected="bool")
+        self.consolidate = consolidate and bool(parallel_store)
 
         # Concurrent processing requires some additional prep-work...
         if parallel:
@@ -591,27 +849,20 @@ class ComputationalRoutine(ABC):
                 raise SPYParallelError("No active workers found in distributed computing cluster",
                                        client=client)
 
-            # Note: `dask_jobqueue` may not be available even if `__dask__` is `True`,
-            # hence the `__name__` shenanigans instead of a simple `isinstance`
-            if isinstance(client.cluster, dd.LocalCluster):
-                memAttr = "memory_limit"
-            elif client.cluster.__class__.__name__ == "SLURMCluster":
-                memAttr = "worker_memory"
-            else:
+            # Check if trials actually fit into memory before we start computation
+            # (split oversized trials into time-blocks if possible)
+            wrk_size = _worker_memory(client)
+            if wrk_size is None:
                 msg = "`ComputationalRoutine` only supports `LocalCluster` and " +\
                     "`SLURMCluster` dask cluster objects. Proceed with caution. "
                 SPYWarning(msg)
-                memAttr = None
-
-            # Check if trials actually fit into memory before we start computation
-            if memAttr:
-                wrk_size = max(getattr(wrkr, memAttr) for wrkr in client.cluster.workers.values())
-                if self.chunkMem >= mem_thresh * wrk_size:
-                    self.chunkMem /= 1024**3
-                    wrk_size /= 1000**3
-                    msg = "Single-trial result sizes ({0:2.2f} GB) larger than available " +\
-                        "worker memory ({1:2.2f} GB) currently not supported"
-                    raise NotImplementedError(msg.format(self.chunkMem, wrk_size))
+            elif self.chunkMem > self._memory_budget(mem_thresh, wrk_size) and \
+                not self._split_chunks(data, self._memory_budget(mem_thresh, wrk_size)):
+                self.chunkMem /= 1024**3
+                wrk_size /= 1000**3
+                msg = "Single-trial result sizes ({0:2.2f} GB) larger than available " +\
+                    "worker memory ({1:2.2f} GB) currently not supported"
+                raise NotImplementedError(msg.format(self.chunkMem, wrk_size))
 
             # In some cases distributed dask workers suffer from spontaneous
             # dementia and forget the `sys.path` of their parent process. Fun!
@@ -624,15 +875,73 @@ class ComputationalRoutine(ABC):
             # Store provided debugging state
             self.parallelDebug = parallel_debug
 
+            # Group neighboring chunks into tasks (if wanted); if trials are
+            # averaged, have every task sum up several chunks to keep the number
+            # of in-memory partial sums small
+            if trials_per_task is None and not self.keeptrials:
+                trials_per_task = "auto"
+            if trials_per_task is not None:
+                self.taskLayout = self._batch_chunks(trials_per_task,
+                                                     len(client.cluster.workers),
+                                                     wrk_size, mem_thresh)
+
+            # Submit expensive tasks first (to not leave workers idling at the end)
+            self._order_tasks()
+            self.memoryResource = memory_resource
+
+            # Store no. of permitted re-tries of failed tasks
+            scalar_parser(retries, varname="retries", ntype="int_like", lims=[0, np.inf])
+            self.retries = int(retries)
+            if not isinstance(fail_fast, bool):
+                raise SPYTypeError(fail_fast, varname="fail_fast", expected="bool")
+            self.failFast = fail_fast
+
+            # Resumable computations write into a directory that is unique to the
+            # performed computation (not the current session)
+            self.checkpointDir = None
+            if resume:
+                if self.shardedStore:
+                    msg = "resuming interrupted computations requires one file per " +\
+                        "task (`parallel_store = True`) and is not supported for sharded storage"
+                    SPYWarning(msg)
+                elif parallel_store:
+                    self.checkpointDir = os.path.join(spy.__checkpoints__, 
+                                                      self._cache_key(data))
+                else:
+                    msg = "resuming interrupted computations requires VDS storage " +\
+                        "(`parallel_store = True`) and is not supported for trial-averaging"
+                    SPYWarning(msg)
+
         # For sequential processing, just ensure enough memory is available
         else:
             mem_size = psutil.virtual_memory().available
-            if self.chunkMem >= mem_thresh * mem_size:
+            if self.chunkMem > self._memory_budget(mem_thresh, mem_size) and \
+                not self._split_chunks(data, self._memory_budget(mem_thresh, mem_size)):
                 self.chunkMem /= 1024**3
                 mem_size /= 1024**3
                 msg = "Single-trial result sizes ({0:2.2f} GB) larger than available " +\
                       "memory ({1:2.2f} GB) currently not supported"
                 raise NotImplementedError(msg.format(self.chunkMem, mem_size))
+            if trials_per_task is not None:
+                msg = "`trials_per_task` only affects parallel computations and is ignored"
+                SPYWarning(msg)
+            if resume or retries:
+                msg = "`resume` and `retries` only affect parallel computations and are ignored"
+                SPYWarning(msg)
+            self.checkpointDir = None
+
+            # Ensure read-ahead buffers fit into memory as well
+            self.prefetchDepth = 0
+            if prefetch is not None:
+                scalar_parser(prefetch, varname="prefetch", ntype="int_like",
+                              lims=[0, np.inf])
+                self.prefetchDepth = int(prefetch)
+                maxDepth = int(mem_thresh * mem_size // max(1, 2 * self.chunkMem))
+                if self.prefetchDepth > maxDepth:
+                    msg = "Reducing `prefetch` from {0:d} to {1:d} to fit buffered trials " +\
+                        "into available memory"
+                    SPYWarning(msg.format(self.prefetchDepth, maxDepth))
+                    self.prefetchDepth = maxDepth
 
         # Create HDF5 dataset of appropriate dimension
         self.preallocate_output(out, parallel_store=parallel_store)
@@ -646,19 +955,58 @@ class ComputationalRoutine(ABC):
         else:
             computeMethod = getattr(self, "compute_" + method, None)
 
-        # Ensure `data` is openend read-only to permit (potentially concurrent) 
+        # Take care of `VirtualData` objects
+        self.hdr = getattr(data, "hdr", None)
+
+        # Inside `compute_batch`, parallel computations are only queued: their
+        # tasks are submitted together with the tasks of all other queued objects
+        if _batchQueue is not None and parallel and method is None and not parallel_debug:
+            _batchQueue.append((self, data, out, log_dict, data._selection))
+            return
+
+        # Ensure `data` is openend read-only to permit (potentially concurrent)
         # reading access to backing device on disk
         data.mode = "r"
-        
-        # Take care of `VirtualData` objects 
-        self.hdr = getattr(data, "hdr", None)
-            
-        # Perform actual computation
-        computeMethod(data, out)
 
-        # Reset data access mode
-        data.mode = self.dataMode
-        
+        # Perform actual computation (reset data access mode even if it fails,
+        # so that input objects remain unchanged, e.g., for resuming computations)
+        tic = time.perf_counter()
+        try:
+            computeMethod(data, out)
+        finally:
+            self._release_handles(parallel)
+            data.mode = self.dataMode
+        self.finalize(data, out, log_dict, time.perf_counter() - tic)
+
+    def finalize(self, data, out, log_dict=None, wallTime=0.0):
+        """
+        Attach results of a completed computation to `out`
+
+        Parameters
+        ----------
+        data : syncopy data object
+           Syncopy data object that has been processed
+        out : syncopy data object
+           Object holding results (backing HDF5 file has been populated)
+        log_dict : None or dict
+           Log entries of computation (see :meth:`compute`)
+        wallTime : float
+           Wall-clock duration (in seconds) of the computation (only used for
+           profiling)
+
+        Returns
+        -------
+        Nothing : None
+
+        See also
+        --------
+        compute : management routine invoking this method
+        """
+
+        if self.profile:
+            self.profileSummary = summarize_profile(list(self.profileRecords.values()),
+                                                    wallTime)
+
         # Attach computed results to output object
         out.data = h5py.File(out.filename, mode="r+")[self.datasetName]
 
@@ -666,6 +1014,209 @@ class ComputationalRoutine(ABC):
         self.process_metadata(data, out)
         self.write_log(data, out, log_dict)
 
+        # If requested, keep a copy of the result for later re-use
+        if self.cacheKey is not None:
+            self.store_cached(out)
+
+    def _release_handles(self, parallel):
+        """
+        Local helper closing source files kept open by the handle pools of 
+        all workers (and the calling process) once a computation is done
+        (see :mod:`syncopy.shared.handle_pool`)
+        """
+        if parallel:
+            try:
+                dd.get_client().run(release_handles)
+            except Exception as exc:
+                msg = "Could not close source files on parallel workers: {}"
+                SPYWarning(msg.format(str(exc)))
+        release_handles()
+
+    def fetch_cached(self, data, out, keeptrials=True, log_dict=None):
+        """
+        Attach previously computed result from cache
+
+        Parameters
+        ----------
+        data : syncopy data object
+           Syncopy data object to be processed
+        out : syncopy data object
+           Empty object for holding results
+        keeptrials : bool
+           Flag indicating whether to return individual trials or average
+        log_dict : None or dict
+           Log entries to be written to `out` (see :meth:`write_log`)
+
+        Returns
+        -------
+        hit : bool
+           `True` if the result was found in the cache and attached to `out`, 
+           `False` otherwise. 
+
+        Notes
+        -----
+        Calling this method enables result caching: results are looked up 
+        in Syncopy's cache folder (`syncopy.__cache__`) using a key 
+        derived from the checksum of the backing file(s) of `data`, the active
+        selection of `data`, the class of this routine and all (positional and 
+        keyword) arguments of :meth:`computeFunction`. If the result is 
+        found, it is copied to `out` and neither :meth:`initialize` nor 
+        :meth:`compute` need to be called. Otherwise, the result of the 
+        subsequent call of :meth:`compute` is added to the cache. If the cache
+        exceeds `syncopy.__cachelimit__` GB, least recently used results are 
+        removed. Stale entries are also removed by :func:`syncopy.cleanup`. 
+
+        See also
+        --------
+        compute : management routine invoking parallel/sequential compute kernels
+        store_cached : add result to cache
+        """
+
+        self.keeptrials = keeptrials
+        self.cacheKey = self._cache_key(data)
+        cacheFile = os.path.join(spy.__cache__, self.cacheKey + ".h5")
+        try:
+            h5cache = h5py.File(cacheFile, mode="r")
+        except OSError:
+            return False
+
+        # Mark entry as recently used (for LRU eviction) and copy result to `out`
+        with h5cache:
+            os.utime(cacheFile)
+            self.datasetName = h5cache.attrs["datasetName"]
+            with h5py.File(out.filename, mode="w") as h5f:
+                h5cache.copy(h5cache[self.datasetName], h5f, name=self.datasetName)
+            trl = h5cache["trialdefinition"][()]
+            metadata = json.loads(h5cache.attrs["metadata"])
+
+        # Restore meta-data and write log
+        out.data = h5py.File(out.filename, mode="r+")[self.datasetName]
+        out.trialdefinition = trl
+        for prop, value in metadata.items():
+            if isinstance(value, list):
+                value = np.array(value)
+            setattr(out, prop, value)
+        self.write_log(data, out, log_dict)
+        out.log = "fetched result from cache " + cacheFile
+        return True
+
+    def store_cached(self, out):
+        """
+        Add result to cache
+
+        Parameters
+        ----------
+        out : syncopy data object
+           Syncopy data object holding calculation results
+
+        Returns
+        -------
+        Nothing : None
+
+        Notes
+        -----
+        The result dataset, trial definition and meta-data of `out` are copied 
+        to a single HDF5 file in `syncopy.__cache__` named after `self.cacheKey`
+        (see :meth:`fetch_cached`). Virtual datasets are consolidated block by 
+        block. 
+
+        See also
+        --------
+        fetch_cached : attach previously computed result from cache
+        """
+
+        # Collect meta-data set by `process_metadata` (JSON-serializable)
+        metadata = {}
+        skipProps = ["dimord", "_version", "_log", "cfg", "_hdr"]
+        for prop in [prop for prop in out._infoFileProperties if prop not in skipProps]:
+            value = getattr(out, prop)
+            if isinstance(value, np.ndarray):
+                value = value.tolist()
+            elif isinstance(value, np.generic):
+                value = value.item()
+            metadata[prop] = value
+
+        # Write to temporary file first to not expose incomplete entries
+        os.makedirs(spy.__cache__, exist_ok=True)
+        cacheFile = os.path.join(spy.__cache__, self.cacheKey + ".h5")
+        tmpFile = cacheFile + ".{}".format(os.getpid())
+        with h5py.File(tmpFile, mode="w") as h5cache:
+            if out.data.is_virtual:
+                dset = h5cache.create_dataset(self.datasetName, shape=out.data.shape, 
+                                              dtype=out.data.dtype,
+                                              **storage_kwargs(self.storage, out.data.shape,
+                                                               out.data.dtype,
+                                                               self._block_shape()))
+                nRows = max(1, int(self._cacheBlockSize // max(1, out.data[0].nbytes)))
+                for row in range(0, out.data.shape[0], nRows):
+                    dset[row : row + nRows] = out.data[row : row + nRows]
+            else:
+                out.data.file.copy(out.data, h5cache, name=self.datasetName)
+            h5cache.create_dataset("trialdefinition", data=np.array(out.trialdefinition))
+            h5cache.attrs["datasetName"] = self.datasetName
+            h5cache.attrs["metadata"] = json.dumps(metadata)
+        os.replace(tmpFile, cacheFile)
+
+        # Keep cache size bounded
+        spy.io.utils._evict_cache(limit=spy.__cachelimit__)
+
+    def _cache_key(self, data):
+        """
+        Compute hex-digest identifying the calculation performed on `data`
+        (see :meth:`fetch_cached`)
+
+        Notes
+        -----
+        The digest is computed only once per input object (and selection) and 
+        stored in `self.computationKey`. Positional arguments are hashed as 
+        provided by the user (`self.inputArgv`) and objects occurring several 
+        times (e.g., in by-trial lists) are hashed only once. The checksum 
+        stored alongside saved Syncopy containers is re-used if the container 
+        has not been modified since (see :func:`_file_checksum`). 
+        """
+
+        keyedInput = (data, data._selection, self.keeptrials)
+        if self.computationKey is not None and self.keyedInput is not None and \
+            all(new is old for new, old in zip(keyedInput, self.keyedInput)):
+            return self.computationKey
+
+        hsh = spy.__checksum_algorithm__()
+        fileNames = data._filename
+        if not isinstance(fileNames, list):
+            fileNames = [fileNames]
+        for fname in fileNames:
+            hsh.update(_file_checksum(fname).encode())
+        if data._selection is not None:
+            sel = data._selection
+            _update_digest(hsh, [sel.trials] + [getattr(sel, prop) for prop in sel._allProps])
+        else:
+            _update_digest(hsh, None)
+        _update_digest(hsh, [spy.__version__,
+                             self.__class__.__module__ + "." + self.__class__.__qualname__,
+                             self.keeptrials,
+                             {key: value for key, value in self.cfg.items()
+                              if key not in ["noCompute", "chunkShape"]}])
+
+        # Hash every distinct argument only once
+        argDigests = {}
+        def _arg_digest(arg):
+            if id(arg) not in argDigests:
+                argHsh = spy.__checksum_algorithm__()
+                _update_digest(argHsh, arg)
+                argDigests[id(arg)] = argHsh.digest()
+            return argDigests[id(arg)]
+        for arg in self.inputArgv:
+            if isinstance(arg, (list, tuple)):
+                hsh.update("{0:s}{1:d}".format(type(arg).__name__, len(arg)).encode())
+                for item in arg:
+                    hsh.update(_arg_digest(item))
+            else:
+                hsh.update(_arg_digest(arg))
+
+        self.computationKey = hsh.hexdigest()
+        self.keyedInput = keyedInput
+        return self.computationKey
+
     def preallocate_output(self, out, parallel_store=False):
         """
         Storage allocation and provisioning
@@ -674,13 +1225,20 @@ class ComputationalRoutine(ABC):
         ----------
         out : syncopy data object
            Empty object for holding results
-        parallel_store : bool
-           If `True`, a directory for virtual source files is created 
+        parallel_store : bool or "shards"
+           If `True` (or `"shards"`), a directory for virtual source files is created 
            in Syncopy's temporary on-disk storage (defined by `syncopy.__storage__`). 
            Otherwise, a dataset of appropriate type and shape is allocated 
            in a new regular HDF5 file created inside Syncopy's temporary 
            storage folder. 
 
+        Notes
+        -----
+        If sharded storage was requested (`self.shardedStore`), the virtual 
+        layout is not known in advance (tasks are distributed dynamically across 
+        workers) and is only constructed once all tasks are done (see 
+        :meth:`_shard_layout`). 
+
         Returns
         -------
         Nothing : None
@@ -695,15 +1253,31 @@ class ComputationalRoutine(ABC):
 
         # In case parallel writing via VDS storage is requested, prepare
         # directory for by-chunk HDF5 files and construct virutal HDF layout
+        # (resumable computations write to `self.checkpointDir` first which 
+        # is renamed to `self.virtualDatasetDir` once all tasks are completed)
         if parallel_store:
             vdsdir = os.path.splitext(os.path.basename(out.filename))[0]
             self.virtualDatasetDir = os.path.join(__storage__, vdsdir)
-            os.mkdir(self.virtualDatasetDir)
+            self.completedTasks = []
+            if self.checkpointDir is not None:
+                os.makedirs(self.checkpointDir, exist_ok=True)
+                self.completedTasks = self._read_manifest()
+            else:
+                os.mkdir(self.virtualDatasetDir)
             
+            if self.shardedStore:
+                self.VirtualDatasetLayout = None
+                return
+
+            # Every task writes a single file: un-batched tasks store their result
+            # in dataset "chk", batched tasks use one dataset "chk<j>" per chunk
             layout = h5py.VirtualLayout(shape=self.outputShape, dtype=self.dtype)
-            for k, idx in enumerate(self.targetLayout):
-                fname = os.path.join(self.virtualDatasetDir, "{0:d}.h5".format(k))
-                layout[idx] = h5py.VirtualSource(fname, "chk", shape=self.targetShapes[k])
+            for tk, task in enumerate(self.taskLayout):
+                fname = os.path.join(self.virtualDatasetDir, "{0:d}.h5".format(tk))
+                for j, chk in enumerate(task):
+                    dsetname = "chk" if len(task) == 1 else "chk{0:d}".format(j)
+                    layout[self.targetLayout[chk]] = h5py.VirtualSource(fname, dsetname,
+                                                                        shape=self.targetShapes[chk])
             self.VirtualDatasetLayout = layout
 
         # Create regular HDF5 dataset for sequential writing
@@ -715,8 +1289,9 @@ class ComputationalRoutine(ABC):
             else:
                 shp = self.outputShape
             with h5py.File(out.filename, mode="w") as h5f:
-                h5f.create_dataset(name=self.datasetName,
-                                   dtype=self.dtype, shape=shp)
+                h5f.create_dataset(name=self.datasetName, dtype=self.dtype, shape=shp,
+                                   **storage_kwargs(self.storage, shp, self.dtype,
+                                                    self._block_shape()))
 
     def compute_parallel(self, data, out):
         """
@@ -743,140 +1318,184 @@ class ComputationalRoutine(ABC):
         builds an entire parallel instruction tree and only kicks off execution 
         on the cluster at the very end of the calculation command assembly. 
 
+        If trial-averaging was requested, results are not written by the workers. 
+        Instead, every task returns a NaN-aware in-memory sum of its chunks 
+        (see :func:`~syncopy.shared.tools.nan_partial_sum`) and all partial 
+        sums are combined in a tree reduction (with fan-in `self.reduceSplitEvery`) 
+        on the cluster. Only the final mean is written to disk. 
+
         See also
         --------
         compute : management routine invoking parallel/sequential compute kernels
         compute_sequential : serial processing counterpart of this method
         """
         
-        # Prepare to write chunks concurrently
-        if self.virtualDatasetDir is not None:
-            outfilename = os.path.join(self.virtualDatasetDir, "{0:d}.h5")
-            outdsetname = "chk"
+        results = self._parallel_graph(data, out)
+
+        # Let the fun begin... (unless all tasks have been completed by a previous run)
+        if self.pendingTasks and not self.parallelDebug:
+            client = dd.get_client()
+            results = client.persist(results, retries=self.retries, optimize_graph=False,
+                                     priority=self.keyPriorities,
+                                     resources=self.keyResources or None)
+            self.futures = dd.client.futures_of(results)
+            _await_futures([self], client)
+
+        # If debugging is requested, drop existing client and enforce use of
+        # single-threaded scheduler
+        elif self.pendingTasks:
+            results = results.persist(scheduler="single-threaded")
+
+        self._parallel_output(out, results)
+
+    def _parallel_graph(self, data, out):
+        """
+        Local helper assembling the (not yet executed) dask graph of all
+        pending parallel tasks (see :meth:`compute_parallel`). Sets
+        `self.pendingTasks` and returns a dask bag holding one partition
+        (the result of one task) per pending task.
+        """
 
-        # Write chunks sequentially            
+        # Prepare to write chunks concurrently (dataset names match the ones
+        # used in the virtual layout created by `preallocate_output`)
+        nTasks = len(self.taskLayout)
+        if self.virtualDatasetDir is not None:
+            outdir = self.virtualDatasetDir
+            if self.checkpointDir is not None:
+                outdir = self.checkpointDir
+            outfilenames = [os.path.join(outdir, "{0:d}.h5".format(tk))
+                            for tk in range(nTasks)]
+            outdsetnames = [["chk"] if len(task) == 1 else
+                            ["chk{0:d}".format(j) for j in range(len(task))]
+                            for task in self.taskLayout]
+
+            # Shards hold the results of many tasks: use global chunk indices
+            if self.shardedStore:
+                outfilenames = [None] * nTasks
+                outdsetnames = [["chk{0:d}".format(chk) for chk in task]
+                                for task in self.taskLayout]
+
+        # Write chunks sequentially
         else:
-            outfilename = out.filename
-            outdsetname = self.datasetName
-            
-        # Construct a dask bag with all necessary components for parallelization
+            outfilenames = [out.filename] * nTasks
+            outdsetnames = [[self.datasetName] * len(task) for task in self.taskLayout]
+
+        # Only (re-)schedule tasks that have not been completed by a previous run
+        self.pendingTasks = [tk for tk in range(nTasks) if tk not in self.completedTasks]
+        pendingTasks = self.pendingTasks
+        nPending = max(1, len(pendingTasks))
+
+        # Construct a dask bag with all necessary components for parallelization:
+        # every bag element represents a task that processes one or more chunks
         mainBag = db.from_sequence([{"hdr": self.hdr,
-                                     "keeptrials": self.keeptrials, 
+                                     "keeptrials": self.keeptrials,
+                                     "profile": self.profile,
+                                     "chunks": task,
+                                     "shared": self.sharedArgs,
                                      "infile": data.filename,
                                      "indset": data.data.name,
-                                     "ingrid": self.sourceLayout[chk],
-                                     "sigrid": self.sourceSelectors[chk],
+                                     "ingrid": [self.sourceLayout[chk] for chk in task],
+                                     "sigrid": [self.sourceSelectors[chk] for chk in task],
                                      "fancy": self.useFancyIdx,
                                      "vdsdir": self.virtualDatasetDir,
-                                     "outfile": outfilename.format(chk),
-                                     "outdset": outdsetname,
-                                     "outgrid": self.targetLayout[chk],
-                                     "outshape": self.targetShapes[chk],
+                                     "sharded": self.shardedStore,
+                                     "storage": self.storage,
+                                     "outfile": outfilenames[tk],
+                                     "outdset": outdsetnames[tk],
+                                     "outgrid": [self.targetLayout[chk] for chk in task],
+                                     "outshape": [self.targetShapes[chk] for chk in task],
+                                     "outcrop": [self.targetCrops[chk] for chk in task],
                                      "dtype": self.dtype}
-                                     for chk in range(len(self.sourceLayout))],
-                                   npartitions=len(self.sourceLayout)) 
+                                     for tk, task in enumerate(self.taskLayout)
+                                     if tk in pendingTasks],
+                                   npartitions=nPending)
 
         # Convert by-worker argv-list to dask bags to distribute across cluster
         # Format: ``ArgV = [(3, 0, 'a'), (3, 0, 'a'), (3, 1, 'b'), (3, 1, 'b')]``
         # then ``list(zip(*ArgV)) = [(3, 3, 3, 3), (0, 0, 1, 1), ('a', 'a', 'b', 'b')]``
-        bags = []        
-        for arg in zip(*self.ArgV):
-            bags.append(db.from_sequence(arg))
-            
+        # Arguments are grouped by task, i.e., for ``taskLayout = [[0, 1], [2, 3]]``
+        # the first bag is ``[(3, 3), (3, 3)]``. Arguments that are identical 
+        # for all trials (here: 3) are not put into bags: they are scattered 
+        # across the cluster once and every task only references them (wrap 
+        # arguments in a list, so that containers like dicts are scattered as a 
+        # whole instead of being turned into collections of futures)
+        bags = []
+        for ak, arg in enumerate(zip(*self.ArgV)):
+            if ak in self.sharedArgs:
+                if self.parallelDebug:
+                    bags.append(arg[0])
+                else:
+                    bags.append(dd.get_client().scatter([arg[0]], broadcast=True, hash=True)[0])
+                continue
+            bags.append(db.from_sequence([tuple(arg[chk] for chk in self.taskLayout[tk])
+                                          for tk in pendingTasks],
+                                         npartitions=nPending))
+
         # Map all components (channel-trial-blocks) onto `computeFunction`
+        # (if profiling was requested, every task returns its profiling records 
+        # alongside its actual result)
         results = mainBag.map(self.computeFunction, *bags, **self.cfg)
-        
-        # Let the fun begin... 
-        if not self.parallelDebug:
-            
-            # Make sure that all futures are executed (i.e., data is actually written)
-            # Note 1: `dd.progress` does not correctly track worker progress hence 
-            #         the custom-tailored `while` formulation: that periodically 
-            #         checks in on the status of all allocated futures
-            #         -> Do not use this `dd.progress(futures, notebook=False)`
-            # Note 2: the while loop below does not run indefinitely - erring or 
-            #         stalling futures get status 'error' or 'waiting'. After 
-            #         some time the status of all futures is one of 'finished', 
-            #         'error' or 'waiting', but none is 'pending' any more.  
-            futures = dd.client.futures_of(results.persist())
-            totalTasks = len(futures)
-            pbar = tqdm(total=totalTasks, bar_format=self.tqdmFormat)
-            cnt = 0
-            while any(f.status == "pending" for f in futures):
-                time.sleep(self.sleepTime)
-                new = max(0, sum([f.status == "finished" for f in futures]) - cnt)
-                cnt += new
-                pbar.update(new)
-            pbar.close()
-            
-            # Avoid race condition: give futures time to perform switch from 'pending' 
-            # to 'finished' so that `finishedTasks` is computed correctly
-            time.sleep(self.sleepTime)
-
-            # If number of 'finished' tasks is less than expected, go into 
-            # problem analysis mode: all futures that erred hav an `.exception`
-            # method which can be used to track down the worker it was executed by
-            # Once we know the worker, we can point to the right log file. If 
-            # futures were cancelled (by the user or the SLURM controller), 
-            # `.exception` is `None` and we can't relialby track down the 
-            # respective executing worker
-            finishedTasks = sum([f.status == "finished" for f in futures])
-            if finishedTasks < totalTasks:
-                client = dd.get_client()
-                schedulerLog = list(client.cluster.get_logs(cluster=False, scheduler=True, workers=False).values())[0]
-                erredFutures = [f for f in futures if f.status == "error"]
-                msg = "Parallel computation failed: {}/{} tasks failed or stalled.\n"
-                msg = msg.format(totalTasks - finishedTasks, totalTasks)
-                msg += "Concurrent computing scheduler log below: \n\n"
-                msg += schedulerLog + "\n"
-                
-                # If we're working w/`SLURMCluster`, perform the Herculean task of 
-                # tracking down which dask worker was executed by which SLURM job...
-                if client.cluster.__class__.__name__ == "SLURMCluster":
-                    try:
-                        erredJobs = [f.exception().last_worker.identity()["id"] for f in erredFutures]
-                    except AttributeError:
-                        erredJobs = []
-                    erredJobs = list(set(erredJobs))
-                    erredJobIDs = [client.cluster.workers[job].job_id for job in erredJobs]
-                    slurmFiles = client.cluster.job_header.split("--output=")[1].replace("%j", "{}")
-                    slurmOutDir = os.path.split(slurmFiles)[0]
-                    errFiles = glob(slurmOutDir + os.sep + "*.err")
-                    if len(erredFutures) or len(errFiles):
-                        msg += "Please consult the following SLURM log files for details:\n"
-                        msg += "".join(slurmFiles.format(id) + "\n" for id in erredJobIDs)
-                        msg += "".join(errfile + "\n" for errfile in errFiles)
-                    else:
-                        msg += "Please check SLURM logs in {}".format(slurmOutDir)
-                
-                # In case of a `LocalCluster`, syphon worker logs
-                else:
-                    msg += "\nParallel worker logs below: \n"
-                    workerLogs = client.cluster.get_logs(cluster=False, scheduler=False, workers=True).values()
-                    for wLog in workerLogs:
-                        if "Failed" in wLog:
-                            msg += wLog
-                    
-                raise SPYParallelError(msg, client=client)
 
-        # If debugging is requested, drop existing client and enforce use of
-        # single-threaded scheduler
-        else:
-            results.compute(scheduler="single-threaded")
+        # The i-th partition holds the i-th pending task: prioritize tasks in their 
+        # (cost-sorted) order (unless priorities were assigned by `compute_batch`) 
+        # and, if wanted, request their memory footprint as worker resource; 
+        # the scheduler expects plain (stringified) keys
+        priorities = self.taskPriority
+        if priorities is None:
+            priorities = [nPending - pos for pos in range(len(pendingTasks))]
+        keys = [str((results.name, pos)) for pos in range(len(pendingTasks))]
+        self.keyPriorities = dict(zip(keys, priorities))
+        self.keyResources = {}
+        if self.memoryResource is not None:
+            self.keyResources = {key: {self.memoryResource: self.taskMem[tk]}
+                                 for key, tk in zip(keys, pendingTasks)}
+
+        return results
+
+    def _parallel_output(self, out, results):
+        """
+        Local helper assembling the result of a completed parallel computation
+        in `out` (see :meth:`compute_parallel`): collects profiling records,
+        creates the virtual dataset of concurrently written results and
+        computes trial-averages, respectively.
+        """
+
+        # Collect profiling records of all tasks (and discard them from `results`)
+        if self.profile and self.pendingTasks:
+            scheduler = "single-threaded" if self.parallelDebug else None
+            for records in results.pluck(1).compute(scheduler=scheduler):
+                for rec in records:
+                    self._record_chunk(**rec)
+            results = results.pluck(0)
             
         # When writing concurrently, now's the time to finally create the virtual dataset
+        # (move results of resumable computations to their final destination first)
         if self.virtualDatasetDir is not None:
+            if self.checkpointDir is not None:
+                manifest = os.path.join(self.checkpointDir, self._manifestName)
+                if os.path.isfile(manifest):
+                    os.unlink(manifest)
+                os.rename(self.checkpointDir, self.virtualDatasetDir)
+            if self.shardedStore:
+                self.VirtualDatasetLayout = self._shard_layout()
             with h5py.File(out.filename, mode="w") as h5f:
                 h5f.create_virtual_dataset(self.datasetName, self.VirtualDatasetLayout)
+            if self.consolidate:
+                self._consolidate_output(out)
                 
-        # If trial-averaging was requested, normalize computed sum to get mean
+        # If trial-averaging was requested, tasks returned in-memory partial sums:
+        # combine them in a tree reduction on the cluster and only write the mean
         if not self.keeptrials:
+            reduction = results.reduction(combine_partial_sums, combine_partial_sums,
+                                          split_every=self.reduceSplitEvery)
+            if self.parallelDebug:
+                trialSum = reduction.compute(scheduler="single-threaded")
+            else:
+                trialSum = reduction.compute()
             with h5py.File(out.filename, mode="r+") as h5f:
-                h5f[self.datasetName][()] /= len(self.trialList)
+                h5f[self.datasetName][()] = partial_mean(trialSum)
                 h5f.flush()
-        
-        return 
-        
+
     def compute_sequential(self, data, out):
         """
         Sequential computing kernel
@@ -901,6 +1520,13 @@ class ComputationalRoutine(ABC):
         is immediately stored on disk, propagation of arrays across routines
         is avoided and memory usage is kept to a minimum. 
 
+        If `self.prefetchDepth` is positive (set via the `prefetch` keyword of
+        :meth:`compute`), reading, computing and writing are pipelined: a 
+        background thread reads up to `self.prefetchDepth` upcoming trials 
+        while the current trial is processed and another background thread 
+        writes finished results. Both threads communicate with the calling 
+        thread via bounded queues, i.e., memory usage remains bounded. 
+
         See also
         --------
         compute : management routine invoking parallel/sequential compute kernels
@@ -908,6 +1534,8 @@ class ComputationalRoutine(ABC):
         """
         
         # Initialize on-disk backing device (either HDF5 file or memmap)
+        sourceObj = None
+        isHDF = False
         if self.hdr is None:
             try:
                 sourceObj = h5py.File(data.filename, mode="r")[data.data.name]
@@ -919,62 +1547,21 @@ class ComputationalRoutine(ABC):
                 raise exc
             
         # Iterate over (selected) trials and write directly to target HDF5 dataset
-        fmt = "{desc}: {percentage:3.0f}% |{bar}| {n_fmt}/{total_fmt} [{elapsed}<{remaining}]"
         with h5py.File(out.filename, "r+") as h5fout:
             target = h5fout[self.datasetName]
 
-            for nblock in tqdm(range(len(self.trialList)), bar_format=self.tqdmFormat):
-
-                # Extract respective indexing tuples from constructed lists                
-                ingrid = self.sourceLayout[nblock]
-                sigrid = self.sourceSelectors[nblock]
-                outgrid = self.targetLayout[nblock]
-                argv = self.ArgV[nblock]
-                
-                # Catch empty source-array selections; this workaround is not 
-                # necessary for h5py version 2.10+ (see https://github.com/h5py/h5py/pull/1174)
-                if any([not sel for sel in ingrid]):
-                    res = np.empty(self.targetShapes[nblock], dtype=self.dtype)
-                else:
-                    # Get source data as NumPy array
-                    if self.hdr is None:
-                        if isHDF:
-                            if self.useFancyIdx:
-                                arr = np.array(sourceObj[tuple(ingrid)])[np.ix_(*sigrid)]
-                            else:
-                                arr = np.array(sourceObj[tuple(ingrid)])
-                        else:
-                            if self.useFancyIdx:
-                                arr = sourceObj[np.ix_(*ingrid)]
-                            else:
-                                arr = np.array(sourceObj[ingrid])
-                        sourceObj.flush()
-                    else:
-                        idx = ingrid
-                        if self.useFancyIdx:
-                            idx = np.ix_(*ingrid)
-                        stacks = []
-                        for fk, fname in enumerate(data.filename):
-                            stacks.append(np.memmap(fname, offset=int(self.hdr[fk]["length"]),
-                                                    mode="r", dtype=self.hdr[fk]["dtype"],
-                                                    shape=(self.hdr[fk]["M"], self.hdr[fk]["N"]))[idx])
-                        arr = np.vstack(stacks)[ingrid]
-
-                    # Perform computation
-                    res = self.computeFunction(arr, *argv, **self.cfg)
-                    
-                # Either write result to `outgrid` location in `target` or add it up
-                if self.keeptrials:
-                    target[outgrid] = res
-                else:
-                    target[()] = np.nansum([target, res], axis=0)
-                
-                # Flush every iteration to avoid memory leakage
-                h5fout.flush()
+            if self.prefetchDepth > 0:
+                trialSum = self._pipeline_sequential(data, sourceObj, isHDF, h5fout, target)
+            else:
+                trialSum = None
+                for nblock in tqdm(range(len(self.sourceLayout)), bar_format=self.tqdmFormat):
+                    arr = self._read_source(data, sourceObj, isHDF, nblock)
+                    res = self._compute_block(arr, nblock)
+                    trialSum = self._write_block(h5fout, target, res, nblock, trialSum)
 
-            # If trial-averaging was requested, normalize computed sum to get mean
+            # If trial-averaging was requested, write (NaN-aware) mean of in-memory sum
             if not self.keeptrials:
-                target[()] /= len(self.trialList)
+                target[()] = partial_mean(trialSum)
 
         # If source was HDF5 file, close it to prevent access errors
         if isHDF:
@@ -982,26 +1569,393 @@ class ComputationalRoutine(ABC):
             
         return
 
-    def write_log(self, data, out, log_dict=None):
+    def _read_source(self, data, sourceObj, isHDF, nblock):
         """
-        Processing of output log
+        Local helper for reading a single trial-chunk in sequential computations
 
         Parameters
         ----------
         data : syncopy data object
-           Syncopy data object that has been processed
-        out : syncopy data object
-           Syncopy data object holding calculation results
-        log_dict : None or dict
-           If `None`, the `log` properties of `out` is populated with the employed 
-           keyword arguments used in :meth:`computeFunction`. 
-           Otherwise, `out`'s `log` properties are filled  with items taken 
-           from `log_dict`. 
-        
+           Syncopy data object to be processed
+        sourceObj : None or HDF5 dataset or memmap
+           Opened backing device of `data` (`None` for `VirtualData` objects)
+        isHDF : bool
+           If `True`, `sourceObj` is a HDF5 dataset
+        nblock : int
+           Index of chunk in `self.sourceLayout`
+
         Returns
         -------
-        Nothing : None
- 
+        arr : None or :class:`numpy.ndarray`
+           Source data of chunk; `None` if the chunk selection is empty
+
+        See also
+        --------
+        compute_sequential : sequential computing kernel
+        """
+
+        # Extract respective indexing tuples from constructed lists                
+        ingrid = self.sourceLayout[nblock]
+        sigrid = self.sourceSelectors[nblock]
+
+        # Catch empty source-array selections; this workaround is not 
+        # necessary for h5py version 2.10+ (see https://github.com/h5py/h5py/pull/1174)
+        if any([not sel for sel in ingrid]):
+            return None
+
+        # Get source data as NumPy array (w/o prefetching, chunks are read into 
+        # a re-usable buffer)
+        pool = workerPool if self.prefetchDepth == 0 else None
+        tic = time.perf_counter()
+        if self.hdr is None:
+            if isHDF:
+                if self.useFancyIdx:
+                    arr = read_selection(sourceObj, ingrid, sigrid, pool)
+                else:
+                    arr = read_chunk(sourceObj, ingrid, isHDF, pool)
+            else:
+                if self.useFancyIdx:
+                    arr = sourceObj[np.ix_(*ingrid)]
+                else:
+                    arr = read_chunk(sourceObj, ingrid, isHDF, pool)
+            sourceObj.flush()
+        else:
+            idx = ingrid
+            if self.useFancyIdx:
+                idx = np.ix_(*ingrid)
+            stacks = []
+            for fk, fname in enumerate(data.filename):
+                stacks.append(np.memmap(fname, offset=int(self.hdr[fk]["length"]),
+                                        mode="r", dtype=self.hdr[fk]["dtype"],
+                                        shape=(self.hdr[fk]["M"], self.hdr[fk]["N"]))[idx])
+            arr = np.vstack(stacks)[ingrid]
+
+        if self.profile:
+            self._record_chunk(nblock, read_time=time.perf_counter() - tic,
+                               read_bytes=int(arr.nbytes))
+        return arr
+
+    def _compute_block(self, arr, nblock):
+        """
+        Local helper calling :meth:`computeFunction` on a single trial-chunk
+        (`arr` is `None` for empty selections, see :meth:`_read_source`)
+        """
+        if arr is None:
+            return np.empty(self.targetShapes[nblock], dtype=self.dtype)
+        tic = time.perf_counter()
+        res = detach_result(self.computeFunction(arr, *self.ArgV[nblock], **self.cfg), arr)
+        if self.targetCrops[nblock] is not None:
+            res = res[self.targetCrops[nblock]]
+        if self.profile:
+            self._record_chunk(nblock, compute_time=time.perf_counter() - tic,
+                               peak_rss=_peak_rss(), worker=_worker_name())
+        return res
+
+    def _write_block(self, h5fout, target, res, nblock, trialSum=None):
+        """
+        Local helper storing the result of a single trial-chunk in `target`
+        (or adding it to the in-memory running sum `trialSum` if trial-averaging 
+        was requested, see :func:`~syncopy.shared.tools.nan_partial_sum`). 
+        Returns the updated `trialSum`. 
+        """
+
+        # Either write result to `outgrid` location in `target` or add it up
+        tic = time.perf_counter()
+        if not self.keeptrials:
+            trialSum = nan_partial_sum(res, trialSum)
+        else:
+            target[self.targetLayout[nblock]] = res
+        
+            # Flush every iteration to avoid memory leakage
+            h5fout.flush()
+        if self.profile:
+            self._record_chunk(nblock, write_time=time.perf_counter() - tic)
+        return trialSum
+
+    def _record_chunk(self, chunk, **fields):
+        """
+        Local helper adding `fields` (see :data:`~syncopy.shared.profiling.profileFields`)
+        to the profiling record of trial-chunk `chunk` in `self.profileRecords`
+        """
+        rec = self.profileRecords.setdefault(chunk, {"chunk": int(chunk),
+                                                     "trial": self.chunkTrials[chunk]})
+        rec.update(fields)
+
+    def _pipeline_sequential(self, data, sourceObj, isHDF, h5fout, target):
+        """
+        Local helper performing prefetched sequential computations
+
+        Parameters
+        ----------
+        data : syncopy data object
+           Syncopy data object to be processed
+        sourceObj : None or HDF5 dataset or memmap
+           Opened backing device of `data` (`None` for `VirtualData` objects)
+        isHDF : bool
+           If `True`, `sourceObj` is a HDF5 dataset
+        h5fout : :class:`h5py.File`
+           Opened output file
+        target : HDF5 dataset
+           Pre-allocated output dataset
+
+        Returns
+        -------
+        trialSum : None or tuple
+           In-memory running sum of all results if trial-averaging was 
+           requested, `None` otherwise
+
+        Notes
+        -----
+        Source arrays are read by a background reader thread and passed to the 
+        calling thread via a queue holding at most `self.prefetchDepth` items. 
+        The calling thread invokes :meth:`computeFunction` and hands results 
+        over to a background writer thread via a second queue of the same size. 
+        Errors raised in either thread abort the whole pipeline and are 
+        re-raised in the calling thread. 
+
+        See also
+        --------
+        compute_sequential : sequential computing kernel
+        """
+
+        nBlocks = len(self.sourceLayout)
+        readQueue = queue.Queue(maxsize=self.prefetchDepth)
+        writeQueue = queue.Queue(maxsize=self.prefetchDepth)
+        abort = threading.Event()
+        errors = []
+        trialSum = None
+
+        def reader():
+            try:
+                for nblock in range(nBlocks):
+                    arr = self._read_source(data, sourceObj, isHDF, nblock)
+                    if not _put_until(readQueue, (nblock, arr), abort):
+                        return
+            except Exception as exc:
+                errors.append(exc)
+                abort.set()
+
+        def writer():
+            nonlocal trialSum
+            try:
+                for _ in range(nBlocks):
+                    item = _get_until(writeQueue, abort)
+                    if item is None:
+                        return
+                    nblock, res = item
+                    trialSum = self._write_block(h5fout, target, res, nblock, trialSum)
+            except Exception as exc:
+                errors.append(exc)
+                abort.set()
+
+        readThread = threading.Thread(target=reader, name="spy-prefetch-reader", daemon=True)
+        writeThread = threading.Thread(target=writer, name="spy-prefetch-writer", daemon=True)
+        readThread.start()
+        writeThread.start()
+
+        try:
+            for _ in tqdm(range(nBlocks), bar_format=self.tqdmFormat):
+                item = _get_until(readQueue, abort)
+                if item is None:
+                    break
+                nblock, arr = item
+                res = self._compute_block(arr, nblock)
+                if not _put_until(writeQueue, (nblock, res), abort):
+                    break
+        except Exception as exc:
+            errors.append(exc)
+            abort.set()
+        finally:
+            readThread.join()
+            writeThread.join()
+
+        if errors:
+            raise errors[0]
+
+        return trialSum
+
+    def compute_threads(self, data, out):
+        """
+        Multi-threaded computing kernel
+
+        Parameters
+        ----------
+        data : syncopy data object
+           Syncopy data object to be processed
+        out : syncopy data object
+           Empty object for holding results
+
+        Returns
+        -------
+        Nothing : None
+
+        Notes
+        -----
+        Trial-chunks are distributed across a pool of `self.localWorkers` threads
+        on the local machine (all available cores by default) that read
+        source data and call :meth:`computeFunction`. Since NumPy and SciPy
+        release the GIL in their numerical routines, this does not require
+        a dask parallel processing client. Results are written to the
+        pre-allocated HDF5 dataset by a single (the calling) thread.
+
+        See also
+        --------
+        compute : management routine invoking parallel/sequential compute kernels
+        compute_processes : multi-process counterpart of this method
+        """
+        self._compute_local(data, out, ThreadPoolExecutor)
+
+    def compute_processes(self, data, out):
+        """
+        Multi-process computing kernel
+
+        Parameters
+        ----------
+        data : syncopy data object
+           Syncopy data object to be processed
+        out : syncopy data object
+           Empty object for holding results
+
+        Returns
+        -------
+        Nothing : None
+
+        Notes
+        -----
+        Same as :meth:`compute_threads` but uses a pool of local processes
+        instead of threads. Use this method if :meth:`computeFunction` is
+        dominated by pure Python code that does not release the GIL.
+
+        See also
+        --------
+        compute : management routine invoking parallel/sequential compute kernels
+        compute_threads : multi-threaded counterpart of this method
+        """
+        self._compute_local(data, out, ProcessPoolExecutor)
+
+    def _compute_local(self, data, out, poolClass):
+        """
+        Local helper distributing trial-chunks across a local worker pool
+
+        Parameters
+        ----------
+        data : syncopy data object
+           Syncopy data object to be processed
+        out : syncopy data object
+           Empty object for holding results
+        poolClass : :class:`concurrent.futures.Executor` subclass
+           Either :class:`~concurrent.futures.ThreadPoolExecutor` or
+           :class:`~concurrent.futures.ProcessPoolExecutor`
+
+        Returns
+        -------
+        Nothing : None
+
+        Notes
+        -----
+        To keep memory consumption bounded, at most twice as many chunks as
+        there are workers are in flight at any time (less if chunks are large
+        compared to available memory). If trial-averaging was requested, results
+        are summed up in memory and only the final mean is written to disk.
+
+        See also
+        --------
+        compute_threads : multi-threaded computing kernel
+        compute_processes : multi-process computing kernel
+        """
+
+        # Determine pool size and max. no. of concurrently processed chunks
+        nWorkers = self.localWorkers
+        if nWorkers is None:
+            nWorkers = os.cpu_count() or 1
+        memBudget = self.memThresh * psutil.virtual_memory().available
+        maxPending = max(1, min(2 * nWorkers, int(memBudget // max(1, self.chunkMem))))
+
+        # `VirtualData` objects are read directly from raw binary files
+        indset = None
+        if self.hdr is None:
+            indset = data.data.name
+
+        nChunks = len(self.sourceLayout)
+        with h5py.File(out.filename, "r+") as h5fout, poolClass(max_workers=nWorkers) as pool:
+            target = h5fout[self.datasetName]
+            trialSum = None
+
+            pbar = tqdm(total=nChunks, bar_format=self.tqdmFormat)
+            pending = {}
+            nextChunk = 0
+            while nextChunk < nChunks or pending:
+
+                # Keep the pool busy without piling up results in memory
+                while nextChunk < nChunks and len(pending) < maxPending:
+                    future = pool.submit(_process_chunk,
+                                         self.computeFunction,
+                                         data.filename,
+                                         indset,
+                                         self.hdr,
+                                         self.sourceLayout[nextChunk],
+                                         self.sourceSelectors[nextChunk],
+                                         self.useFancyIdx,
+                                         self.targetShapes[nextChunk],
+                                         self.targetCrops[nextChunk],
+                                         self.dtype,
+                                         self.ArgV[nextChunk],
+                                         self.cfg,
+                                         profile=self.profile)
+                    pending[future] = nextChunk
+                    nextChunk += 1
+
+                # Write finished chunks (from this thread only); abort on first error
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    chk = pending.pop(future)
+                    try:
+                        res = future.result()
+                    except Exception as exc:
+                        for fut in pending:
+                            fut.cancel()
+                        pbar.close()
+                        raise exc
+                    if self.profile:
+                        res, rec = res
+                        self._record_chunk(chk, **rec)
+                    tic = time.perf_counter()
+                    if self.keeptrials:
+                        target[self.targetLayout[chk]] = res
+                    else:
+                        trialSum = nan_partial_sum(res, trialSum)
+                    if self.profile:
+                        self._record_chunk(chk, write_time=time.perf_counter() - tic)
+                    pbar.update(1)
+            pbar.close()
+
+            # If trial-averaging was requested, normalize computed sum to get mean
+            if not self.keeptrials:
+                target[()] = partial_mean(trialSum)
+            h5fout.flush()
+
+        return
+
+    def write_log(self, data, out, log_dict=None):
+        """
+        Processing of output log
+
+        Parameters
+        ----------
+        data : syncopy data object
+           Syncopy data object that has been processed
+        out : syncopy data object
+           Syncopy data object holding calculation results
+        log_dict : None or dict
+           If `None`, the `log` properties of `out` is populated with the employed 
+           keyword arguments used in :meth:`computeFunction`. 
+           Otherwise, `out`'s `log` properties are filled  with items taken 
+           from `log_dict`. 
+        
+        Returns
+        -------
+        Nothing : None
+ 
         See also
         --------
         process_metadata : Management of meta-information
@@ -1012,9 +1966,7 @@ class ComputationalRoutine(ABC):
         logHead = "computed {name:s} with settings\n".format(name=self.computeFunction.__name__)
 
         # Prepare keywords used by `computeFunction` (sans implementation-specific stuff)
-        cfg = dict(self.cfg)
-        for key in ["noCompute", "chunkShape"]:
-            cfg.pop(key)
+        cfg = self._output_cfg()
 
         # Write log and store `cfg` constructed above in corresponding prop of `out`
         if log_dict is None:
@@ -1025,8 +1977,22 @@ class ComputationalRoutine(ABC):
                                                         value=str(v) if len(str(v)) < 80
                                                         else str(v)[:30] + ", ..., " + str(v)[-30:])
         out.log = logHead + logOpts
+
+        # If computation was profiled, attach timing/memory summary
+        if self.profileSummary is not None:
+            cfg["profile"] = self.profileSummary
         out.cfg = cfg
 
+    def _output_cfg(self):
+        """
+        Local helper assembling the settings to be stored in `out.cfg` (keywords
+        of :meth:`computeFunction` sans `noCompute` and `chunkShape`)
+        """
+        cfg = dict(self.cfg)
+        for key in ["noCompute", "chunkShape"]:
+            cfg.pop(key)
+        return cfg
+
     @abstractmethod
     def process_metadata(self, data, out):
         """
@@ -1055,6 +2021,582 @@ class ComputationalRoutine(ABC):
         """
         pass
 
+    def time_splitting(self):
+        """
+        Declare whether trials may be split up along the time axis
+
+        Parameters
+        ----------
+        Nothing : None
+
+        Returns
+        -------
+        split : None or tuple
+           `None` if trials cannot be processed in separate time-blocks (default). 
+           Otherwise a tuple ``(step, margin)`` of integers: every element along 
+           the first (time) axis of the output of :meth:`computeFunction` 
+           corresponds to `step` consecutive input samples and is only affected
+           by input samples at most `margin` samples away. 
+
+        Notes
+        -----
+        This method is intended to be overloaded by sub-classes whose 
+        :meth:`computeFunction` acts locally in time (e.g., sliding window
+        transforms). If a single trial does not fit into memory, 
+        :meth:`compute` splits it into blocks of input samples overlapping by 
+        (at least) `margin` samples, computes each block independently and 
+        only stores the output corresponding to the non-overlapping part of 
+        each block (overlap-save). 
+
+        See also
+        --------
+        compute : management routine invoking parallel/sequential compute kernels
+        """
+        return None
+
+    def output_shapes(self, inShapes, inDtype, argIdx):
+        """
+        Vectorized dry-run: determine output shapes of many trials at once
+
+        Parameters
+        ----------
+        inShapes : 2D :class:`numpy.ndarray`
+           Shapes of the (selected) input trials or trial-chunks, one per row
+        inDtype : :class:`numpy.dtype`
+           Numerical type of the input data
+        argIdx : 1D :class:`numpy.ndarray`
+           For every row of `inShapes`, the index of the by-trial positional 
+           arguments of the respective trial (in the lists of `self.argv`)
+
+        Returns
+        -------
+        shapes : None or tuple
+           `None` if output shapes have to be determined by calling 
+           :meth:`computeFunction` with ``noCompute = True`` (default). 
+           Otherwise a tuple ``(outShapes, dtype)`` of a 2D integer array 
+           holding the output shape of every row of `inShapes` and the 
+           numerical type of the output. 
+
+        Notes
+        -----
+        This method is intended to be overloaded by sub-classes whose output 
+        shapes can be computed from the input shapes (e.g., trial lengths) and 
+        the settings of the computation alone. Otherwise, :meth:`initialize` 
+        performs a dry-run of :meth:`computeFunction` for every distinct 
+        combination of input shape and by-trial arguments (see :meth:`_dry_run`). 
+
+        See also
+        --------
+        initialize : pre-calculation preparations
+        """
+        return None
+
+    def _dry_run(self, trials, argIdx, dryRunKwargs):
+        """
+        Determine output shapes and types of trials or trial-chunks
+
+        Parameters
+        ----------
+        trials : list
+           List of :class:`~syncopy.datatype.base_data.FauxTrial` objects
+        argIdx : list
+           For every entry of `trials`, the index of its by-trial positional 
+           arguments in the lists of `self.argv`
+        dryRunKwargs : dict
+           Keyword arguments of :meth:`computeFunction` (including ``noCompute = True``)
+
+        Returns
+        -------
+        shapes : list
+           List of output shapes (lists of integers), one for each entry of `trials`
+        dtypes : list
+           List of output types, one for each entry of `trials`
+
+        Notes
+        -----
+        If the compute class provides vectorized shape inference 
+        (:meth:`output_shapes`), :meth:`computeFunction` is not called at all. 
+        Otherwise, dry-run results are cached: trials of identical shape and 
+        type with identical by-trial arguments (compared by value if hashable, 
+        by identity otherwise) only invoke :meth:`computeFunction` once. 
+
+        See also
+        --------
+        output_shapes : vectorized dry-run
+        """
+
+        if len(trials) == 0:
+            return [], []
+        inferred = self.output_shapes(np.array([trial.shape for trial in trials]),
+                                      np.dtype(trials[0].dtype), 
+                                      np.array(argIdx, dtype=np.intp))
+        if inferred is not None:
+            outShapes, dtype = inferred
+            shapes = [[int(dim) for dim in shp] for shp in np.asarray(outShapes)]
+            return shapes, [dtype] * len(shapes)
+
+        cache = {}
+        shapes = []
+        dtypes = []
+        for trial, ak in zip(trials, argIdx):
+            trlArg = tuple(arg[ak] for arg in self.argv)
+            key = (tuple(trial.shape), np.dtype(trial.dtype).str,
+                   tuple(_arg_key(arg) for arg in trlArg))
+            if key not in cache:
+                cache[key] = self.computeFunction(trial, *trlArg, **dryRunKwargs)
+            shape, dtype = cache[key]
+            shapes.append(list(shape))
+            dtypes.append(dtype)
+        return shapes, dtypes
+
+    def _split_chunks(self, data, memBudget):
+        """
+        Split oversized trial-chunks into overlapping time-blocks
+
+        Parameters
+        ----------
+        data : syncopy data object
+           Syncopy data object to be processed
+        memBudget : float
+           Max. memory footprint (in bytes) of the result of a single block 
+           (including its overlap with neighboring blocks)
+
+        Returns
+        -------
+        success : bool
+           `True` if all chunks now fit into `memBudget`, `False` if trials 
+           cannot be split (in this case, nothing is changed)
+
+        Notes
+        -----
+        Every trial-chunk whose result exceeds `memBudget` is replaced by 
+        consecutive blocks along the time axis: blocks are chosen as large as
+        possible and their source selections are extended by the `margin`
+        reported by :meth:`time_splitting` (within trial bounds). The 
+        overlapping parts of the block results are discarded via 
+        `self.targetCrops`. Splitting is not supported for trial-averaging
+        and for (fancy) selections that are not contiguous in time. 
+
+        See also
+        --------
+        time_splitting : declare whether trials may be split
+        """
+
+        split = self.time_splitting()
+        if split is None or not self.keeptrials or "time" not in data.dimord:
+            return False
+        step, margin = split
+        step = max(1, int(step))
+        margin = int(np.ceil(margin / step)) * step
+        timeAxis = data.dimord.index("time")
+
+        sourceLayout = []
+        sourceSelectors = []
+        targetLayout = []
+        targetShapes = []
+        targetCrops = []
+        chunkTrials = []
+        ArgV = []
+        chunkMems = []
+        for chk, ingrid in enumerate(self.sourceLayout):
+            outShape = tuple(self.targetShapes[chk])
+            chunkMem = np.prod(outShape) * self.dtype.itemsize
+
+            # Small chunks remain untouched
+            if chunkMem <= memBudget:
+                sourceLayout.append(ingrid)
+                sourceSelectors.append(self.sourceSelectors[chk])
+                targetLayout.append(self.targetLayout[chk])
+                targetShapes.append(outShape)
+                targetCrops.append(self.targetCrops[chk])
+                chunkTrials.append(self.chunkTrials[chk])
+                ArgV.append(self.ArgV[chk])
+                chunkMems.append(chunkMem)
+                continue
+
+            # Ensure source samples are contiguous and map onto output time-points
+            timeSel = ingrid[timeAxis]
+            if isinstance(timeSel, list) and len(timeSel) > 0 and \
+                np.array_equal(timeSel, np.arange(timeSel[0], timeSel[-1] + 1)):
+                timeSel = slice(timeSel[0], timeSel[-1] + 1)
+            if not isinstance(timeSel, slice) or timeSel.step not in (None, 1) \
+                or timeSel.start is None or timeSel.stop is None:
+                return False
+            nSamples = timeSel.stop - timeSel.start
+            sigrid = self.sourceSelectors[chk]
+            if self.useFancyIdx and not np.array_equal(sigrid[timeAxis], np.arange(nSamples)):
+                return False
+            nTime = outShape[0]
+            if nTime != int(np.ceil(nSamples / step)):
+                return False
+
+            # Largest block length (in output time-points) that fits into memory
+            pointMem = chunkMem / nTime
+            blockLen = int((memBudget - 1) // pointMem) - 2 * margin // step
+            if blockLen < 1:
+                return False
+
+            timeOffset = self.targetLayout[chk][0].start
+            for start in range(0, nTime, blockLen):
+                stop = min(start + blockLen, nTime)
+                lo = max(0, start * step - margin)
+                hi = min(nSamples, stop * step + margin)
+                grid = list(ingrid)
+                grid[timeAxis] = slice(timeSel.start + lo, timeSel.start + hi)
+                sourceLayout.append(tuple(grid))
+                if self.useFancyIdx:
+                    sel = list(sigrid)
+                    sel[timeAxis] = np.arange(hi - lo)
+                    sourceSelectors.append(tuple(sel))
+                else:
+                    sourceSelectors.append(sigrid)
+                lyt = list(self.targetLayout[chk])
+                lyt[0] = slice(timeOffset + start, timeOffset + stop)
+                targetLayout.append(tuple(lyt))
+                targetShapes.append((stop - start,) + outShape[1:])
+                skip = (start * step - lo) // step
+                targetCrops.append(slice(skip, skip + stop - start))
+                chunkTrials.append(self.chunkTrials[chk])
+                ArgV.append(self.ArgV[chk])
+                chunkMems.append(int(np.ceil((hi - lo) / step)) * pointMem)
+
+        msg = "Splitting trials into {0:d} time-blocks to fit results into memory"
+        SPYWarning(msg.format(len(sourceLayout)))
+        self.sourceLayout = sourceLayout
+        self.sourceSelectors = sourceSelectors
+        self.targetLayout = targetLayout
+        self.targetShapes = targetShapes
+        self.targetCrops = targetCrops
+        self.chunkTrials = chunkTrials
+        self.ArgV = ArgV
+        self.taskLayout = [[chk] for chk in range(len(sourceLayout))]
+        self.chunkMem = max(chunkMems)
+        return True
+
+    def _read_manifest(self):
+        """
+        Determine tasks completed by a previous run of a resumable computation
+
+        Parameters
+        ----------
+        Nothing : None
+
+        Returns
+        -------
+        completedTasks : list
+           Indices of tasks in `self.taskLayout` whose results are available
+           in `self.checkpointDir`
+
+        Notes
+        -----
+        Tasks listed in the manifest are only considered complete if their 
+        result files can be opened and contain datasets of the expected 
+        shapes. If the manifest was written for a different task layout (e.g., 
+        due to a different number of parallel workers), the checkpoint 
+        cannot be used and all tasks are processed again. 
+
+        See also
+        --------
+        _write_manifest : record completed tasks
+        """
+
+        try:
+            with open(os.path.join(self.checkpointDir, self._manifestName), "r") as manifest:
+                info = json.load(manifest)
+        except (OSError, ValueError):
+            return []
+        if info.get("taskLayout") != self.taskLayout:
+            msg = "Task layout of checkpoint {} does not match current computation, " +\
+                "processing all tasks again"
+            SPYWarning(msg.format(self.checkpointDir))
+            return []
+
+        completedTasks = []
+        for tk in info.get("completed", []):
+            task = self.taskLayout[tk]
+            fname = os.path.join(self.checkpointDir, "{0:d}.h5".format(tk))
+            try:
+                with h5py.File(fname, mode="r") as h5f:
+                    for j, chk in enumerate(task):
+                        dsetname = "chk" if len(task) == 1 else "chk{0:d}".format(j)
+                        if h5f[dsetname].shape != tuple(self.targetShapes[chk]):
+                            raise ValueError
+            except (OSError, KeyError, ValueError):
+                continue
+            completedTasks.append(tk)
+        return completedTasks
+
+    def _write_manifest(self, pendingTasks, futures):
+        """
+        Record completed tasks of a resumable computation
+
+        Parameters
+        ----------
+        pendingTasks : list
+           Indices of tasks in `self.taskLayout` scheduled in the current run
+        futures : list
+           Futures of the scheduled tasks (the partition index encoded in a
+           future's key is the position of the task in `pendingTasks`)
+
+        Returns
+        -------
+        Nothing : None
+
+        See also
+        --------
+        _read_manifest : determine completed tasks
+        """
+
+        completed = set(self.completedTasks)
+        completed.update(pendingTasks[f.key[1]] for f in futures if f.status == "finished")
+        info = {"taskLayout": self.taskLayout, "completed": sorted(completed)}
+        manifest = os.path.join(self.checkpointDir, self._manifestName)
+        with open(manifest + ".tmp", "w") as fid:
+            json.dump(info, fid)
+        os.replace(manifest + ".tmp", manifest)
+
+    def _block_shape(self):
+        """
+        Local helper returning the shape of the largest trial-chunk (the unit 
+        of data written in one go, used for aligning HDF5 chunks)
+        """
+        return tuple(np.array(self.targetShapes).max(axis=0))
+
+    def _shard_layout(self):
+        """
+        Construct virtual layout of output dataset from worker shard files
+
+        Parameters
+        ----------
+        None
+
+        Returns
+        -------
+        layout : :class:`h5py.VirtualLayout`
+           Layout mapping the datasets ``"chk<k>"`` of all shard files in 
+           `self.virtualDatasetDir` onto `self.targetLayout[k]`
+
+        Notes
+        -----
+        Tasks that were re-scheduled after a failure may have written (some of) 
+        their chunks to several shards. Since all copies hold the same result, 
+        any of them can be used. 
+
+        See also
+        --------
+        syncopy.shared.kwarg_decorators.unwrap_io : writing of shard files
+        """
+
+        layout = h5py.VirtualLayout(shape=self.outputShape, dtype=self.dtype)
+        for fname in sorted(glob(os.path.join(self.virtualDatasetDir, "shard_*.h5"))):
+            with h5py.File(fname, mode="r") as h5f:
+                dsetnames = list(h5f.keys())
+            for dsetname in dsetnames:
+                chk = int(dsetname[3:])
+                layout[self.targetLayout[chk]] = h5py.VirtualSource(fname, dsetname,
+                                                                    shape=self.targetShapes[chk])
+        return layout
+
+    def _consolidate_output(self, out):
+        """
+        Re-write virtual output dataset into a single contiguous dataset
+
+        Parameters
+        ----------
+        out : syncopy data object
+           Empty object for holding results (`out.filename` holds the 
+           virtual dataset)
+
+        Returns
+        -------
+        Nothing : None
+
+        Notes
+        -----
+        Data is copied chunk by chunk (i.e., memory usage is bounded by the 
+        largest trial-chunk) into a new file that subsequently replaces 
+        `out.filename`. Once done, `self.virtualDatasetDir` is removed. 
+        """
+
+        tmpname = out.filename + ".consolidate"
+        with h5py.File(out.filename, mode="r") as h5fin, \
+            h5py.File(tmpname, mode="w") as h5fout:
+            source = h5fin[self.datasetName]
+            target = h5fout.create_dataset(self.datasetName, shape=self.outputShape,
+                                           dtype=self.dtype,
+                                           **storage_kwargs(self.storage, self.outputShape,
+                                                            self.dtype, self._block_shape()))
+            for outgrid in self.targetLayout:
+                target[outgrid] = source[outgrid]
+        os.replace(tmpname, out.filename)
+        shutil.rmtree(self.virtualDatasetDir, ignore_errors=True)
+        self.virtualDatasetDir = None
+
+    def _auto_chan_per_worker(self, nChannels, chunkShape):
+        """
+        Determine the size of channel-blocks from available worker memory
+
+        Parameters
+        ----------
+        nChannels : int
+           Number of (selected) input channels per trial
+        chunkShape : tuple
+           Shape of the (largest) single-trial result as determined by the 
+           dry-run of :meth:`computeFunction`
+
+        Returns
+        -------
+        chan_per_worker : None or int
+           Number of channels per block; `None` if trials do not need to be
+           split into channel-blocks
+
+        Notes
+        -----
+        Channel-blocks are chosen as large as possible such that the result 
+        of a block occupies at most `self.memThresh` of the memory of a single 
+        worker of the active dask client (or of a local CPU core if no client
+        is running). If this yields fewer than `self._tasksPerWorker` tasks per
+        worker, blocks are shrunk until the number of tasks is a multiple of 
+        the number of workers (if possible), so that no worker idles at the 
+        end of the computation. The memory budget of blocks is kept in 
+        `self.chanBlockMem`: :meth:`compute` accepts chunks within this budget 
+        even if the available memory has decreased in the meantime. 
+
+        See also
+        --------
+        initialize : pre-calculation preparations
+        """
+
+        # Get number of workers and memory per worker
+        nWorkers = None
+        wrk_size = None
+        if __dask__:
+            try:
+                client = dd.get_client()
+                nWorkers = len(client.cluster.workers)
+                wrk_size = _worker_memory(client)
+            except ValueError:
+                pass
+        if not nWorkers:
+            nWorkers = os.cpu_count() or 1
+            wrk_size = psutil.virtual_memory().available / nWorkers
+
+        # Use the largest blocks that fit into memory (remember the budget, so 
+        # that `compute` does not reject blocks sized right at its limit)...
+        nTrials = len(self.trialList)
+        chanPerBlock = nChannels
+        if wrk_size is not None:
+            trialMem = np.prod(chunkShape) * self.dtype.itemsize
+            self.chanBlockMem = self.memThresh * wrk_size
+            chanMem = max(1, trialMem / nChannels)
+            chanPerBlock = int(max(1, min(nChannels, self.chanBlockMem // chanMem)))
+        nBlocks = int(np.ceil(nChannels / chanPerBlock))
+
+        # ...unless there are too few tasks to keep all workers busy
+        if nTrials * nBlocks < self._tasksPerWorker * nWorkers:
+            for nb in range(nBlocks, nChannels + 1):
+                size = int(np.ceil(nChannels / nb))
+                if (nTrials * int(np.ceil(nChannels / size))) % nWorkers == 0:
+                    chanPerBlock = size
+                    break
+
+        if chanPerBlock >= nChannels:
+            return None
+        return chanPerBlock
+
+    def _memory_budget(self, mem_thresh, memSize):
+        """
+        Local helper returning the memory (in bytes) a single chunk may occupy:
+        `mem_thresh` of `memSize`, but at least the budget channel-blocks were 
+        sized for in :meth:`initialize` (see :meth:`_auto_chan_per_worker`)
+        """
+        budget = mem_thresh * memSize
+        if self.chanBlockMem is not None:
+            budget = max(budget, self.chanBlockMem)
+        return budget
+
+    def _order_tasks(self):
+        """
+        Sort parallel tasks by decreasing cost
+
+        Parameters
+        ----------
+        None
+
+        Returns
+        -------
+        Nothing : None
+
+        Notes
+        -----
+        The cost of a task is estimated by the combined size of the results of 
+        its chunks (`self.targetShapes`), which is usually proportional to the 
+        length of the processed trials. Sorting is stable, i.e., tasks of equal 
+        cost remain in their original order. Thus, the resulting `self.taskLayout` 
+        (and `self.taskMem`) is deterministic, which is required for resuming 
+        computations. 
+
+        See also
+        --------
+        compute_parallel : concurrent computing kernel
+        """
+        taskMem = [sum(int(np.prod(self.targetShapes[chk])) for chk in task) * self.dtype.itemsize
+                   for task in self.taskLayout]
+        order = sorted(range(len(taskMem)), key=lambda tk: -taskMem[tk])
+        self.taskLayout = [self.taskLayout[tk] for tk in order]
+        self.taskMem = [taskMem[tk] for tk in order]
+
+    def _batch_chunks(self, trials_per_task, nWorkers, wrk_size=None, mem_thresh=0.5):
+        """
+        Group neighboring trial-chunks into parallel tasks
+
+        Parameters
+        ----------
+        trials_per_task : int or "auto"
+           Maximal number of chunks per task. If `"auto"`, the batch size is
+           chosen to yield at least `self._tasksPerWorker` tasks per worker
+           while keeping the combined result of a task below `mem_thresh`
+           of `wrk_size`.
+        nWorkers : int
+           Number of workers in the parallel computing cluster
+        wrk_size : None or int
+           Memory (in bytes) available to a single worker. If `None`, the
+           memory footprint of tasks is not taken into account.
+        mem_thresh : float
+           Fraction of worker memory that may be occupied by a single task
+
+        Returns
+        -------
+        taskLayout : list
+           List of lists of chunk indices, e.g., ``[[0, 1, 2], [3, 4, 5], [6]]``
+
+        See also
+        --------
+        compute : management routine invoking parallel/sequential compute kernels
+        """
+
+        nChunks = len(self.sourceLayout)
+        if isinstance(trials_per_task, str):
+            if trials_per_task != "auto":
+                lgl = "positive integer or 'auto'"
+                raise SPYValueError(legal=lgl, varname="trials_per_task",
+                                    actual=trials_per_task)
+            batchSize = max(1, nChunks // max(1, nWorkers * self._tasksPerWorker))
+            if wrk_size is not None:
+                batchSize = min(batchSize, max(1, int(mem_thresh * wrk_size // max(1, self.chunkMem))))
+        else:
+            try:
+                batchSize = int(trials_per_task)
+            except (TypeError, ValueError):
+                batchSize = 0
+            if batchSize != trials_per_task or batchSize < 1:
+                lgl = "positive integer or 'auto'"
+                raise SPYValueError(legal=lgl, varname="trials_per_task",
+                                    actual=str(trials_per_task))
+
+        return [list(range(start, min(start + batchSize, nChunks)))
+                for start in range(0, nChunks, batchSize)]
+
     def _sizeof(self, obj):
         """
         Estimate memory consumption of Python objects 
@@ -1071,9 +2613,10 @@ class ComputationalRoutine(ABC):
            
         Notes
         -----
-        Memory consumption is is estimated by recursively calling :meth:`sys.getsizeof`. 
-        Circular object references are followed up to a (preset) maximal recursion
-        depth. This method was inspired by a routine in 
+        Memory consumption is is estimated by recursively calling :meth:`sys.getsizeof`
+        (NumPy arrays are represented by their `nbytes` attribute). Circular object 
+        references are followed up to a (preset) maximal recursion depth. This 
+        method was inspired by a routine in 
         `Nifty <https://github.com/mwojnars/nifty/blob/master/util.py>`_. 
         """
         
@@ -1085,6 +2628,11 @@ class ComputationalRoutine(ABC):
             act = "argument with nesting depth >= {}"
             raise SPYValueError(legal=lgl, varname="argv", actual=act.format(self._callMax))
         
+        # NumPy arrays report the size of their buffer (`sys.getsizeof` only 
+        # accounts for it if the array owns its data)
+        if isinstance(obj, np.ndarray):
+            return obj.nbytes / 1024**2
+
         # Use `sys.getsizeof` to estimate memory consumption of primitive objects
         objsize = sys.getsizeof(obj) / 1024**2
         if isinstance(obj, dict): 
@@ -1092,3 +2640,467 @@ class ComputationalRoutine(ABC):
         if isinstance(obj, (list, tuple, set)): 
             return objsize + sum(list(map(self._sizeof, obj)))
         return objsize
+
+
+def compute_batch(func, objs, *args, **kwargs):
+    """
+    Process several data objects in a single parallel computation
+
+    Parameters
+    ----------
+    func : callable
+        Syncopy metafunction processing a single data object via a
+        :class:`ComputationalRoutine` (e.g., :func:`~syncopy.freqanalysis`)
+    objs : list
+        Syncopy data objects to be processed
+    *args : tuple
+        Additional positional arguments of `func`
+    **kwargs : dict
+        Keyword arguments of `func` (identical for all objects)
+
+    Returns
+    -------
+    results : list
+        Return values of `func`, one for each object in `objs`
+
+    Notes
+    -----
+    Calling `func` for one object after another leaves parallel workers idle
+    whenever the last (long) trials of an object are processed. Instead,
+    `func` is invoked for all objects first while parallel computations are
+    only queued: every :class:`ComputationalRoutine` performs its dry-run,
+    memory checks and storage allocation but does not launch any tasks.
+    Afterwards, the tasks of all objects are submitted to the cluster as one
+    graph. Tasks are prioritized by their cost across all objects (see
+    :meth:`ComputationalRoutine._order_tasks`). Once all tasks are done,
+    meta-data and logs are attached to every output object.
+
+    Only parallel computations (``parallel = True``) are queued. Sequential
+    computations (or parallel computations in debugging mode) are performed
+    right away.
+
+    Examples
+    --------
+    >>> specs = compute_batch(spy.freqanalysis, sessions, method="mtmfft",
+    >>>                       output="pow", parallel=True)
+
+    See also
+    --------
+    syncopy.shared.kwarg_decorators.detect_parallel_client : invokes this routine for several objects
+    """
+
+    global _batchQueue
+    _batchQueue = []
+    try:
+        results = [func(obj, *args, **kwargs) for obj in objs]
+        jobs = _batchQueue
+    finally:
+        _batchQueue = None
+    if jobs:
+        _run_batch(jobs)
+    return results
+
+
+def _run_batch(jobs):
+    """
+    Local helper processing the tasks of all computations queued by
+    :func:`compute_batch` in one go (`jobs` is a list of
+    ``(routine, data, out, log_dict, selection)`` tuples)
+    """
+
+    client = dd.get_client()
+    routines = [job[0] for job in jobs]
+
+    # Prioritize tasks of all objects by their cost (ties are broken by order
+    # of objects), so that long trials of later objects are not started last
+    pending = [[tk for tk in range(len(routine.taskLayout)) if tk not in routine.completedTasks]
+               for routine in routines]
+    costs = sorted([(routine.taskMem[tk], rk, pos) for rk, routine in enumerate(routines)
+                    for pos, tk in enumerate(pending[rk])], key=lambda item: -item[0])
+    for routine, tasks in zip(routines, pending):
+        routine.taskPriority = [0] * len(tasks)
+    for rank, (_, rk, pos) in enumerate(costs):
+        routines[rk].taskPriority[pos] = len(costs) - rank
+
+    # Submit tasks of all objects at once and wait for all of them
+    tic = time.perf_counter()
+    for routine, data, out, _, _ in jobs:
+        data.mode = "r"
+    try:
+        graphs = [routine._parallel_graph(data, out) for routine, data, out, _, _ in jobs]
+        running = [rk for rk, routine in enumerate(routines) if routine.pendingTasks]
+        if running:
+            retries = max(routines[rk].retries for rk in running)
+            priorities = {}
+            resources = {}
+            for rk in running:
+                priorities.update(routines[rk].keyPriorities)
+                resources.update(routines[rk].keyResources)
+            persisted = client.persist([graphs[rk] for rk in running], retries=retries,
+                                       optimize_graph=False, priority=priorities,
+                                       resources=resources or None)
+            for rk, results in zip(running, persisted):
+                graphs[rk] = results
+                routines[rk].futures = dd.client.futures_of(results)
+            _await_futures([routines[rk] for rk in running], client)
+        for (routine, data, out, _, _), results in zip(jobs, graphs):
+            routine._parallel_output(out, results)
+    finally:
+        routines[0]._release_handles(True)
+        for routine, data, out, _, _ in jobs:
+            data.mode = routine.dataMode
+            routine.taskPriority = None
+    wallTime = time.perf_counter() - tic
+
+    # Metafunctions may have wiped in-place selections in the meantime: use
+    # the selection that was active when the computation was queued
+    for routine, data, out, log_dict, selection in jobs:
+        current = data._selection
+        data._selector = selection
+        try:
+            routine.finalize(data, out, log_dict, wallTime)
+        finally:
+            data._selector = current
+
+
+def _await_futures(routines, client):
+    """
+    Local helper waiting for the futures of all pending parallel tasks of
+    `routines` (see :meth:`ComputationalRoutine.compute_parallel`). Failed
+    tasks are reported right away. Raises a
+    :class:`~syncopy.shared.errors.SPYParallelError` if any task failed.
+    """
+
+    # Make sure that all futures are executed (i.e., data is actually written)
+    # Note 1: `dd.progress` does not correctly track worker progress hence
+    #         futures are consumed in order of completion: the progress bar
+    #         is updated as soon as a task is done (without polling futures)
+    # Note 2: failed tasks are re-scheduled up to `self.retries` times and
+    #         only show up here once they failed for good
+    # Note 3: graph optimization would rename the keys of per-task priorities
+    #         and resources (see `_parallel_graph`)
+    futures = [f for routine in routines for f in routine.futures]
+    owners = {f.key: routine for routine in routines for f in routine.futures}
+    nTasks = sum(len(routine.taskLayout) for routine in routines)
+    totalTasks = len(futures)
+    pbar = tqdm(total=nTasks, initial=nTasks - totalTasks, bar_format=routines[0].tqdmFormat)
+    lastManifest = time.perf_counter()
+    for future in dd.as_completed(futures):
+        routine = owners[future.key]
+        if future.status == "finished":
+            pbar.update(1)
+            if time.perf_counter() - lastManifest > routine.manifestInterval:
+                for rtn in routines:
+                    if rtn.checkpointDir is not None:
+                        rtn._write_manifest(rtn.pendingTasks, rtn.futures)
+                lastManifest = time.perf_counter()
+            continue
+
+        # Report failures right away (and stop all other tasks if wanted)
+        if future.status == "error":
+            task = routine.taskLayout[routine.pendingTasks[future.key[1]]]
+            msg = "Parallel task processing trial-chunk(s) {} failed: {}"
+            SPYWarning(msg.format(task, future.exception()))
+        if routine.failFast:
+            client.cancel([f for f in futures if not f.done()])
+            break
+    pbar.close()
+    for routine in routines:
+        if routine.checkpointDir is not None:
+            routine._write_manifest(routine.pendingTasks, routine.futures)
+
+    # If number of 'finished' tasks is less than expected, go into
+    # problem analysis mode: all futures that erred hav an `.exception`
+    # method which can be used to track down the worker it was executed by
+    # Once we know the worker, we can point to the right log file. If
+    # futures were cancelled (by the user or the SLURM controller),
+    # `.exception` is `None` and we can't relialby track down the
+    # respective executing worker
+    finishedTasks = sum([f.status == "finished" for f in futures])
+    if finishedTasks < totalTasks:
+        schedulerLog = list(client.cluster.get_logs(cluster=False, scheduler=True, workers=False).values())[0]
+        erredFutures = [f for f in futures if f.status == "error"]
+        msg = "Parallel computation failed: {}/{} tasks failed or stalled.\n"
+        msg = msg.format(totalTasks - finishedTasks, totalTasks)
+        msg += "Concurrent computing scheduler log below: \n\n"
+        msg += schedulerLog + "\n"
+
+        # If we're working w/`SLURMCluster`, perform the Herculean task of
+        # tracking down which dask worker was executed by which SLURM job...
+        if client.cluster.__class__.__name__ == "SLURMCluster":
+            try:
+                erredJobs = [f.exception().last_worker.identity()["id"] for f in erredFutures]
+            except AttributeError:
+                erredJobs = []
+            erredJobs = list(set(erredJobs))
+            erredJobIDs = [client.cluster.workers[job].job_id for job in erredJobs]
+            slurmFiles = client.cluster.job_header.split("--output=")[1].replace("%j", "{}")
+            slurmOutDir = os.path.split(slurmFiles)[0]
+            errFiles = glob(slurmOutDir + os.sep + "*.err")
+            if len(erredFutures) or len(errFiles):
+                msg += "Please consult the following SLURM log files for details:\n"
+                msg += "".join(slurmFiles.format(id) + "\n" for id in erredJobIDs)
+                msg += "".join(errfile + "\n" for errfile in errFiles)
+            else:
+                msg += "Please check SLURM logs in {}".format(slurmOutDir)
+
+        # In case of a `LocalCluster`, syphon worker logs
+        else:
+            msg += "\nParallel worker logs below: \n"
+            workerLogs = client.cluster.get_logs(cluster=False, scheduler=False, workers=True).values()
+            for wLog in workerLogs:
+                if "Failed" in wLog:
+                    msg += wLog
+
+        # Point to checkpoints of resumable computations
+        for routine in routines:
+            if routine.checkpointDir is not None:
+                remaining = sum([f.status != "finished" for f in routine.futures])
+                ckptMsg = "\nResults of completed tasks have been kept in {}. " +\
+                    "Re-run the computation with `resume=True` to only process " +\
+                    "the remaining {} tasks. \n"
+                msg += ckptMsg.format(routine.checkpointDir, remaining)
+
+        raise SPYParallelError(msg, client=client)
+
+
+def _worker_memory(client):
+    """
+    Local helper returning the max. memory (in bytes) of the workers of the 
+    dask `client` (`None` for clusters other than `LocalCluster` and `SLURMCluster`)
+    """
+
+    # Note: `dask_jobqueue` may not be available even if `__dask__` is `True`,
+    # hence the `__name__` shenanigans instead of a simple `isinstance`
+    if isinstance(client.cluster, dd.LocalCluster):
+        memAttr = "memory_limit"
+    elif client.cluster.__class__.__name__ == "SLURMCluster":
+        memAttr = "worker_memory"
+    else:
+        return None
+    return max(getattr(wrkr, memAttr) for wrkr in client.cluster.workers.values())
+
+
+def _arg_key(arg):
+    """
+    Local helper returning a hashable stand-in of the positional argument `arg` 
+    (`arg` itself if hashable, its identity otherwise) for caching dry-runs
+    """
+    try:
+        hash(arg)
+    except TypeError:
+        return ("id", id(arg))
+    return arg
+
+
+def _channel_indices(chanSel, nChannels):
+    """
+    Local helper converting a channel selection (slice or list) to a list of indices
+    """
+    if isinstance(chanSel, slice):
+        return list(range(*chanSel.indices(nChannels)))
+    return list(chanSel)
+
+
+def _channel_block(chanIdx, start, stop):
+    """
+    Local helper extracting a block of consecutive (selected) channels from 
+    `chanIdx`: contiguous blocks are returned as slices, others as lists
+    """
+    block = chanIdx[start:stop]
+    if len(block) > 0 and block == list(range(block[0], block[-1] + 1)):
+        return slice(block[0], block[-1] + 1)
+    return block
+
+
+def _process_chunk(computeFunction, infilename, indset, hdr, ingrid, sigrid, fancy,
+                   outshape, outcrop, outdtype, argv, cfg, profile=False):
+    """
+    Local helper reading a single trial-chunk and calling `computeFunction` on it
+
+    Parameters
+    ----------
+    computeFunction : callable
+        :meth:`ComputationalRoutine.computeFunction` of the calling instance
+    infilename : str or list
+        Path to source file (list of raw binary files for `VirtualData` sources)
+    indset : str or None
+        Name of source HDF5 dataset
+    hdr : None or list
+        Header information of raw binary input files (`VirtualData` only)
+    ingrid : tuple
+        Absolute index-tuple of chunk in source dataset
+    sigrid : tuple
+        Relative index-tuple for (fancy) re-ordering of `ingrid` selection
+    fancy : bool
+        If `True`, fancy indexing via `sigrid` is performed
+    outshape : tuple
+        Shape of result
+    outcrop : None or slice
+        Selection of result along its first (time) axis (time-blocks of split trials)
+    outdtype : :class:`numpy.dtype`
+        Numerical type of result
+    argv : tuple
+        Positional arguments of `computeFunction` for this chunk
+    cfg : dict
+        Keyword arguments of `computeFunction`
+    profile : bool
+        If `True`, a dict holding the read and compute times, the number of 
+        bytes read, the peak resident set size and the name of the worker is 
+        returned in addition to the result
+
+    Returns
+    -------
+    res : :class:`numpy.ndarray`
+        Result of `computeFunction`
+    rec : dict
+        Profiling record of the chunk (only returned if `profile` is `True`)
+
+    Notes
+    -----
+    This routine is defined at module level to be usable by process pools.
+    Source files are opened via the handle pool of the executing process
+    (see :mod:`syncopy.shared.handle_pool`). 
+    It is purely intended for internal use. Thus, no error checking is performed.
+
+    See also
+    --------
+    ComputationalRoutine.compute_threads : multi-threaded computing kernel
+    ComputationalRoutine.compute_processes : multi-process computing kernel
+    """
+
+    # Catch empty source-array selections
+    if any([not sel for sel in ingrid]):
+        res = np.empty(outshape, dtype=outdtype)
+        return (res, {}) if profile else res
+
+    # Generic case: data is either a HDF5 dataset or memmap
+    tic = time.perf_counter()
+    if hdr is None:
+        try:
+            h5fin = workerPool.hdf5(infilename)
+            if fancy:
+                arr = read_selection(h5fin[indset], ingrid, sigrid, workerPool)
+            else:
+                arr = read_chunk(h5fin[indset], ingrid, True, workerPool)
+        except OSError:
+            try:
+                if fancy:
+                    arr = workerPool.npy(infilename)[np.ix_(*ingrid)]
+                else:
+                    arr = read_chunk(workerPool.npy(infilename), ingrid, False, workerPool)
+            except:
+                raise SPYIOError(infilename)
+
+    # For VirtualData objects
+    else:
+        idx = ingrid
+        if fancy:
+            idx = np.ix_(*ingrid)
+        dsets = []
+        for fk, fname in enumerate(infilename):
+            dsets.append(workerPool.memmap(fname, hdr[fk]["length"], hdr[fk]["dtype"],
+                                           (hdr[fk]["M"], hdr[fk]["N"]))[idx])
+        arr = np.vstack(dsets)
+
+    toc = time.perf_counter()
+    res = detach_result(computeFunction(arr, *argv, **cfg), arr)
+    if outcrop is not None:
+        res = res[outcrop]
+    if profile:
+        rec = {"read_time": toc - tic,
+               "read_bytes": int(arr.nbytes),
+               "compute_time": time.perf_counter() - toc,
+               "peak_rss": _peak_rss(),
+               "worker": _worker_name()}
+        return res, rec
+    return res
+
+
+def _put_until(q, item, abort):
+    """
+    Local helper putting `item` into queue `q` unless `abort` is set (returns
+    `False` if `item` could not be enqueued)
+    """
+    while not abort.is_set():
+        try:
+            q.put(item, timeout=0.1)
+            return True
+        except queue.Full:
+            continue
+    return False
+
+
+def _get_until(q, abort):
+    """
+    Local helper getting the next item from queue `q` unless `abort` is set
+    (returns `None` in that case)
+    """
+    while not abort.is_set():
+        try:
+            return q.get(timeout=0.1)
+        except queue.Empty:
+            continue
+    return None
+
+
+def _file_checksum(fname):
+    """
+    Local helper returning the checksum of the file `fname`
+
+    Notes
+    -----
+    If `fname` is the data file of a saved Syncopy container that has not 
+    been modified after saving, the checksum stored in its info file is 
+    returned (see :func:`syncopy.save`). Otherwise, `fname` is hashed 
+    (see :func:`syncopy.io.utils.hash_file`). 
+    """
+
+    infoFile = fname + FILE_EXT["info"]
+    try:
+        if os.path.getmtime(fname) <= os.path.getmtime(infoFile):
+            with open(infoFile, "r") as fid:
+                info = json.load(fid)
+            if info.get("checksum_algorithm") == spy.__checksum_algorithm__.__name__:
+                return info["file_checksum"]
+    except (OSError, ValueError, KeyError):
+        pass
+    return spy.io.utils.hash_file(fname)
+
+
+def _update_digest(hsh, obj):
+    """
+    Local helper feeding a (nested) Python object into the hash object `hsh`
+
+    Notes
+    -----
+    Dictionaries are processed in order of their (sorted) keys, NumPy arrays
+    via their raw bytes, callables via their qualified names and other class
+    instances via their attribute dictionaries. Anything else is represented
+    by its `repr`. This routine is purely intended for internal use. Thus, no 
+    error checking is performed.
+    """
+
+    if isinstance(obj, dict):
+        hsh.update(b"dict")
+        for key in sorted(obj.keys(), key=str):
+            _update_digest(hsh, key)
+            _update_digest(hsh, obj[key])
+    elif isinstance(obj, (list, tuple)):
+        hsh.update("{0:s}{1:d}".format(type(obj).__name__, len(obj)).encode())
+        for item in obj:
+            _update_digest(hsh, item)
+    elif isinstance(obj, np.ndarray):
+        hsh.update(str((obj.dtype.str, obj.shape)).encode())
+        if obj.dtype.hasobject:
+            _update_digest(hsh, obj.tolist())
+        else:
+            hsh.update(np.ascontiguousarray(obj).tobytes())
+    elif callable(obj) and hasattr(obj, "__qualname__"):
+        hsh.update("{0:s}.{1:s}".format(str(getattr(obj, "__module__", "")), 
+                                        obj.__qualname__).encode())
+    elif hasattr(obj, "__dict__") and not isinstance(obj, type):
+        hsh.update(type(obj).__qualname__.encode())
+        _update_digest(hsh, vars(obj))
+    else:
+        hsh.update(repr(obj).encode())
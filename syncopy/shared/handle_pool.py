@@ -0,0 +1,264 @@
+# -*- coding: utf-8 -*-
+#
+# Worker-local pool of open file handles and read buffers used by computational routines
+#
+
+# Builtin/3rd party package imports
+import threading
+import itertools
+import h5py
+import numpy as np
+from collections import OrderedDict
+from numpy.lib.format import open_memmap
+
+__all__ = []
+
+# Max. no. of hyperslab reads issued for a single fancy selection (larger 
+# selections are read via their bounding box)
+maxHyperslabReads = 256
+
+
+class HandlePool():
+    """
+    Least-recently-used pool of opened (read-only) HDF5 files and memmaps
+    and by-thread buffers for reading source data
+
+    Parameters
+    ----------
+    maxHandles : int
+        Maximal number of simultaneously opened handles. If the pool is full,
+        the least recently used handle is closed.
+
+    Notes
+    -----
+    Every process (i.e., every parallel worker) holds its own pool (see
+    `workerPool`) which is shared by all of its threads. Handles are re-used
+    across tasks processed by the same worker and are only closed once the
+    computation is done (see :func:`release_handles`). Only handles for reading
+    are pooled: HDF5 files opened for writing by one process cannot be opened
+    by other processes, hence output files are never kept open.
+
+    In addition, every thread may request a re-usable buffer for reading
+    source data (see :meth:`buffer` and :func:`read_chunk`), so that memory
+    for trial-chunks is allocated only once. Buffers are discarded together
+    with all pooled handles by :meth:`release`.
+
+    See also
+    --------
+    syncopy.shared.kwarg_decorators.unwrap_io : parallel reading of source data
+    """
+
+    def __init__(self, maxHandles=32):
+        self.maxHandles = maxHandles
+        self._handles = OrderedDict()
+        self._buffers = {}
+        self._lock = threading.Lock()
+
+    def hdf5(self, filename):
+        """
+        Get read-only :class:`h5py.File` object of `filename`
+        """
+        return self._get(("hdf5", filename), lambda: h5py.File(filename, mode="r"))
+
+    def npy(self, filename):
+        """
+        Get copy-on-write memmap of NumPy file `filename`
+        """
+        return self._get(("npy", filename), lambda: open_memmap(filename, mode="c"))
+
+    def memmap(self, filename, offset, dtype, shape):
+        """
+        Get read-only memmap of raw binary file `filename` (see :class:`numpy.memmap`)
+        """
+        key = ("raw", filename, int(offset), str(dtype), tuple(shape))
+        return self._get(key, lambda: np.memmap(filename, offset=int(offset), mode="r",
+                                                dtype=dtype, shape=tuple(shape)))
+
+    def buffer(self, shape, dtype):
+        """
+        Get array of given `shape` and `dtype` backed by the read buffer of
+        the calling thread (the buffer is enlarged if necessary)
+        """
+        nbytes = int(np.prod(shape)) * np.dtype(dtype).itemsize
+        ident = threading.get_ident()
+        with self._lock:
+            buf = self._buffers.get(ident)
+            if buf is None or buf.nbytes < nbytes:
+                buf = np.empty((nbytes,), dtype=np.uint8)
+                self._buffers[ident] = buf
+        return buf[:nbytes].view(dtype).reshape(shape)
+
+    def release(self):
+        """
+        Close all pooled handles and discard all read buffers
+        """
+        with self._lock:
+            while self._handles:
+                _, handle = self._handles.popitem(last=False)
+                _close_handle(handle)
+            self._buffers.clear()
+
+    def __len__(self):
+        return len(self._handles)
+
+    def _get(self, key, opener):
+        with self._lock:
+            if key in self._handles:
+                self._handles.move_to_end(key)
+                return self._handles[key]
+            handle = opener()
+            self._handles[key] = handle
+            while len(self._handles) > self.maxHandles:
+                _, oldest = self._handles.popitem(last=False)
+                _close_handle(oldest)
+            return handle
+
+
+def release_handles():
+    """
+    Close all handles in the pool of the calling process (`workerPool`)
+
+    Notes
+    -----
+    This routine is invoked on all parallel workers (and the calling process)
+    once a computation has finished (or failed), so that source files are not
+    kept open beyond the computation.
+    """
+    workerPool.release()
+
+
+def read_chunk(sourceObj, ingrid, isHDF, pool=None):
+    """
+    Read a trial-chunk from a HDF5 dataset or memmap with a single copy
+
+    Parameters
+    ----------
+    sourceObj : HDF5 dataset or memmap
+        Backing device of source data
+    ingrid : tuple
+        Index-tuple (slices and/or sorted lists) of chunk in `sourceObj`
+    isHDF : bool
+        If `True`, `sourceObj` is a HDF5 dataset
+    pool : None or :class:`HandlePool`
+        If provided, the chunk is read into the buffer of the calling thread
+        (see :meth:`HandlePool.buffer`), otherwise a new array is allocated
+
+    Returns
+    -------
+    arr : :class:`numpy.ndarray`
+        Source data of chunk
+
+    Notes
+    -----
+    HDF5 datasets are read via :meth:`h5py.Dataset.read_direct`, i.e., data
+    is copied from disk straight into the target array. Since the returned
+    array may be overwritten by subsequent reads of the same thread, callers
+    have to copy results that share memory with it (see :func:`detach_result`).
+    """
+
+    shape = tuple(len(range(*sel.indices(dim))) if isinstance(sel, slice) else len(sel)
+                  for sel, dim in zip(ingrid, sourceObj.shape))
+    if pool is None:
+        arr = np.empty(shape, dtype=sourceObj.dtype)
+    else:
+        arr = pool.buffer(shape, sourceObj.dtype)
+    if isHDF:
+        sourceObj.read_direct(arr, source_sel=tuple(ingrid))
+    else:
+        arr[...] = sourceObj[tuple(ingrid)]
+    return arr
+
+
+def read_selection(sourceObj, ingrid, sigrid, pool=None):
+    """
+    Read a (fancy) selection of a trial-chunk from a HDF5 dataset
+
+    Parameters
+    ----------
+    sourceObj : HDF5 dataset
+        Backing device of source data
+    ingrid : tuple
+        Tuple of slices encoding the bounding box of the selection in `sourceObj`
+        (see :attr:`~syncopy.shared.computational_routine.ComputationalRoutine.sourceLayout`)
+    sigrid : tuple
+        Tuple of index arrays relative to `ingrid` (can be unordered w/repetitions,
+        see :attr:`~syncopy.shared.computational_routine.ComputationalRoutine.sourceSelectors`)
+    pool : None or :class:`HandlePool`
+        If provided, data is read into the buffer of the calling thread
+
+    Returns
+    -------
+    arr : :class:`numpy.ndarray`
+        Selected source data, i.e., ``sourceObj[ingrid][np.ix_(*sigrid)]``
+
+    Notes
+    -----
+    Only the actually selected elements are read from disk: the (sorted,
+    unique) indices of every dimension are split up into runs of consecutive
+    indices. The dimension with the most runs is read via a single list
+    selection, all others run by run, i.e., one hyperslab is read for every
+    combination of runs of the remaining dimensions. The compact result is
+    subsequently re-ordered (and duplicated) to match `sigrid`. If this
+    requires more than `maxHyperslabReads` reads, the entire bounding box is
+    read instead.
+    """
+
+    uniques = [np.unique(sel) for sel in sigrid]
+    runs = [np.split(unq, np.where(np.diff(unq) > 1)[0] + 1) for unq in uniques]
+    listDim = int(np.argmax([len(run) for run in runs]))
+    nReads = int(np.prod([len(run) for dim, run in enumerate(runs) if dim != listDim]))
+    if nReads > maxHyperslabReads:
+        return read_chunk(sourceObj, ingrid, True, pool)[np.ix_(*sigrid)]
+
+    shape = tuple(unq.size for unq in uniques)
+    if pool is None:
+        compact = np.empty(shape, dtype=sourceObj.dtype)
+    else:
+        compact = pool.buffer(shape, sourceObj.dtype)
+
+    # Assemble source and target selections of all reads dimension by dimension
+    srcSels = []
+    dstSels = []
+    for dim, run in enumerate(runs):
+        start = ingrid[dim].start
+        if dim == listDim:
+            if run[0].size == uniques[dim].size:
+                srcSels.append([slice(start + uniques[dim][0], start + uniques[dim][-1] + 1)])
+            else:
+                srcSels.append([list(start + uniques[dim])])
+            dstSels.append([slice(None)])
+            continue
+        srcSels.append([slice(start + rn[0], start + rn[-1] + 1) for rn in run])
+        offsets = np.cumsum([0] + [rn.size for rn in run])
+        dstSels.append([slice(offsets[k], offsets[k + 1]) for k in range(len(run))])
+    for srcSel, dstSel in zip(itertools.product(*srcSels), itertools.product(*dstSels)):
+        sourceObj.read_direct(compact, source_sel=srcSel, dest_sel=dstSel)
+
+    # Re-order compact array (unless selection was sorted w/o repetitions)
+    positions = [np.searchsorted(unq, sel) for unq, sel in zip(uniques, sigrid)]
+    if all(np.array_equal(pos, np.arange(unq.size)) for pos, unq in zip(positions, uniques)):
+        return compact
+    return compact[np.ix_(*positions)]
+
+
+def detach_result(res, arr):
+    """
+    Local helper copying `res` if it shares memory with the (buffered) source
+    array `arr` it was computed from (e.g., if `res` is a view of `arr`)
+    """
+    if isinstance(res, np.ndarray) and np.may_share_memory(res, arr):
+        return np.array(res)
+    return res
+
+
+def _close_handle(handle):
+    """
+    Local helper closing HDF5 files (memmaps are closed once they are garbage
+    collected, i.e., once no more views of them are in use)
+    """
+    if isinstance(handle, h5py.File):
+        handle.close()
+
+
+# Process-wide pool used by all computational routines
+workerPool = HandlePool()
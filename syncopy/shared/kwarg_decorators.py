@@ -4,6 +4,10 @@
 #
 
 # Builtin/3rd party package imports
+import os
+import time
+import socket
+import threading
 import functools
 import h5py
 import inspect
@@ -12,12 +16,18 @@ import numpy as np
 # Local imports
 from syncopy.shared.errors import (SPYIOError, SPYTypeError, SPYValueError,
                                    SPYError, SPYWarning)
-from syncopy.shared.tools import StructDict, get_defaults
+from syncopy.shared.tools import StructDict, get_defaults, nan_partial_sum, storage_kwargs
+from syncopy.shared.profiling import _peak_rss, _worker_name
+from syncopy.shared.handle_pool import workerPool, read_chunk, read_selection, detach_result
+from syncopy.shared.computational_routine import compute_batch
 import syncopy as spy
 if spy.__dask__:
     import dask.distributed as dd
     from syncopy.acme.acme.dask_helpers import esi_cluster_setup, cluster_cleanup
 
+# Serializes writing to the shard file of the calling process (shared by all threads)
+_shardLock = threading.Lock()
+
 __all__ = []
 
 
@@ -400,7 +410,12 @@ def detect_parallel_client(func):
         `parallel` is set to `True` and updated in `func`'s keyword argument dict.
         If no client is found or dask is not available, a corresponding warning
         message is printed and `parallel` is set to `False` and updated in `func`'s
-        keyword argument dict. After successfully calling `func` with the modified
+        keyword argument dict. If several Syncopy objects are provided and
+        `parallel` is `True`, `func` is invoked for every object via
+        :func:`~syncopy.shared.computational_routine.compute_batch`, i.e., the
+        tasks of all objects are processed in a single parallel computation
+        and a list holding one result per object is returned.
+        After successfully calling `func` with the modified
         input arguments, `parallel_client_detector` modifies `func` itself:
 
         1. The "Parameters" section in the docstring of `func` is amended by an
@@ -431,8 +446,17 @@ def detect_parallel_client(func):
         # Extract `parallel` keyword: if `parallel` is `False`, nothing happens
         parallel = kwargs.get("parallel")
 
+        # Separate provided Syncopy objects from remaining positional arguments
+        objList = []
+        argList = list(args)
+        nTrials = 0
+        for arg in args:
+            if hasattr(arg, "trials"):
+                objList.append(arg)
+                nTrials = max(nTrials, len(arg.trials))
+                argList.remove(arg)
+
         # Detect if dask client is running and set `parallel` keyword accordingly
-        results = []
         cleanup = False
         if parallel is None or parallel is True:
             if spy.__dask__:
@@ -441,23 +465,12 @@ def detect_parallel_client(func):
                     parallel = True
                 except ValueError:
                     if parallel is True:
-                        objList = []
-                        argList = list(args)
-                        nTrials = 0
-                        for arg in args:
-                            if hasattr(arg, "trials"):
-                                objList.append(arg)
-                                nTrials = max(nTrials, len(arg.trials))
-                                argList.remove(arg)
                         nObs = len(objList)
                         msg = "Syncopy <{fname:s}> Launching parallel computing client " +\
                             "to process {no:d} objects..."
                         print(msg.format(fname=func.__name__, no=nObs))
                         client = esi_cluster_setup(n_jobs=nTrials, interactive=False)
                         cleanup = True
-                        if len(objList) > 1:
-                            for obj in objList:
-                                results.append(func(obj, *argList, **kwargs))
                     else:
                         parallel = False
             else:
@@ -470,22 +483,29 @@ def detect_parallel_client(func):
         # Add/update `parallel` to/in keyword args
         kwargs["parallel"] = parallel
 
-        if len(results) == 0:
-            results = func(*args, **kwargs)
-        if cleanup:
-            cluster_cleanup(client=client)
+        # Process multiple objects in a single task graph (one result per object)
+        try:
+            if parallel is True and len(objList) > 1:
+                results = compute_batch(func, objList, *argList, **kwargs)
+            else:
+                results = func(*args, **kwargs)
+        finally:
+            if cleanup:
+                cluster_cleanup(client=client)
 
         return results
 
     # Append `parallel` keyword entry to wrapped function's docstring and signature
     parallelDocEntry = \
-    "    parallel : None or bool\n" +\
+    "    parallel : None or bool or str\n" +\
     "        If `None` (recommended), processing is automatically performed in \n" +\
     "        parallel (i.e., concurrently across trials/channel-groups), provided \n" +\
     "        a dask parallel processing client is running and available. \n" +\
     "        Parallel processing can be manually disabled by setting `parallel` \n" +\
     "        to `False`. If `parallel` is `True` but no parallel processing client\n" +\
-    "        is running, computing will be performed sequentially. \n"
+    "        is running, computing will be performed sequentially. If `parallel`\n" +\
+    "        is 'threads' or 'processes', a pool of local threads or processes\n" +\
+    "        is used that does not require a dask client. \n"
     parallel_client_detector.__doc__ = _append_docstring(func, parallelDocEntry)
     parallel_client_detector.__signature__ = _append_signature(func, "parallel")
 
@@ -515,8 +535,14 @@ def unwrap_io(func):
           :meth:`~syncopy.shared.computational_routine.ComputationalRoutine.compute_parallel`
           and contains information for parallel workers (particularly, paths and
           dataset indices of HDF5 files for reading source data and writing results).
+          Every dict represents a task comprising one or more trial-chunks that are
+          processed consecutively by the same worker.
           Nothing is returned (the output of the wrapped `computeFunction` is
-          directly written to disk).
+          directly written to disk) unless trials are averaged: then a NaN-aware
+          in-memory sum of all results of the task is returned (see
+          :func:`~syncopy.shared.tools.nan_partial_sum`). If profiling was
+          requested, a tuple is returned whose second element is a list of
+          per-chunk profiling records (see :mod:`syncopy.shared.profiling`).
         * `trl_dat` : :class:`numpy.ndarray` or :class:`~syncopy.datatype.base_data.FauxTrial` object
           Wrapped `computeFunction` is executed sequentially (either during dry-
           run phase or in purely sequential computations); `trl_dat` is directly
@@ -539,12 +565,31 @@ def unwrap_io(func):
     HDF5 files (virtual sources) that are consolidated into a single
     :class:`h5py.VirtualLayout` which is subsequently used to allocate a virtual
     dataset inside a newly created HDF5 file (located in Syncopy's temporary
-    storage folder).
+    storage folder). If sharded storage was requested (``trl_dat["sharded"]``),
+    every worker process instead appends all of its results to its own shard
+    file (see :func:`_shard_filename`), one dataset per trial-chunk.
 
     Conversely, in case of sequential writing, each resulting array is written
     sequentially to an existing single output HDF5 file using  a distributed mutex
     for access control to prevent write collisions.
 
+    If trials are averaged (``keeptrials = False``), nothing is written to disk
+    by the workers. Instead, the (small) partial sums of all tasks are combined
+    in a tree reduction by
+    :meth:`~syncopy.shared.computational_routine.ComputationalRoutine.compute_parallel`.
+
+    Positional arguments that are identical for all trials (listed in
+    ``trl_dat["shared"]``) are not grouped by task but passed on as is, i.e.,
+    they are scattered across the cluster only once.
+
+    Source files are not opened anew for every task: every worker keeps
+    a pool of opened (read-only) HDF5 files and memmaps that is re-used
+    across tasks and only cleared once the computation is done (see
+    :mod:`syncopy.shared.handle_pool`). If a task comprises several
+    trial-chunks, chunks that tile a common hyperslab are read from disk in a single
+    operation. All results of a task are written in one go (acquiring the
+    mutex only once in case of sequential writing).
+
     See also
     --------
     unwrap_cfg : Decorator for processing `cfg` "structs"
@@ -559,44 +604,88 @@ def unwrap_io(func):
             return func(trl_dat, *wrkargs, **kwargs)
 
         # The fun part: `trl_dat` is a dictionary holding components for parallelization
+        # of a task comprising one or more (neighboring) trial-chunks
         hdr = trl_dat["hdr"]
         keeptrials = trl_dat["keeptrials"]
         infilename = trl_dat["infile"]
         indset = trl_dat["indset"]
-        ingrid = trl_dat["ingrid"]
-        sigrid = trl_dat["sigrid"]
+        ingrids = trl_dat["ingrid"]
+        sigrids = trl_dat["sigrid"]
         fancy = trl_dat["fancy"]
         vdsdir = trl_dat["vdsdir"]
         outfilename = trl_dat["outfile"]
-        outdset = trl_dat["outdset"]
-        outgrid = trl_dat["outgrid"]
-        outshape = trl_dat["outshape"]
+        outdsets = trl_dat["outdset"]
+        outgrids = trl_dat["outgrid"]
+        outshapes = trl_dat["outshape"]
+        outcrops = trl_dat["outcrop"]
         outdtype = trl_dat["dtype"]
+        profile = trl_dat["profile"]
+        sharedArgs = trl_dat["shared"]
+        storage = trl_dat["storage"]
+
+        # If requested, keep track of timings and memory usage of every chunk
+        records = [{"chunk": chk, "read_time": 0.0, "read_bytes": 0, "compute_time": 0.0,
+                    "write_time": 0.0, "peak_rss": 0, "worker": _worker_name() if profile else ""}
+                   for chk in trl_dat["chunks"]]
+
+        # === STEP 1 === open data source (handles are kept open by the worker
+        # and re-used by subsequent tasks, see `syncopy.shared.handle_pool`)
+        # Generic case: data is either a HDF5 dataset or memmap
+        isHDF = False
+        if hdr is None:
+            try:
+                sourceObj = workerPool.hdf5(infilename)[indset]
+                isHDF = True
+            except OSError:
+                try:
+                    sourceObj = workerPool.npy(infilename)
+                except:
+                    raise SPYIOError(infilename)
+            except Exception as exc:
+                raise exc
+
+        # If the chunks of this task tile a common hyperslab, read it in one go
+        block = None
+        blockgrid = None
+        if hdr is None and not fancy and len(ingrids) > 1:
+            blockgrid = _bounding_hyperslab(ingrids)
+            if blockgrid is not None:
+                tic = time.perf_counter()
+                block = read_chunk(sourceObj, blockgrid, isHDF, workerPool)
+                blockTime = time.perf_counter() - tic
+                for rec in records:
+                    rec["read_time"] += blockTime / len(records)
+
+        results = []
+        for ck, ingrid in enumerate(ingrids):
+            sigrid = sigrids[ck]
+            chkargs = tuple(arg if ak in sharedArgs else arg[ck]
+                            for ak, arg in enumerate(wrkargs))
+
+            # === STEP 2 === read data into memory
+            # Catch empty source-array selections; this workaround is not
+            # necessary for h5py version 2.10+ (see https://github.com/h5py/h5py/pull/1174)
+            if any([not sel for sel in ingrid]):
+                results.append(np.empty(outshapes[ck], dtype=outdtype))
+                continue
+
+            # Chunk is part of an already loaded hyperslab
+            tic = time.perf_counter()
+            if block is not None:
+                arr = block[_relative_grid(ingrid, blockgrid)]
 
-        # === STEP 1 === read data into memory
-        # Catch empty source-array selections; this workaround is not
-        # necessary for h5py version 2.10+ (see https://github.com/h5py/h5py/pull/1174)
-        if any([not sel for sel in ingrid]):
-            res = np.empty(outshape, dtype=outdtype)
-        else:
             # Generic case: data is either a HDF5 dataset or memmap
-            if hdr is None:
-                try:
-                    with h5py.File(infilename, mode="r") as h5fin:
-                        if fancy:
-                            arr = np.array(h5fin[indset][ingrid])[np.ix_(*sigrid)]
-                        else:
-                            arr = np.array(h5fin[indset][ingrid])
-                except OSError:
-                    try:
-                        if fancy:
-                            arr = open_memmap(infilename, mode="c")[np.ix_(*ingrid)]
-                        else:
-                            arr = np.array(open_memmap(infilename, mode="c")[ingrid])
-                    except:
-                        raise SPYIOError(infilename)
-                except Exception as exc:
-                    raise exc
+            elif hdr is None:
+                if isHDF:
+                    if fancy:
+                        arr = read_selection(sourceObj, ingrid, sigrid, workerPool)
+                    else:
+                        arr = read_chunk(sourceObj, ingrid, isHDF, workerPool)
+                else:
+                    if fancy:
+                        arr = sourceObj[np.ix_(*ingrid)]
+                    else:
+                        arr = read_chunk(sourceObj, ingrid, isHDF, workerPool)
 
             # For VirtualData objects
             else:
@@ -605,43 +694,91 @@ def unwrap_io(func):
                     idx = np.ix_(*ingrid)
                 dsets = []
                 for fk, fname in enumerate(infilename):
-                    dsets.append(np.memmap(fname, offset=int(hdr[fk]["length"]),
-                                            mode="r", dtype=hdr[fk]["dtype"],
-                                            shape=(hdr[fk]["M"], hdr[fk]["N"]))[idx])
+                    dsets.append(workerPool.memmap(fname, hdr[fk]["length"], hdr[fk]["dtype"],
+                                                   (hdr[fk]["M"], hdr[fk]["N"]))[idx])
                 arr = np.vstack(dsets)
 
-            # === STEP 2 === perform computation
-            # Now, actually call wrapped function
-            res = func(arr, *wrkargs, **kwargs)
-
-        # === STEP 3 === write result to disk
-        # Write result to multiple stand-alone HDF files or use a mutex to write to a
-        # common single file (sequentially)
-        if vdsdir is not None:
+            toc = time.perf_counter()
+            records[ck]["read_time"] += toc - tic
+            records[ck]["read_bytes"] = int(arr.nbytes)
+
+            # === STEP 3 === perform computation
+            # Now, actually call wrapped function (source data is held in a 
+            # re-usable buffer, so results must not reference it)
+            res = func(arr, *chkargs, **kwargs)
+            res = detach_result(res, block if block is not None else arr)
+
+            # Discard overlap of time-blocks of split trials
+            if outcrops[ck] is not None:
+                res = res[outcrops[ck]]
+            results.append(res)
+            records[ck]["compute_time"] = time.perf_counter() - toc
+            if profile:
+                records[ck]["peak_rss"] = _peak_rss()
+
+        # === STEP 4 === write results to disk
+        # If trials are averaged, return the NaN-aware sum of this task (no writing
+        # necessary, partial sums are combined by the caller)
+        if not keeptrials:
+            trialSum = None
+            for res in results:
+                trialSum = nan_partial_sum(res, trialSum)
+            return (trialSum, records) if profile else trialSum
+
+        # Write results to a stand-alone HDF file (part of a virtual dataset) or 
+        # use a mutex to write to a common single file (sequentially)
+        tic = time.perf_counter()
+        if vdsdir is not None and trl_dat["sharded"]:
+            with _shardLock:
+                with h5py.File(_shard_filename(vdsdir), "a") as h5fout:
+                    for ck, res in enumerate(results):
+                        if outdsets[ck] in h5fout:
+                            del h5fout[outdsets[ck]]
+                        h5fout.create_dataset(outdsets[ck], data=res,
+                                              **storage_kwargs(storage, res.shape, res.dtype,
+                                                               res.shape))
+                    h5fout.flush()
+        elif vdsdir is not None:
             with h5py.File(outfilename, "w") as h5fout:
-                h5fout.create_dataset(outdset, data=res)
+                for ck, res in enumerate(results):
+                    h5fout.create_dataset(outdsets[ck], data=res,
+                                          **storage_kwargs(storage, res.shape, res.dtype,
+                                                           res.shape))
                 h5fout.flush()
         else:
 
             # Create distributed lock (use unique name so it's synced across workers)
             lock = dd.lock.Lock(name='sequential_write')
 
-            # Either (continue to) compute average or write current chunk
+            # Write current chunks
             lock.acquire()
             with h5py.File(outfilename, "r+") as h5fout:
-                target = h5fout[outdset]
-                if keeptrials:
-                    target[outgrid] = res
-                else:
-                    target[()] = np.nansum([target, res], axis=0)
+                target = h5fout[outdsets[0]]
+                for ck, res in enumerate(results):
+                    target[outgrids[ck]] = res
                 h5fout.flush()
             lock.release()
 
-        return None # result has already been written to disk
+        # Attribute time spent writing (and waiting for the mutex) evenly to all chunks
+        writeTime = time.perf_counter() - tic
+        for rec in records:
+            rec["write_time"] = writeTime / len(records)
+
+        # Results have already been written to disk
+        return (None, records) if profile else None
 
     return wrapper_io
 
 
+def _shard_filename(vdsdir):
+    """
+    Local helper returning the name of the shard file in `vdsdir` the calling
+    process appends its results to (unique for every host and process)
+    """
+    host = "".join(c if c.isalnum() else "-" for c in socket.gethostname())
+    return os.path.join(vdsdir, "shard_{0:s}_{1:d}.h5".format(host, os.getpid()))
+
+
 def _append_docstring(func, supplement, insert_in="Parameters", at_end=True):
     """
     Local helper to automate text insertions in docstrings
@@ -772,3 +909,85 @@ def _append_signature(func, kwname, kwdefault=None):
             paramList.append(keyword)
         newSignature = inspect.Signature(parameters=paramList)
     return newSignature
+
+
+def _bounding_hyperslab(grids):
+    """
+    Local helper to compute a common hyperslab covering several index-tuples
+
+    Parameters
+    ----------
+    grids : list
+        List of index-tuples (as stored in
+        :attr:`~syncopy.shared.computational_routine.ComputationalRoutine.sourceLayout`)
+
+    Returns
+    -------
+    blockgrid : tuple or None
+        Tuple of slices encoding the smallest hyperslab containing all of
+        `grids`. If `grids` contain non-slice indices or the hyperslab
+        comprises more elements than `grids` combined (e.g., due to gaps
+        between trials), `None` is returned.
+
+    Notes
+    -----
+    This routine is a local auxiliary method that is purely intended for internal
+    use. Thus, no error checking is performed.
+
+    See also
+    --------
+    unwrap_io : uses this routine to read the source data of batched tasks
+    """
+
+    blockgrid = []
+    extents = []
+    blockVolume = 1
+    for sels in zip(*grids):
+        if not all(isinstance(sel, slice) and sel.step in (None, 1) for sel in sels):
+            return None
+        if all(sel == sels[0] for sel in sels):
+            blockgrid.append(sels[0])
+            continue
+        if any(sel.start is None or sel.stop is None for sel in sels):
+            return None
+        start = min(sel.start for sel in sels)
+        stop = max(sel.stop for sel in sels)
+        blockgrid.append(slice(start, stop))
+        extents.append([sel.stop - sel.start for sel in sels])
+        blockVolume *= stop - start
+
+    # Only use the hyperslab if it does not contain (much) unused data
+    if extents and blockVolume > sum(np.prod(ext) for ext in zip(*extents)):
+        return None
+    return tuple(blockgrid)
+
+
+def _relative_grid(grid, blockgrid):
+    """
+    Local helper to convert absolute indices to indices relative to a hyperslab
+
+    Parameters
+    ----------
+    grid : tuple
+        Index-tuple of slices (absolute wrt to source dataset)
+    blockgrid : tuple
+        Hyperslab containing `grid` as computed by :func:`_bounding_hyperslab`
+
+    Returns
+    -------
+    relgrid : tuple
+        Tuple of slices for extracting `grid` from an array holding `blockgrid`
+
+    Notes
+    -----
+    This routine is a local auxiliary method that is purely intended for internal
+    use. Thus, no error checking is performed.
+    """
+
+    relgrid = []
+    for sel, blk in zip(grid, blockgrid):
+        if sel == blk:
+            relgrid.append(slice(None))
+        else:
+            relgrid.append(slice(sel.start - blk.start, sel.stop - blk.start))
+    return tuple(relgrid)
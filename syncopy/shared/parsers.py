@@ -221,6 +221,85 @@ def scalar_parser(var, varname="", ntype=None, lims=None):
     return
 
 
+def storage_parser(storage, varname="storage"):
+    """
+    Parse HDF5 storage options (chunking and compression)
+
+    Parameters
+    ----------
+    storage : None or dict
+        Storage options overriding the package-wide defaults in 
+        ``syncopy.__storageopts__``. Valid keys are 
+
+        * `"chunks"` : `None` (contiguous layout unless compression is used), 
+          `True` (chunk shape chosen by h5py), `"trials"` (chunks aligned with 
+          trials and channel-blocks) or a tuple of positive integers
+        * `"compression"` : `None`, `"lzf"` or `"gzip"`
+        * `"compression_opts"` : `None` or compression level (0-9) of `"gzip"`
+        * `"shuffle"` : bool, if `True` the HDF5 shuffle filter is applied 
+          before compression (usually improves compression of numeric data)
+
+        If `storage` is `None`, the package-wide defaults are used. 
+    varname : str
+        Local variable name used in caller
+
+    Returns
+    -------
+    opts : dict
+        Complete set of (validated) storage options
+
+    Examples
+    --------
+    Store spectra compressed by `"lzf"` with trial-aligned chunks 
+
+    >>> opts = storage_parser({"chunks": "trials", "compression": "lzf", "shuffle": True})
+
+    Change the package-wide default
+
+    >>> spy.__storageopts__["compression"] = "gzip"
+
+    See also
+    --------
+    syncopy.shared.tools.storage_kwargs : convert options to :meth:`h5py.Group.create_dataset` keywords
+    """
+
+    import syncopy as spy
+    opts = dict(spy.__storageopts__)
+    if storage is not None:
+        if not isinstance(storage, dict):
+            raise SPYTypeError(storage, varname=varname, expected="dict or None")
+        invalid = set(storage.keys()).difference(opts.keys())
+        if invalid:
+            lgl = "storage options " + ", ".join("'" + key + "'" for key in opts.keys())
+            raise SPYValueError(legal=lgl, varname=varname, actual=str(sorted(invalid)))
+        opts.update(storage)
+
+    chunks = opts["chunks"]
+    if isinstance(chunks, (list, tuple)):
+        if not all(isinstance(c, numbers.Integral) and c > 0 for c in chunks):
+            lgl = "tuple of positive integers"
+            raise SPYValueError(legal=lgl, varname=varname + "['chunks']", actual=str(chunks))
+        opts["chunks"] = tuple(int(c) for c in chunks)
+    elif chunks not in [None, True, "trials"]:
+        lgl = "None, True, 'trials' or tuple of positive integers"
+        raise SPYValueError(legal=lgl, varname=varname + "['chunks']", actual=str(chunks))
+    if opts["compression"] not in [None, "lzf", "gzip"]:
+        lgl = "None, 'lzf' or 'gzip'"
+        raise SPYValueError(legal=lgl, varname=varname + "['compression']",
+                            actual=str(opts["compression"]))
+    if opts["compression_opts"] is not None:
+        if opts["compression"] != "gzip":
+            lgl = "compression level only for 'gzip' compression"
+            raise SPYValueError(legal=lgl, varname=varname + "['compression_opts']",
+                                actual=str(opts["compression_opts"]))
+        scalar_parser(opts["compression_opts"], varname=varname + "['compression_opts']",
+                      ntype="int_like", lims=[0, 9])
+        opts["compression_opts"] = int(opts["compression_opts"])
+    if not isinstance(opts["shuffle"], bool):
+        raise SPYTypeError(opts["shuffle"], varname=varname + "['shuffle']", expected="bool")
+    return opts
+
+
 def array_parser(var, varname="", ntype=None, hasinf=None, hasnan=None,
                  lims=None, dims=None, issorted=None):
     """
@@ -0,0 +1,284 @@
+# -*- coding: utf-8 -*-
+#
+# Fusing several computational routines into a single compute class
+#
+
+# Builtin/3rd party package imports
+import numpy as np
+
+# Local imports
+from .computational_routine import ComputationalRoutine
+from .kwarg_decorators import unwrap_io
+from .errors import SPYValueError, SPYTypeError
+
+__all__ = []
+
+
+@unwrap_io
+def fused_pipeline(trl_dat, *argv, stages=(), noCompute=False, chunkShape=None):
+    """
+    Apply the compute kernels of several compute classes to a single trial
+
+    Parameters
+    ----------
+    trl_dat : :class:`numpy.ndarray` or :class:`~syncopy.datatype.base_data.FauxTrial`
+        Numerical data from a single trial
+    *argv : tuple
+        Positional arguments of all stages (concatenated in order of `stages`)
+    stages : tuple
+        Tuple of ``(computeFunction, nArgs, cfg)`` triplets, one for each stage,
+        where `nArgs` is the number of positional arguments of the stage and
+        `cfg` holds its keyword arguments
+    noCompute : bool
+        Preprocessing flag. If `True`, do not perform actual calculation but
+        instead return expected shape and :class:`numpy.dtype` of output
+        array.
+    chunkShape : None or tuple
+        If not `None`, represents shape of output of the last stage
+
+    Returns
+    -------
+    res : :class:`numpy.ndarray`
+        Result of the last stage
+
+    Notes
+    -----
+    This method is intended to be used as
+    :meth:`~syncopy.shared.computational_routine.ComputationalRoutine.computeFunction`
+    inside a :class:`ComputationalPipeline`. Intermediate results are only
+    held in memory and passed on directly to the next stage. In the dry-run
+    phase (``noCompute = True``), shapes are propagated through all stages
+    (see :func:`_dry_run_stages`).
+
+    See also
+    --------
+    ComputationalPipeline : compute class that calls this method
+    """
+
+    if noCompute:
+        return _dry_run_stages(trl_dat, argv, stages)[-1]
+
+    res = trl_dat
+    pos = 0
+    for func, nArgs, cfg in stages:
+        res = func(res, *argv[pos : pos + nArgs], **cfg)
+        pos += nArgs
+    return res
+
+
+class ComputationalPipeline(ComputationalRoutine):
+    """
+    Compute class fusing several compute classes into a single computation
+
+    Parameters
+    ----------
+    *routines : :class:`~syncopy.shared.computational_routine.ComputationalRoutine` instances
+        Not yet initialized compute classes in order of application, e.g.,
+        a filter followed by a time-frequency analysis
+    dimords : None or list
+        Dimensional order of the results of all but the last stage. If `None`,
+        intermediate results are assumed to have the same dimensional order as
+        the input of the pipeline.
+
+    Notes
+    -----
+    Usually, every compute class writes its entire result to disk before
+    the next one can start processing it. A pipeline instead composes the
+    :meth:`computeFunction` of all provided compute classes into a single
+    kernel (:func:`fused_pipeline`) that processes one trial at a time. Thus,
+    intermediate results are never written to disk. Only the result of the
+    last stage is stored.
+
+    Meta-data is attached by invoking the `process_metadata` methods of all
+    stages in order: the first stage receives the input object, all other
+    stages receive a placeholder holding the meta-data of their predecessor.
+
+    Channel-block parallelization and trial-averaging are supported as long as
+    they are supported by all stages (intermediate stages never average trials).
+
+    Examples
+    --------
+    >>> pipeline = ComputationalPipeline(LowPassFilter(b, a=a), MovingAverage(width=21))
+    >>> pipeline.initialize(data)
+    >>> out = spy.AnalogData()
+    >>> pipeline.compute(data, out)
+
+    See also
+    --------
+    syncopy.shared.computational_routine.ComputationalRoutine : base class of all compute classes
+    """
+
+    computeFunction = staticmethod(fused_pipeline)
+
+    def __init__(self, *routines, dimords=None):
+
+        # Ensure we actually got something to fuse
+        if len(routines) == 0:
+            lgl = "at least one compute class"
+            raise SPYValueError(legal=lgl, varname="routines", actual="nothing")
+        for routine in routines:
+            if not isinstance(routine, ComputationalRoutine):
+                raise SPYTypeError(routine, varname="routines",
+                                   expected="ComputationalRoutine instance")
+        if dimords is not None:
+            if not isinstance(dimords, (list, tuple)) or len(dimords) != len(routines) - 1:
+                lgl = "list of dimensional orders of all but the last stage"
+                act = str(dimords)
+                raise SPYValueError(legal=lgl, varname="dimords", actual=act)
+
+        # Concatenate positional arguments of all stages and collect their kernels
+        argv = []
+        stages = []
+        for routine in routines:
+            cfg = {key: value for key, value in routine.cfg.items()
+                   if key not in ["noCompute", "chunkShape"]}
+            stages.append((routine.computeFunction, len(routine.argv), cfg))
+            argv += routine.argv
+        super().__init__(*argv, stages=tuple(stages))
+
+        # list of fused compute classes
+        self.routines = list(routines)
+
+        # list of dimensional orders of intermediate results (`None` if unknown)
+        self.dimords = dimords
+
+    def initialize(self, data, chan_per_worker=None, keeptrials=True, mem_thresh=None):
+        """
+        Perform dry-run of all stages to determine output shapes
+
+        Parameters
+        ----------
+        data : syncopy data object
+           Syncopy data object to be processed
+        chan_per_worker : None or int or "auto"
+           Number of channels to be processed by each worker (see
+           :meth:`~syncopy.shared.computational_routine.ComputationalRoutine.initialize`)
+        keeptrials : bool
+            Flag indicating whether to return individual trials or average
+        mem_thresh : None or float
+           Fraction of available (worker) memory a single result may occupy (see
+           :meth:`~syncopy.shared.computational_routine.ComputationalRoutine.initialize`)
+
+        Returns
+        -------
+        Nothing : None
+
+        Notes
+        -----
+        In addition to the preparations performed for regular compute classes,
+        the output geometry of every stage is determined and attached to the
+        respective stage (for use in its `process_metadata` method).
+
+        See also
+        --------
+        syncopy.shared.computational_routine.ComputationalRoutine.initialize : dry-run of regular compute classes
+        """
+
+        super().initialize(data, chan_per_worker=chan_per_worker, keeptrials=keeptrials,
+                           mem_thresh=mem_thresh)
+
+        # Propagate shapes of all trials through all stages
+        stages = self.cfg["stages"]
+        stageShapes = [[] for stage in stages]
+        stageDtypes = [[] for stage in stages]
+        for tk, trialno in enumerate(self.trialList):
+            trlArg = tuple(arg[tk] for arg in self.argv)
+            dryRun = _dry_run_stages(data._preview_trial(trialno), trlArg, stages)
+            for sk, (shape, dtype) in enumerate(dryRun):
+                stageShapes[sk].append(list(shape))
+                stageDtypes[sk].append(dtype)
+
+        # Only the last stage averages across trials
+        nStages = len(self.routines)
+        for sk, routine in enumerate(self.routines):
+            chk_arr = np.array(stageShapes[sk])
+            routine.keeptrials = keeptrials if sk == nStages - 1 else True
+            routine.trialList = self.trialList
+            routine.outputShape = (chk_arr[:, 0].sum(),) + tuple(chk_arr.max(axis=0)[1:])
+            routine.cfg["chunkShape"] = tuple(chk_arr.max(axis=0))
+            routine.dtype = np.dtype(stageDtypes[sk][0])
+        self.routines[-1].outputShape = self.outputShape
+
+    def process_metadata(self, data, out):
+
+        # Chain meta-data of all stages via placeholders
+        src = data
+        for sk, routine in enumerate(self.routines):
+            if sk < len(self.routines) - 1:
+                if self.dimords is not None:
+                    dimord = self.dimords[sk]
+                else:
+                    dimord = data.dimord
+                dst = _StageMetadata(dimord)
+            else:
+                dst = out
+            routine.process_metadata(src, dst)
+            src = dst
+
+    def write_log(self, data, out, log_dict=None):
+        """
+        Processing of output log (see
+        :meth:`~syncopy.shared.computational_routine.ComputationalRoutine.write_log`):
+        the log lists all stages, `out.cfg` holds the settings of all stages
+        """
+
+        if log_dict is None:
+            log_dict = {"stages": " -> ".join(routine.computeFunction.__name__
+                                              for routine in self.routines)}
+        super().write_log(data, out, log_dict=log_dict)
+
+    def _output_cfg(self):
+        stageCfgs = []
+        for routine in self.routines:
+            cfg = routine._output_cfg()
+            cfg["computeFunction"] = routine.computeFunction.__name__
+            stageCfgs.append(cfg)
+        return {"stages": stageCfgs}
+
+
+class _StageMetadata():
+    """
+    Local helper class holding the meta-data of an intermediate result of a
+    :class:`ComputationalPipeline` (emulates the attributes of Syncopy data
+    objects accessed in `process_metadata` methods)
+    """
+
+    def __init__(self, dimord):
+        self.dimord = list(dimord)
+        self._selection = None
+        self._trialdefinition = None
+
+    @property
+    def trialdefinition(self):
+        return np.array(self._trialdefinition)
+
+    @trialdefinition.setter
+    def trialdefinition(self, trl):
+        self._trialdefinition = np.array(trl)
+
+    @property
+    def sampleinfo(self):
+        return self.trialdefinition[:, :2]
+
+    @property
+    def _t0(self):
+        return self.trialdefinition[:, 2]
+
+
+def _dry_run_stages(trial, argv, stages):
+    """
+    Local helper propagating a :class:`~syncopy.datatype.base_data.FauxTrial`
+    through all `stages` of a pipeline (see :func:`fused_pipeline`). Returns a
+    list of ``(shape, dtype)`` tuples, one for each stage. Intermediate results
+    are represented by `FauxTrial` objects of the respective shape and type.
+    """
+
+    dryRun = []
+    pos = 0
+    for func, nArgs, cfg in stages:
+        shape, dtype = func(trial, *argv[pos : pos + nArgs], noCompute=True, **cfg)
+        pos += nArgs
+        dryRun.append((tuple(shape), dtype))
+        trial = trial.__class__(shape, [slice(0, n) for n in shape], dtype,
+                                [None] * len(shape))
+    return dryRun
@@ -0,0 +1,176 @@
+# -*- coding: utf-8 -*-
+#
+# Instrumentation of computational routines
+#
+
+# Builtin/3rd party package imports
+import os
+import sys
+import csv
+import json
+import socket
+import threading
+import psutil
+import numpy as np
+try:
+    import resource
+except ImportError:     # not available on Windows
+    resource = None
+
+# Local imports
+from syncopy import __dask__
+from syncopy.shared.errors import SPYValueError, SPYTypeError, SPYIOError
+if __dask__:
+    import dask.distributed as dd
+
+__all__ = ["export_profile"]
+
+# Columns of per-chunk profiling records (in order of appearance in CSV files)
+profileFields = ["chunk", "trial", "worker", "read_time", "read_bytes",
+                 "compute_time", "write_time", "peak_rss"]
+
+# Chunks taking longer than `stragglerFactor` times the median are considered stragglers
+stragglerFactor = 2.0
+
+
+def summarize_profile(records, wallTime):
+    """
+    Aggregate per-chunk profiling records of a computation
+
+    Parameters
+    ----------
+    records : list
+        List of dicts, one for each processed trial-chunk, with keys given by
+        `profileFields` (missing entries are set to 0)
+    wallTime : float
+        Wall-clock duration (in seconds) of the entire computation
+
+    Returns
+    -------
+    profile : dict
+        Dictionary holding the (sorted) per-chunk records (key `"chunks"`),
+        totals of all timings and read bytes, the maximal peak resident
+        set size (in bytes) of all involved workers, the fraction of time
+        spent in I/O (`"io_fraction"`) and the indices of straggling chunks
+        (`"stragglers"`, chunks that took more than `stragglerFactor` times as
+        long as the median chunk).
+
+    Notes
+    -----
+    All timings are given in seconds. The per-chunk timings are summed up,
+    i.e., in concurrent computations the totals usually exceed `"wall_time"`.
+
+    See also
+    --------
+    export_profile : write profiling results to disk
+    """
+
+    chunks = []
+    for rec in sorted(records, key=lambda rec: rec["chunk"]):
+        chunks.append({key: rec.get(key, 0) for key in profileFields})
+    profile = {"chunks": chunks, "wall_time": float(wallTime)}
+    for key in ["read_time", "compute_time", "write_time"]:
+        profile[key] = float(sum(rec[key] for rec in chunks))
+    profile["read_bytes"] = int(sum(rec["read_bytes"] for rec in chunks))
+    profile["peak_rss"] = int(max([rec["peak_rss"] for rec in chunks], default=0))
+    totalTime = profile["read_time"] + profile["compute_time"] + profile["write_time"]
+    ioTime = profile["read_time"] + profile["write_time"]
+    profile["io_fraction"] = float(ioTime / totalTime) if totalTime > 0 else 0.0
+    chunkTimes = np.array([rec["read_time"] + rec["compute_time"] + rec["write_time"]
+                           for rec in chunks])
+    stragglers = []
+    if chunkTimes.size > 1:
+        limit = stragglerFactor * np.median(chunkTimes)
+        stragglers = [rec["chunk"] for rec, ctime in zip(chunks, chunkTimes)
+                      if ctime > limit]
+    profile["stragglers"] = stragglers
+    return profile
+
+
+def export_profile(profile, filename):
+    """
+    Export profiling results of a computation as JSON or CSV file
+
+    Parameters
+    ----------
+    profile : dict or Syncopy data object
+        Profiling summary as stored in ``out.cfg["profile"]`` by computations
+        performed with ``profile=True`` or the resulting data object itself
+    filename : str
+        Name of file to create. If `filename` ends in ".json", the entire
+        summary is written. If it ends in ".csv", a table with one row per
+        processed trial-chunk is created.
+
+    Returns
+    -------
+    Nothing : None
+
+    Examples
+    --------
+    >>> spec = spy.freqanalysis(data, method="mtmfft", profile=True)
+    >>> spy.export_profile(spec, "mtmfft_profile.csv")
+
+    See also
+    --------
+    syncopy.shared.computational_routine.ComputationalRoutine.compute : generate profiles
+    """
+
+    # If a data object was provided, use the most recent profile in its history
+    if not isinstance(profile, dict):
+        cfg = getattr(profile, "cfg", None)
+        found = None
+        while isinstance(cfg, dict):
+            found = cfg.get("profile", found)
+            cfg = cfg.get("cfg")
+        if found is None:
+            raise SPYTypeError(profile, varname="profile",
+                               expected="profiling dict or Syncopy object computed with `profile=True`")
+        profile = found
+    if "chunks" not in profile.keys():
+        lgl = "profiling summary with per-chunk records"
+        raise SPYValueError(legal=lgl, varname="profile", actual=str(list(profile.keys())))
+
+    if not isinstance(filename, str):
+        raise SPYTypeError(filename, varname="filename", expected="str")
+    ext = os.path.splitext(filename)[1].lower()
+    if ext not in [".json", ".csv"]:
+        lgl = "filename ending in '.json' or '.csv'"
+        raise SPYValueError(legal=lgl, varname="filename", actual=filename)
+
+    try:
+        with open(filename, "w", newline="") as fid:
+            if ext == ".json":
+                json.dump(profile, fid, indent=4)
+            else:
+                writer = csv.DictWriter(fid, fieldnames=profileFields)
+                writer.writeheader()
+                writer.writerows(profile["chunks"])
+    except OSError:
+        raise SPYIOError(filename)
+
+
+def _peak_rss():
+    """
+    Local helper returning the peak resident set size (in bytes) of the
+    calling process (current resident set size if not available)
+    """
+    if resource is None:
+        return int(psutil.Process().memory_info().rss)
+    maxrss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    if sys.platform == "darwin":
+        return int(maxrss)
+    return int(maxrss) * 1024
+
+
+def _worker_name():
+    """
+    Local helper identifying the calling worker (name of dask worker or
+    host, process ID and thread name otherwise)
+    """
+    if __dask__:
+        try:
+            return str(dd.get_worker().name)
+        except ValueError:
+            pass
+    return "{0:s}:{1:d}:{2:s}".format(socket.gethostname(), os.getpid(),
+                                      threading.current_thread().name)
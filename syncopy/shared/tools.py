@@ -12,6 +12,9 @@ from syncopy.shared.errors import SPYValueError, SPYWarning, SPYTypeError
 
 __all__ = ["StructDict", "get_defaults"]
 
+# Upper bound (in bytes) of trial-aligned HDF5 chunks (see `storage_kwargs`)
+maxChunkBytes = 1024**2
+
 
 class StructDict(dict):
     """Child-class of dict for emulating MATLAB structs
@@ -197,3 +200,177 @@ def get_defaults(obj):
     return StructDict(dct)
 
 
+def storage_kwargs(opts, shape, dtype, blockShape=None):
+    """
+    Convert storage options to keywords of :meth:`h5py.Group.create_dataset`
+
+    Parameters
+    ----------
+    opts : dict
+        Storage options as returned by :func:`~syncopy.shared.parsers.storage_parser`
+    shape : tuple
+        Shape of dataset to be created
+    dtype : :class:`numpy.dtype`
+        Data type of dataset to be created
+    blockShape : None or tuple
+        Shape of the largest unit of data that is written (or read) in one go, 
+        e.g., a trial or trial-channel-block. Only used if ``opts["chunks"]``
+        is `"trials"` (if `None`, h5py chooses the chunk shape). 
+
+    Returns
+    -------
+    kwargs : dict
+        Keywords `chunks`, `compression`, `compression_opts` and `shuffle` 
+        (only if applicable, i.e., an empty dict yields a contiguous dataset)
+
+    Notes
+    -----
+    Trial-aligned chunks start out as `blockShape` and are halved along their
+    longest dimension until they are no larger than `maxChunkBytes` (HDF5 
+    reads and decompresses entire chunks, i.e., overly large chunks slow down 
+    accessing small selections). Explicitly provided chunk shapes are clipped 
+    to `shape`. Empty datasets are always stored contiguously. 
+    """
+
+    kwargs = {}
+    if int(np.prod(shape)) == 0:
+        return kwargs
+    chunks = opts["chunks"]
+    if chunks == "trials":
+        chunks = True
+        if blockShape is not None:
+            chunks = [max(1, min(int(b), int(s))) for b, s in zip(blockShape, shape)]
+            itemsize = np.dtype(dtype).itemsize
+            while int(np.prod(chunks)) * itemsize > maxChunkBytes and max(chunks) > 1:
+                dim = int(np.argmax(chunks))
+                chunks[dim] = (chunks[dim] + 1) // 2
+            chunks = tuple(chunks)
+    elif isinstance(chunks, tuple):
+        if len(chunks) != len(shape):
+            lgl = "chunk shape with {} dimensions".format(len(shape))
+            raise SPYValueError(legal=lgl, varname="storage['chunks']", actual=str(chunks))
+        chunks = tuple(max(1, min(c, int(s))) for c, s in zip(chunks, shape))
+    if opts["compression"] is not None:
+        kwargs["compression"] = opts["compression"]
+        if opts["compression_opts"] is not None:
+            kwargs["compression_opts"] = opts["compression_opts"]
+    if opts["shuffle"]:
+        kwargs["shuffle"] = True
+    if chunks is None and kwargs:
+        chunks = True
+    if chunks is not None:
+        kwargs["chunks"] = chunks
+    return kwargs
+
+
+def nan_partial_sum(arr, partial=None):
+    """
+    Add array to a NaN-aware running sum
+
+    Parameters
+    ----------
+    arr : :class:`numpy.ndarray`
+        Array to be added to `partial`
+    partial : None or tuple
+        Running sum as returned by a previous call of :func:`nan_partial_sum`
+        or :func:`combine_partial_sums`. If `None`, a new running sum is
+        started.
+
+    Returns
+    -------
+    partial : tuple
+        Two-element tuple ``(total, count)`` where `total` is the sum of all
+        added arrays ignoring NaNs and `count` holds the number of non-NaN
+        summands of each element of `total`.
+
+    Notes
+    -----
+    The (in-place updated) arrays in `partial` have the same shape as `arr`,
+    i.e., adding up an arbitrary number of trials only requires memory for
+    two single-trial arrays.
+
+    See also
+    --------
+    combine_partial_sums : merge running sums
+    partial_mean : compute the average of a running sum
+    """
+
+    valid = ~np.isnan(arr)
+    if partial is None:
+        return np.where(valid, arr, 0), valid.astype(np.uint32)
+    total, count = partial
+    total += np.where(valid, arr, 0)
+    count += valid
+    return total, count
+
+
+def combine_partial_sums(partials):
+    """
+    Merge NaN-aware running sums
+
+    Parameters
+    ----------
+    partials : iterable
+        Running sums as returned by :func:`nan_partial_sum` (`None` entries
+        are skipped)
+
+    Returns
+    -------
+    partial : None or tuple
+        Combined running sum (`None` if `partials` was empty)
+
+    Notes
+    -----
+    Merging is associative, i.e., this routine can be used as aggregation
+    function of (tree) reductions.
+
+    See also
+    --------
+    nan_partial_sum : add array to a running sum
+    partial_mean : compute the average of a running sum
+    """
+
+    combined = None
+    for partial in partials:
+        if partial is None:
+            continue
+        if combined is None:
+            combined = (partial[0].copy(), partial[1].copy())
+        else:
+            total, count = combined
+            total += partial[0]
+            count += partial[1]
+    return combined
+
+
+def partial_mean(partial):
+    """
+    Compute the average of a NaN-aware running sum
+
+    Parameters
+    ----------
+    partial : tuple
+        Running sum as returned by :func:`nan_partial_sum` or
+        :func:`combine_partial_sums`. `None` (no contributing summands, e.g., 
+        all chunks of a computation failed) raises a 
+        :class:`~syncopy.shared.errors.SPYValueError`
+
+    Returns
+    -------
+    mean : :class:`numpy.ndarray`
+        Element-wise average of all non-NaN summands (NaN where no valid
+        summand was found)
+
+    See also
+    --------
+    nan_partial_sum : add array to a running sum
+    combine_partial_sums : merge running sums
+    """
+
+    if partial is None:
+        lgl = "running sum of at least one array"
+        act = "None (no results to average)"
+        raise SPYValueError(legal=lgl, varname="partial", actual=act)
+    total, count = partial
+    with np.errstate(invalid="ignore", divide="ignore"):
+        return total / count
@@ -0,0 +1,206 @@
+# -*- coding: utf-8 -*-
+#
+# Selectable FFT implementations used by spectral estimation routines
+#
+
+# Builtin/3rd party package imports
+import numbers
+import numpy as np
+import scipy.fft as spfft
+from contextlib import contextmanager, ExitStack
+
+# Local imports
+import syncopy as spy
+from syncopy.shared.errors import SPYValueError, SPYTypeError
+
+# (Try to) import pyFFTW (optional): keep FFTW plans alive for re-use by
+# subsequent transforms of identical size
+try:
+    import pyfftw
+    import pyfftw.interfaces.scipy_fft as fftw
+    pyfftw.interfaces.cache.enable()
+    __pyfftw__ = True
+except ImportError:
+    __pyfftw__ = False
+
+__all__ = []
+
+#: available FFT backends of spectral estimation routines
+availableFFTBackends = ("numpy", "scipy", "pyfftw")
+
+
+class FFTBackend():
+    """
+    Thin wrapper dispatching Fourier transforms to NumPy, SciPy or pyFFTW
+
+    Parameters
+    ----------
+    backend : str
+        Name of FFT implementation, one of :data:`availableFFTBackends`
+    workers : None or int
+        Number of threads used by a single transform (ignored by `"numpy"`).
+        Negative values wrap around the number of CPU cores, i.e., -1 uses all
+        cores. If `None`, the library default (single-threaded) is used.
+
+    Notes
+    -----
+    Instances are created by compute kernels via :func:`get_fft_backend`. The
+    methods :meth:`rfft`, :meth:`fft` and :meth:`ifft` mirror their NumPy
+    counterparts. Library routines that perform Fourier transforms internally
+    (e.g., :func:`scipy.signal.stft`) use :mod:`scipy.fft` and can be routed
+    through the chosen backend via :meth:`context`.
+
+    All backends re-use plans of repeated transforms of identical size: NumPy
+    and SciPy keep a (small) internal cache of twiddle factors, pyFFTW
+    plans are kept alive by :mod:`pyfftw.interfaces.cache` and accumulate
+    FFTW wisdom (see :func:`export_fft_wisdom`).
+
+    See also
+    --------
+    get_fft_backend : construct backend from settings
+    fft_backend_parser : validate backend settings
+    """
+
+    def __init__(self, backend="numpy", workers=None):
+        self.backend = backend
+        self.workers = workers
+        if backend == "scipy":
+            self._module = spfft
+        elif backend == "pyfftw":
+            self._module = fftw
+        else:
+            self._module = None
+
+    def rfft(self, x, n=None, axis=-1):
+        """
+        Real-input discrete Fourier transform (see :func:`numpy.fft.rfft`)
+        """
+        if self._module is None:
+            return np.fft.rfft(x, n=n, axis=axis)
+        return self._module.rfft(x, n=n, axis=axis, workers=self.workers)
+
+    def fft(self, x, n=None, axis=-1):
+        """
+        Discrete Fourier transform (see :func:`numpy.fft.fft`)
+        """
+        if self._module is None:
+            return np.fft.fft(x, n=n, axis=axis)
+        return self._module.fft(x, n=n, axis=axis, workers=self.workers)
+
+    def ifft(self, x, n=None, axis=-1):
+        """
+        Inverse discrete Fourier transform (see :func:`numpy.fft.ifft`)
+        """
+        if self._module is None:
+            return np.fft.ifft(x, n=n, axis=axis)
+        return self._module.ifft(x, n=n, axis=axis, workers=self.workers)
+
+    @contextmanager
+    def context(self):
+        """
+        Context manager routing transforms performed via :mod:`scipy.fft`
+        (e.g., by :func:`scipy.signal.stft`) through this backend (no-op for
+        `"numpy"`)
+        """
+        with ExitStack() as stack:
+            if self.backend == "pyfftw":
+                stack.enter_context(spfft.set_backend(fftw))
+            if self._module is not None and self.workers is not None:
+                stack.enter_context(spfft.set_workers(self.workers))
+            yield self
+
+
+def fft_backend_parser(backend, varname="fft_backend"):
+    """
+    Parse FFT backend settings
+
+    Parameters
+    ----------
+    backend : None or str or dict
+        If `None`, the package-wide default ``syncopy.__fftbackend__`` is
+        used. If a string, name of FFT implementation (one of
+        :data:`availableFFTBackends`) used with its default number of
+        threads. If a dict, it may contain the keys `"backend"` (name of
+        FFT implementation) and `"workers"` (number of threads used per
+        transform, see :class:`FFTBackend`).
+    varname : str
+        Name of variable (used in error messages)
+
+    Returns
+    -------
+    settings : dict
+        Dictionary with keys `"backend"` and `"workers"`
+
+    Examples
+    --------
+    >>> fft_backend_parser("scipy")
+    {'backend': 'scipy', 'workers': None}
+    >>> fft_backend_parser({"backend": "scipy", "workers": -1})
+    {'backend': 'scipy', 'workers': -1}
+
+    See also
+    --------
+    syncopy.freqanalysis : uses FFT backend settings via `fft_backend` keyword
+    """
+
+    if backend is None:
+        backend = spy.__fftbackend__
+    if isinstance(backend, str):
+        backend = {"backend": backend}
+    if not isinstance(backend, dict):
+        raise SPYTypeError(backend, varname=varname, expected="None or str or dict")
+    invalid = set(backend.keys()).difference(["backend", "workers"])
+    if invalid:
+        lgl = "dict with keys 'backend' and 'workers'"
+        raise SPYValueError(legal=lgl, varname=varname, actual=str(sorted(invalid)))
+
+    name = backend.get("backend", "numpy")
+    if name not in availableFFTBackends:
+        lgl = "'" + "or '".join(opt + "' " for opt in availableFFTBackends)
+        raise SPYValueError(legal=lgl, varname=varname + "['backend']", actual=str(name))
+    if name == "pyfftw" and not __pyfftw__:
+        lgl = "'numpy' or 'scipy' ('pyfftw' is not installed)"
+        raise SPYValueError(legal=lgl, varname=varname + "['backend']", actual=name)
+
+    workers = backend.get("workers")
+    if workers is not None:
+        if not isinstance(workers, numbers.Integral) or isinstance(workers, bool):
+            raise SPYTypeError(workers, varname=varname + "['workers']", expected="int or None")
+        if workers == 0:
+            lgl = "non-zero number of threads"
+            raise SPYValueError(legal=lgl, varname=varname + "['workers']", actual="0")
+        workers = int(workers)
+
+    return {"backend": name, "workers": workers}
+
+
+def get_fft_backend(backend=None):
+    """
+    Construct :class:`FFTBackend` from settings (see :func:`fft_backend_parser`)
+    """
+    return FFTBackend(**fft_backend_parser(backend))
+
+
+def export_fft_wisdom():
+    """
+    Export FFTW wisdom accumulated by the calling process (only available
+    if pyFFTW is installed, see :func:`pyfftw.export_wisdom`)
+    """
+    if not __pyfftw__:
+        lgl = "installed 'pyfftw'"
+        raise SPYValueError(legal=lgl, varname="pyfftw", actual="not installed")
+    return pyfftw.export_wisdom()
+
+
+def import_fft_wisdom(wisdom, client=None):
+    """
+    Import FFTW `wisdom` (see :func:`export_fft_wisdom`) into the calling
+    process or, if a dask `client` is provided, into all of its workers
+    """
+    if not __pyfftw__:
+        lgl = "installed 'pyfftw'"
+        raise SPYValueError(legal=lgl, varname="pyfftw", actual="not installed")
+    if client is not None:
+        client.run(pyfftw.import_wisdom, wisdom)
+    else:
+        pyfftw.import_wisdom(wisdom)
@@ -21,6 +21,7 @@ from syncopy.shared.tools import best_match
 from syncopy.specest.mtmfft import MultiTaperFFT
 from syncopy.specest.mtmconvol import MultiTaperFFTConvol
 from syncopy.specest.wavelet import _get_optimal_wavelet_scales, WaveletTransform
+from syncopy.specest.fft_backend import fft_backend_parser
 
 # Module-wide output specs
 spectralDTypes = {"pow": np.float32,
@@ -235,6 +236,20 @@ def freqanalysis(data, method='mtmfft', output='fourier',
         in the signal and does *not* provide any information about amplitude or phase. 
     out : None or :class:`SpectralData` object
         None if a new :class:`SpectralData` object is to be created, or an empty :class:`SpectralData` object
+    cache : bool
+        If `True`, the result is stored in Syncopy's result cache and re-used
+        (without any re-computation) if `freqanalysis` is called again with 
+        identical settings on unchanged data. See 
+        :meth:`~syncopy.shared.computational_routine.ComputationalRoutine.fetch_cached` 
+        for details. 
+    fft_backend : None or str or dict
+        FFT implementation used by all spectral estimation methods: either
+        `"numpy"`, `"scipy"` (:mod:`scipy.fft`) or `"pyfftw"` (if installed), 
+        or a dict ``{"backend": name, "workers": nThreads}`` additionally
+        setting the number of threads used per transform (e.g., 
+        ``{"backend": "scipy", "workers": -1}`` uses all cores). If `None`, 
+        the package-wide default ``syncopy.__fftbackend__`` is used. See 
+        :func:`~syncopy.specest.fft_backend.fft_backend_parser` for details. 
         
 
     Returns
@@ -401,6 +416,9 @@ def freqanalysis(data, method='mtmfft', output='fourier',
         except Exception as exc:
             raise exc
 
+    # Resolve FFT backend here so that package-wide defaults reach parallel workers
+    fftBackend = fft_backend_parser(kwargs.get("fft_backend"))
+
     # Prepare keyword dict for logging (use `lcls` to get actually provided 
     # keyword values, not defaults set above)
     log_dct = {"method": method,
@@ -672,7 +690,8 @@ def freqanalysis(data, method='mtmfft', output='fourier',
             padlength=padlength,
             keeptapers=keeptapers,
             polyremoval=polyremoval,
-            output_fmt=output)
+            output_fmt=output,
+            fft_backend=fftBackend)
         
     elif method == "mtmconvol":
 
@@ -698,7 +717,8 @@ def freqanalysis(data, method='mtmfft', output='fourier',
             postpadlength=postpadlength,
             keeptapers=keeptapers,
             polyremoval=polyremoval,
-            output_fmt=output)
+            output_fmt=output,
+            fft_backend=fftBackend)
 
     elif method == "wavelet":
 
@@ -787,7 +807,8 @@ def freqanalysis(data, method='mtmfft', output='fourier',
             timeAxis=timeAxis, 
             wav=wfun,
             polyremoval=polyremoval,
-            output_fmt=output)
+            output_fmt=output,
+            fft_backend=fftBackend)
         
     # If provided, make sure output object is appropriate
     if out is not None:
@@ -802,11 +823,28 @@ def freqanalysis(data, method='mtmfft', output='fourier',
         out = SpectralData(dimord=SpectralData._defaultDimord)
         new_out = True
 
+    # If result caching was requested, see if this computation has been performed before
+    if kwargs.get("cache", False):
+        if specestMethod.fetch_cached(data, out, keeptrials=keeptrials, log_dict=log_dct):
+            return out if new_out else None
+
     # Perform actual computation
     specestMethod.initialize(data, 
                              chan_per_worker=kwargs.get("chan_per_worker"),
-                             keeptrials=keeptrials)
-    specestMethod.compute(data, out, parallel=kwargs.get("parallel"), log_dict=log_dct)
+                             keeptrials=keeptrials,
+                             mem_thresh=kwargs.get("mem_thresh"))
+    specestMethod.compute(data, out, parallel=kwargs.get("parallel"), log_dict=log_dct,
+                          mem_thresh=kwargs.get("mem_thresh"),
+                          trials_per_task=kwargs.get("trials_per_task"),
+                          prefetch=kwargs.get("prefetch"),
+                          resume=kwargs.get("resume", False),
+                          retries=kwargs.get("retries", 0),
+                          profile=kwargs.get("profile", False),
+                          memory_resource=kwargs.get("memory_resource"),
+                          fail_fast=kwargs.get("fail_fast", False),
+                          parallel_store=kwargs.get("parallel_store"),
+                          consolidate=kwargs.get("consolidate", False),
+                          storage=kwargs.get("storage"))
 
     # Either return newly created output object or simply quit
     return out if new_out else None
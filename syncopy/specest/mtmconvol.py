@@ -15,6 +15,12 @@ from syncopy.datatype import padding
 import syncopy.specest.freqanalysis as spyfreq
 from syncopy.shared.errors import SPYWarning
 from syncopy.shared.tools import best_match
+from syncopy.specest.taper_cache import get_taper
+from syncopy.specest.fft_backend import get_fft_backend
+
+# Max. no. of bytes of tapered analysis windows (and their Fourier transforms)
+# held in memory at once by `mtmconvol` (non-equidistant `toi`)
+maxWindowBytes = 256 * 1024**2
 
 
 # Local workhorse that performs the computational heavy lifting
@@ -24,7 +30,7 @@ def mtmconvol(
     samplerate=None, noverlap=None, nperseg=None, equidistant=True, toi=None, foi=None,
     nTaper=1, timeAxis=0, taper=signal.windows.hann, taperopt={}, 
     keeptapers=True, polyremoval=None, output_fmt="pow",
-    noCompute=False, chunkShape=None):
+    fft_backend=None, noCompute=False, chunkShape=None):
     """
     Perform time-frequency analysis on multi-channel time series data using a sliding window FFT
     
@@ -83,6 +89,10 @@ def mtmconvol(
         is performed. 
     output_fmt : str
         Output of spectral estimation; one of :data:`~syncopy.specest.freqanalysis.availableOutputs`
+    fft_backend : None or str or dict
+        FFT implementation used for all transforms (see
+        :func:`~syncopy.specest.fft_backend.fft_backend_parser`). If `None`,
+        the package-wide default ``syncopy.__fftbackend__`` is used.
     noCompute : bool
         Preprocessing flag. If `True`, do not perform actual calculation but
         instead return expected shape and :class:`numpy.dtype` of output
@@ -106,7 +116,10 @@ def mtmconvol(
     under the assumption that all inputs have been externally validated and cross-checked. 
     
     The computational heavy lifting in this code is performed by SciPy's Short Time 
-    Fourier Transform (STFT) implementation :func:`scipy.signal.stft`. 
+    Fourier Transform (STFT) implementation :func:`scipy.signal.stft`, whose 
+    Fourier transforms are carried out by the chosen `fft_backend`. 
+    If `toi` is not equidistant, all windows are gathered and transformed at 
+    once instead (see :func:`_windowed_rfft`). 
     
     See also
     --------
@@ -155,45 +168,39 @@ def mtmconvol(
               "padded": stftPad,
               "axis": 0}
     
-    # Call `stft` w/first taper to get freq/time indices: transpose resulting `pxx`
-    # to have a time x freq x channel array
-    win = np.atleast_2d(taper(nperseg, **taperopt))
-    stftKw["window"] = win[0, :]
+    win = get_taper(taper, nperseg, taperopt)
+    backend = get_fft_backend(fft_backend)
     if equidistant:
-        freq, _, pxx = signal.stft(dat[soi, :], **stftKw)
-        _, fIdx = best_match(freq, foi, squash_duplicates=True)
-        spec[:, 0, ...] = \
-            spyfreq.spectralConversions[output_fmt](
-                pxx.transpose(2, 0, 1))[:nTime, fIdx, :]
-    else:
-        freq, _, pxx = signal.stft(dat[soi[0], :], **stftKw)
-        _, fIdx = best_match(freq, foi, squash_duplicates=True)
-        spec[0, 0, ...] = \
-            spyfreq.spectralConversions[output_fmt](
-                pxx.transpose(2, 0, 1).squeeze())[fIdx, :]
-        for tk in range(1, len(soi)):
-            spec[tk, 0, ...] = \
-                spyfreq.spectralConversions[output_fmt](
-                    signal.stft(
-                        dat[soi[tk], :], 
-                        **stftKw)[2].transpose(2, 0, 1).squeeze())[fIdx, :]
 
-    # Compute FT using determined indices above for the remaining tapers (if any)
-    for taperIdx in range(1, win.shape[0]):
-        stftKw["window"] = win[taperIdx, :]
-        if equidistant:
-            spec[:, taperIdx, ...] = \
+        # Route transforms of `stft` through the selected FFT implementation
+        with backend.context():
+
+            # Call `stft` w/first taper to get freq/time indices: transpose resulting `pxx`
+            # to have a time x freq x channel array
+            stftKw["window"] = win[0, :]
+            freq, _, pxx = signal.stft(dat[soi, :], **stftKw)
+            _, fIdx = best_match(freq, foi, squash_duplicates=True)
+            spec[:, 0, ...] = \
                 spyfreq.spectralConversions[output_fmt](
-                    signal.stft(
-                        dat[soi, :],
-                        **stftKw)[2].transpose(2, 0, 1))[:nTime, fIdx, :]
-        else:
-            for tk, sample in enumerate(soi):
-                spec[tk, taperIdx, ...] = \
+                    pxx.transpose(2, 0, 1))[:nTime, fIdx, :]
+
+            # Compute FT using determined indices above for the remaining tapers (if any)
+            for taperIdx in range(1, win.shape[0]):
+                stftKw["window"] = win[taperIdx, :]
+                spec[:, taperIdx, ...] = \
                     spyfreq.spectralConversions[output_fmt](
                         signal.stft(
-                            dat[sample, :],
-                            **stftKw)[2].transpose(2, 0, 1).squeeze())[fIdx, :]
+                            dat[soi, :],
+                            **stftKw)[2].transpose(2, 0, 1))[:nTime, fIdx, :]
+
+    else:
+
+        # Windows centered on arbitrary time-points: transform all windows and 
+        # tapers at once (frequencies of `stft` are given by `rfftfreq`)
+        _, fIdx = best_match(np.fft.rfftfreq(nperseg, 1 / samplerate), foi, 
+                             squash_duplicates=True)
+        spec[...] = _windowed_rfft(dat, [sl.start for sl in soi], win, fIdx, 
+                                   spyfreq.spectralConversions[output_fmt], backend)
 
     # Average across tapers if wanted
     if not keeptapers:
@@ -243,6 +250,92 @@ class MultiTaperFFTConvol(ComputationalRoutine):
         out.taper = np.array([self.cfg["taper"].__name__] * self.outputShape[out.dimord.index("taper")])
         out.freq = self.cfg["foi"]
 
+    def time_splitting(self):
+
+        # Windows centered on arbitrary time-points cannot be processed block-wise
+        if isinstance(self.cfg["toi"], np.ndarray):
+            return None
+
+        # Windows are centered on every `nperseg - noverlap`-th sample and 
+        # cover `nperseg // 2` samples on either side
+        return self.cfg["nperseg"] - self.cfg["noverlap"], self.cfg["nperseg"] // 2 + 1
+
+    def output_shapes(self, inShapes, inDtype, argIdx):
+
+        # Output shapes only depend on (padded) trial lengths and channel counts
+        # (see `mtmconvol`), positional args are ``soi, padbegin, padend``
+        timeAxis = self.cfg["timeAxis"]
+        nSamples = inShapes[:, timeAxis] + np.array(self.argv[1])[argIdx] + \
+            np.array(self.argv[2])[argIdx]
+        if isinstance(self.cfg["toi"], np.ndarray):
+            nTime = np.full(nSamples.shape, self.cfg["toi"].size)
+        else:
+            nTime = np.ceil(nSamples / (self.cfg["nperseg"] - self.cfg["noverlap"])).astype(np.intp)
+        nTaper = max(1, self.cfg["nTaper"] * self.cfg["keeptapers"])
+        outShapes = np.column_stack([nTime, 
+                                     np.full(nTime.shape, nTaper),
+                                     np.full(nTime.shape, self.cfg["foi"].size),
+                                     inShapes[:, 1 - timeAxis]])
+        return outShapes, spyfreq.spectralDTypes[self.cfg["output_fmt"]]
+
+
+def _windowed_rfft(dat, starts, win, fIdx, conversion, backend):
+    """
+    Local helper computing short-time Fourier transforms of arbitrarily 
+    placed windows
+    
+    Parameters
+    ----------
+    dat : 2D :class:`numpy.ndarray`
+        (Padded) trial data (samples x channels)
+    starts : list or 1D :class:`numpy.ndarray`
+        First sample of every analysis window
+    win : 2D :class:`numpy.ndarray`
+        Taper windows (tapers x `nperseg` samples)
+    fIdx : 1D :class:`numpy.ndarray`
+        Indices of frequency bins to keep
+    conversion : callable
+        Output conversion of complex Fourier coefficients, one of 
+        :data:`~syncopy.specest.freqanalysis.spectralConversions`
+    backend : :class:`~syncopy.specest.fft_backend.FFTBackend`
+        FFT implementation
+        
+    Returns
+    -------
+    spec : :class:`numpy.ndarray`
+        Converted Fourier coefficients (windows x tapers x freqs x channels)
+        
+    Notes
+    -----
+    Windows of ``nperseg = win.shape[1]`` samples are gathered into a single 
+    (windows x samples x channels) array, all tapers are applied via 
+    broadcasting and all tapered windows are transformed by one real-input FFT 
+    (in blocks of windows whose tapered copies and Fourier coefficients do not 
+    exceed `maxWindowBytes`). Results are scaled like the ones of 
+    :func:`scipy.signal.stft` (``scaling="spectrum"``), i.e., they are 
+    identical to calling `stft` on every window separately. 
+    """
+    
+    nTaper, nperseg = win.shape
+    nChannels = dat.shape[1]
+    starts = np.asarray(starts, dtype=np.intp)
+    scaled = win / np.abs(win.sum(axis=1, keepdims=True))
+    offsets = np.arange(nperseg)
+    
+    winBytes = nTaper * nperseg * nChannels * \
+        (np.dtype(np.float64).itemsize + np.dtype(np.complex128).itemsize)
+    blockSize = int(max(1, maxWindowBytes // max(1, winBytes)))
+    spec = None
+    for first in range(0, starts.size, blockSize):
+        block = starts[first : first + blockSize]
+        segments = dat[block[:, np.newaxis] + offsets, :]
+        tapered = scaled[:, np.newaxis, :, np.newaxis] * segments
+        res = conversion(backend.rfft(tapered, axis=2)[:, :, fIdx, :])
+        if spec is None:
+            spec = np.empty((starts.size, nTaper, fIdx.size, nChannels), dtype=res.dtype)
+        spec[first : first + block.size] = res.transpose(1, 0, 2, 3)
+    return spec
+
 
 def _make_trialdef(cfg, trialdefinition, samplerate):
     """
@@ -6,6 +6,7 @@
 # Builtin/3rd party package imports
 import numpy as np
 import scipy.signal.windows as spwin
+from functools import lru_cache
 
 # Local imports
 from syncopy.shared.computational_routine import ComputationalRoutine
@@ -13,6 +14,16 @@ from syncopy.datatype import padding
 import syncopy.specest.freqanalysis as freq
 from syncopy.shared.kwarg_decorators import unwrap_io
 from syncopy.shared.tools import best_match
+from syncopy.specest.taper_cache import get_taper
+from syncopy.specest.fft_backend import get_fft_backend
+
+# Max. no. of bytes of tapered copies of a trial (and their Fourier transforms)
+# held in memory at once by `mtmfft`
+maxTaperBytes = 256 * 1024**2
+
+# Relative cost of a complex multiply-add of the twiddle stage of pruned
+# transforms compared to a butterfly of the (highly optimized) FFT
+twiddleCost = 2.0
 
 
 # Local workhorse that performs the computational heavy lifting
@@ -21,7 +32,7 @@ def mtmfft(trl_dat, samplerate=None, foi=None, nTaper=1, timeAxis=0,
            taper=spwin.hann, taperopt={}, 
            pad="nextpow2", padtype="zero", padlength=None,
            keeptapers=True, polyremoval=None, output_fmt="pow",
-           noCompute=False, chunkShape=None):
+           fft_backend=None, noCompute=False, chunkShape=None):
     """
     Compute (multi-)tapered Fourier transform of multi-channel time series data
     
@@ -68,6 +79,10 @@ def mtmfft(trl_dat, samplerate=None, foi=None, nTaper=1, timeAxis=0,
         etc.). If `polyremoval` is `None`, no de-trending is performed. 
     output_fmt : str
         Output of spectral estimation; one of :data:`~syncopy.specest.freqanalysis.availableOutputs`
+    fft_backend : None or str or dict
+        FFT implementation used for all transforms (see
+        :func:`~syncopy.specest.fft_backend.fft_backend_parser`). If `None`,
+        the package-wide default ``syncopy.__fftbackend__`` is used.
     noCompute : bool
         Preprocessing flag. If `True`, do not perform actual calculation but
         instead return expected shape and :class:`numpy.dtype` of output
@@ -90,8 +105,19 @@ def mtmfft(trl_dat, samplerate=None, foi=None, nTaper=1, timeAxis=0,
     Consequently, this function does **not** perform any error checking and operates 
     under the assumption that all inputs have been externally validated and cross-checked. 
     
-    The computational heavy lifting in this code is performed by NumPy's reference
-    implementation of the Fast Fourier Transform :func:`numpy.fft.fft`. 
+    The computational heavy lifting in this code is performed by the Fast
+    Fourier Transform of the chosen `fft_backend` (NumPy's reference
+    implementation :func:`numpy.fft.fft` by default). All tapers are applied
+    via broadcasting and transformed by a single real-input FFT (in blocks of
+    tapers whose tapered copies and Fourier coefficients do not exceed
+    `maxTaperBytes`). If `keeptapers` is `False`, spectra of all blocks are 
+    accumulated right away (without allocating an array holding the spectra 
+    of all tapers). 
+
+    If only a few frequency bins are requested (e.g., a narrow `foi` band of 
+    long, finely resolved trials), only these bins are computed via a pruned 
+    transform (see :func:`_pruned_rfft`) whenever its estimated cost is lower 
+    than the cost of a full FFT (see :func:`_fold_factor`). 
     
     See also
     --------
@@ -125,23 +151,110 @@ def mtmfft(trl_dat, samplerate=None, foi=None, nTaper=1, timeAxis=0,
     if noCompute:
         return outShape, freq.spectralDTypes[output_fmt]
 
-    # In case tapers aren't preserved allocate `spec` "too big" and average afterwards
-    spec = np.full((1, nTaper, nFreq, nChannels), np.nan, dtype=freq.spectralDTypes[output_fmt])
-    fill_idx = tuple([slice(None, dim) for dim in outShape[2:]])
+    # Tapered copies of the trial are transformed in blocks of tapers (to cap
+    # memory usage); if tapers aren't preserved, blocks are summed up on the fly
+    win = get_taper(taper, nSamples, taperopt)
+    backend = get_fft_backend(fft_backend)
+    nWin = win.shape[0]
+    conversion = freq.spectralConversions[output_fmt]
+    spec = np.zeros(outShape, dtype=freq.spectralDTypes[output_fmt])
+    taperBytes = dat.size * (np.dtype(np.float64).itemsize + np.dtype(np.complex128).itemsize)
 
-    # Actual computation
-    win = np.atleast_2d(taper(nSamples, **taperopt))
-    for taperIdx, taper in enumerate(win):
-        if dat.ndim > 1:
-            taper = np.tile(taper, (nChannels, 1)).T
-        spec[(0, taperIdx,) + fill_idx] = freq.spectralConversions[output_fmt](np.fft.rfft(dat * taper, axis=0)[fidx, :])
+    # For narrow-band requests only evaluate the bins `fidx` (pruned transform)
+    nFold = _fold_factor(nSamples, fidx.size, maxTaperBytes)
+    if nFold > 1:
+        taperBytes += fidx.size * nFold * nChannels * np.dtype(np.complex128).itemsize
+    blockSize = int(max(1, min(nWin, maxTaperBytes // max(1, taperBytes))))
+
+    # Actual computation: broadcast (tapers x samples x 1) windows against the
+    # (samples x channels) data and transform all tapers of a block at once
+    for start in range(0, nWin, blockSize):
+        stop = min(nWin, start + blockSize)
+        tapered = win[start:stop, :, np.newaxis] * dat
+        if nFold > 1:
+            res = conversion(_pruned_rfft(tapered, fidx, nFold, backend))
+        else:
+            res = conversion(backend.rfft(tapered, axis=1)[:, fidx, :])
+        if keeptapers:
+            spec[0, start:stop, :, :] = res
+        else:
+            spec[0, 0, :, :] += res.sum(axis=0)
 
     # Average across tapers if wanted
     if not keeptapers:
-        return spec.mean(axis=1, keepdims=True)
+        spec /= nWin
     return spec
 
 
+@lru_cache(maxsize=256)
+def _fold_factor(nSamples, nBins, maxBytes):
+    """
+    Local helper choosing the cheapest transform of `nBins` frequency bins of a
+    real signal of length `nSamples`
+
+    Evaluating ``P * Q = nSamples`` point DFTs as `P` interleaved length-`Q`
+    FFTs (cost ~ ``nSamples/2 * log2(Q)``) followed by a twiddle stage only
+    evaluated at the requested bins (cost ~ ``nBins * P``) is estimated for
+    every divisor `P` of `nSamples`. ``P = 1`` is the full FFT, ``P = nSamples``
+    is a direct (Goertzel-style) evaluation of every bin. Twiddle matrices
+    exceeding `maxBytes` are not considered. Returns the `P` of minimal 
+    estimated cost (1 if the full FFT is cheapest).
+    """
+    nBins = max(1, nBins)
+    maxFold = maxBytes // (nBins * np.dtype(np.complex128).itemsize)
+    bestCost = 0.5 * nSamples * np.log2(max(2, nSamples))
+    bestFold = 1
+    for fold in _divisors(nSamples):
+        if fold == 1 or fold > maxFold:
+            continue
+        nQ = nSamples // fold
+        cost = 0.5 * nSamples * np.log2(nQ) if nQ > 1 else 0.0
+        cost += twiddleCost * nBins * fold
+        if cost < bestCost:
+            bestCost = cost
+            bestFold = fold
+    return bestFold
+
+
+def _divisors(n):
+    """
+    Local helper returning all divisors of `n` in ascending order
+    """
+    small = [k for k in range(1, int(np.sqrt(n)) + 1) if n % k == 0]
+    return small + [n // k for k in reversed(small) if k * k != n]
+
+
+def _pruned_rfft(tapered, fidx, nFold, backend):
+    """
+    Local helper computing the bins `fidx` of the real-input DFT of `tapered`
+    (tapers x samples x channels) along its sample axis
+
+    Samples ``n = q * nFold + p`` are split into `nFold` interleaved 
+    sub-sequences that are transformed by length-``nSamples / nFold`` FFTs, 
+    which are then combined (via twiddle factors) at the requested bins only. 
+    For ``nFold == nSamples`` this amounts to a direct evaluation of the DFT 
+    at `fidx`. Results equal ``backend.rfft(tapered, axis=1)[:, fidx, :]`` up 
+    to floating point round-off. 
+    """
+    nSamples = tapered.shape[1]
+    nQ = nSamples // nFold
+
+    # Twiddle factors exp(-2 pi i k p / N) (exact phases via integer arithmetic)
+    phase = np.outer(fidx, np.arange(nFold)) % nSamples
+    twiddle = np.exp(-2j * np.pi * phase / nSamples)
+    if nQ == 1:
+        return np.matmul(twiddle, tapered)
+
+    # Length-`nQ` transforms of all sub-sequences (tapers x bins x nFold x channels);
+    # bins beyond Nyquist of the sub-transforms are obtained by symmetry
+    sub = backend.rfft(tapered.reshape(tapered.shape[0], nQ, nFold, tapered.shape[2]), axis=1)
+    rem = fidx % nQ
+    mirror = rem > nQ // 2
+    sub = sub[:, np.where(mirror, nQ - rem, rem), :, :]
+    sub[:, mirror, :, :] = sub[:, mirror, :, :].conj()
+    return np.einsum("tmpc,mp->tmc", sub, twiddle, optimize=True)
+
+
 class MultiTaperFFT(ComputationalRoutine):
     """
     Compute class that calculates (multi-)tapered Fourier transfrom of :class:`~syncopy.AnalogData` objects
@@ -0,0 +1,209 @@
+# -*- coding: utf-8 -*-
+#
+# Process-wide cache of taper windows used by spectral estimation routines
+#
+
+# Builtin/3rd party package imports
+import threading
+import numpy as np
+from collections import OrderedDict
+
+__all__ = []
+
+# Max. no. of bytes occupied by all cached taper windows of a single process
+maxTaperCacheBytes = 128 * 1024**2
+
+
+class TaperCache():
+    """
+    Least-recently-used cache of taper windows
+
+    Parameters
+    ----------
+    maxBytes : int
+        Maximal combined size (in bytes) of all cached windows. If the cache
+        is full, the least recently used windows are discarded. Windows larger
+        than `maxBytes` are never cached.
+
+    Notes
+    -----
+    Computing taper windows can be costly (e.g., Slepian sequences are the
+    solution of an eigenvalue problem), yet all trials of identical length
+    use identical windows. Thus, every process (i.e., every parallel worker)
+    holds its own cache (see `taperCache`) which is shared by all of its
+    threads and all spectral estimation routines. Windows are keyed on the
+    name of the taper function, the number of samples and the (frozen)
+    keyword arguments of the taper function. Cached windows are read-only.
+
+    The number of cache hits and misses is recorded to assess the
+    effectiveness of the cache (see :meth:`info` and :func:`taper_cache_info`).
+
+    See also
+    --------
+    get_taper : fetch windows from the cache of the calling process
+    warm_taper_cache : pre-compute windows (on parallel workers)
+    """
+
+    def __init__(self, maxBytes=maxTaperCacheBytes):
+        self.maxBytes = maxBytes
+        self.hits = 0
+        self.misses = 0
+        self._nbytes = 0
+        self._windows = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, taper, nSamples, taperopt={}):
+        """
+        Get (multi-)taper window(s) as 2D array (tapers x samples)
+        """
+        key = (taper.__name__, int(nSamples), _freeze(taperopt))
+        with self._lock:
+            if key in self._windows:
+                self._windows.move_to_end(key)
+                self.hits += 1
+                return self._windows[key]
+            self.misses += 1
+
+        # Compute window(s) outside the lock to not block other threads
+        win = np.atleast_2d(taper(int(nSamples), **taperopt))
+        win.flags.writeable = False
+        if win.nbytes > self.maxBytes:
+            return win
+        with self._lock:
+            if key not in self._windows:
+                self._windows[key] = win
+                self._nbytes += win.nbytes
+            while self._nbytes > self.maxBytes:
+                _, oldest = self._windows.popitem(last=False)
+                self._nbytes -= oldest.nbytes
+        return win
+
+    def info(self):
+        """
+        Get no. of cache hits/misses, cached windows and bytes occupied by them
+        """
+        with self._lock:
+            return {"hits": self.hits, "misses": self.misses,
+                    "windows": len(self._windows), "bytes": self._nbytes}
+
+    def clear(self):
+        """
+        Discard all cached windows and reset hit/miss counters
+        """
+        with self._lock:
+            self._windows.clear()
+            self._nbytes = 0
+            self.hits = 0
+            self.misses = 0
+
+    def __len__(self):
+        return len(self._windows)
+
+
+def get_taper(taper, nSamples, taperopt={}):
+    """
+    Get (multi-)taper window(s) from the cache of the calling process
+
+    Parameters
+    ----------
+    taper : callable
+        Taper function, one of :data:`~syncopy.specest.freqanalysis.availableTapers`
+    nSamples : int
+        Length of window(s) in samples
+    taperopt : dict
+        Additional keyword arguments passed to `taper`
+
+    Returns
+    -------
+    win : 2D :class:`numpy.ndarray`
+        Read-only array of windows (tapers x samples), i.e., the result of
+        ``np.atleast_2d(taper(nSamples, **taperopt))``
+
+    See also
+    --------
+    TaperCache : process-wide taper cache
+    """
+    return taperCache.get(taper, nSamples, taperopt)
+
+
+def warm_taper_cache(tapers, client=None):
+    """
+    Pre-compute taper windows in the cache of the calling process or of all
+    parallel workers
+
+    Parameters
+    ----------
+    tapers : list
+        List of ``(taper, nSamples, taperopt)`` tuples specifying windows to
+        compute (see :func:`get_taper`)
+    client : None or :class:`dask.distributed.Client`
+        If provided, windows are computed by all workers of `client`,
+        otherwise in the calling process only
+
+    Returns
+    -------
+    Nothing : None
+
+    Examples
+    --------
+    >>> warm_taper_cache([(spwin.dpss, 2048, {"NW": 4, "Kmax": 7})], dd.get_client())
+    """
+    if client is not None:
+        client.run(_warm_tapers, tapers)
+    else:
+        _warm_tapers(tapers)
+
+
+def taper_cache_info(client=None):
+    """
+    Get statistics of the taper cache of the calling process or of all
+    parallel workers
+
+    Parameters
+    ----------
+    client : None or :class:`dask.distributed.Client`
+        If provided, statistics of all workers of `client` are collected
+
+    Returns
+    -------
+    info : dict
+        Number of cache hits and misses, cached windows and bytes occupied by
+        them (see :meth:`TaperCache.info`). If `client` is provided, a dict
+        holding the statistics of every worker (keyed by worker address) is
+        returned.
+    """
+    if client is not None:
+        return client.run(_cache_info)
+    return taperCache.info()
+
+
+def _warm_tapers(tapers):
+    """
+    Local helper computing taper windows in the calling process
+    """
+    for taper, nSamples, taperopt in tapers:
+        taperCache.get(taper, nSamples, taperopt)
+
+
+def _cache_info():
+    """
+    Local helper returning taper cache statistics of the calling process
+    """
+    return taperCache.info()
+
+
+def _freeze(value):
+    """
+    Local helper converting (nested) taper options into a hashable object
+    """
+    if isinstance(value, dict):
+        return tuple(sorted((key, _freeze(val)) for key, val in value.items()))
+    if isinstance(value, np.ndarray):
+        value = value.tolist()
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(val) for val in value)
+    return value
+
+
+# Process-wide cache used by all spectral estimation routines
+taperCache = TaperCache()
@@ -10,6 +10,7 @@ from numbers import Number
 # Local imports
 from syncopy.shared.computational_routine import ComputationalRoutine
 from syncopy.specest.wavelets import cwt
+from syncopy.specest.fft_backend import get_fft_backend
 from syncopy.shared.kwarg_decorators import unwrap_io
 from syncopy.datatype import padding
 import syncopy.specest.freqanalysis as spyfreq
@@ -20,7 +21,7 @@ def wavelet(
     trl_dat, preselect, postselect, padbegin, padend,
     samplerate=None, toi=None, scales=None, timeAxis=0, wav=None, 
     polyremoval=None, output_fmt="pow",
-    noCompute=False, chunkShape=None):
+    fft_backend=None, noCompute=False, chunkShape=None):
     """ 
     Perform time-frequency analysis on multi-channel time series data using a wavelet transform
     
@@ -62,6 +63,10 @@ def wavelet(
         is performed. 
     output_fmt : str
         Output of spectral estimation; one of :data:`~syncopy.specest.freqanalysis.availableOutputs`
+    fft_backend : None or str or dict
+        FFT implementation used for all transforms (see
+        :func:`~syncopy.specest.fft_backend.fft_backend_parser`). If `None`,
+        the package-wide default ``syncopy.__fftbackend__`` is used.
     noCompute : bool
         Preprocessing flag. If `True`, do not perform actual calculation but
         instead return expected shape and :class:`numpy.dtype` of output
@@ -120,11 +125,14 @@ def wavelet(
         return outShape, spyfreq.spectralDTypes[output_fmt]
 
     # Compute wavelet transform with given data/time-selection
-    spec = cwt(dat[preselect, :], 
-               axis=0, 
-               wavelet=wav, 
-               widths=scales, 
-               dt=1/samplerate).transpose(1, 0, 2)[postselect, :, :]
+    backend = get_fft_backend(fft_backend)
+    with backend.context():
+        spec = cwt(dat[preselect, :], 
+                   axis=0, 
+                   wavelet=wav, 
+                   widths=scales, 
+                   dt=1/samplerate,
+                   backend=backend).transpose(1, 0, 2)[postselect, :, :]
     
     return spyfreq.spectralConversions[output_fmt](spec[:, np.newaxis, :, :])
 
@@ -170,6 +178,36 @@ class WaveletTransform(ComputationalRoutine):
         out.channel = np.array(data.channel[chanSec])
         out.freq = 1 / self.cfg["wav"].fourier_period(self.cfg["scales"][::-1])
 
+    def time_splitting(self):
+
+        # Wavelets centered on arbitrary time-points cannot be processed block-wise
+        if isinstance(self.cfg["toi"], np.ndarray):
+            return None
+
+        # Use four e-folding times of the widest wavelet as margin: edge effects
+        # of block boundaries are then damped by a factor of at least e^-8. Note 
+        # that (unlike for finite windows) this margin is approximate by design:
+        # wavelets have infinite support, so results of split trials differ
+        # slightly from the ones of whole trials
+        coi = self.cfg["wav"].coi(self.cfg["scales"].max())
+        return 1, int(np.ceil(4 * coi * self.cfg["samplerate"]))
+
+    def output_shapes(self, inShapes, inDtype, argIdx):
+
+        # Output shapes only depend on (padded) trial lengths and channel counts
+        # (see `wavelet`), positional args are ``preselect, postselect, padbegin, padend``
+        timeAxis = self.cfg["timeAxis"]
+        if isinstance(self.cfg["toi"], np.ndarray):
+            nTime = np.full(inShapes.shape[0], self.cfg["toi"].size)
+        else:
+            nTime = inShapes[:, timeAxis] + np.array(self.argv[2])[argIdx] + \
+                np.array(self.argv[3])[argIdx]
+        outShapes = np.column_stack([nTime,
+                                     np.ones(nTime.shape, dtype=np.intp),
+                                     np.full(nTime.shape, self.cfg["scales"].size),
+                                     inShapes[:, 1 - timeAxis]])
+        return outShapes, spyfreq.spectralDTypes[self.cfg["output_fmt"]]
+
 
 def _get_optimal_wavelet_scales(self, nSamples, dt, dj=0.25, s0=None):
     """
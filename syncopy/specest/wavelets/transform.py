@@ -2,6 +2,7 @@ from __future__ import division
 
 import numpy as np
 import scipy
+import scipy.fft
 import scipy.signal
 import scipy.optimize
 import scipy.special
@@ -11,7 +12,8 @@ from .wavelets import Morlet
 __all__ = ['cwt', 'WaveletAnalysis', 'WaveletTransform']
 
 
-def cwt(data, wavelet=None, widths=None, dt=1, frequency=False, axis=-1):
+def cwt(data, wavelet=None, widths=None, dt=1, frequency=False, axis=-1,
+        backend=None):
     """Continuous wavelet transform using the Fourier transform
     convolution as used in Terrence and Compo.
 
@@ -67,6 +69,10 @@ def cwt(data, wavelet=None, widths=None, dt=1, frequency=False, axis=-1):
     axis: int, the axis in the data over which to perform the 1D
           transform (default 0)
 
+    backend: FFTBackend or None, FFT implementation used by the
+             frequency-space transform (see
+             syncopy.specest.fft_backend). Defaults to scipy.fft.
+
     Returns
     -------
     cwt: (M, N) ndarray
@@ -80,7 +86,7 @@ def cwt(data, wavelet=None, widths=None, dt=1, frequency=False, axis=-1):
         raise UserWarning('Have to specify a wavelet function')
 
     if frequency:
-        return cwt_freq(data, wavelet, widths, dt, axis)
+        return cwt_freq(data, wavelet, widths, dt, axis, backend=backend)
     elif not frequency:
         return cwt_time(data, wavelet, widths, dt, axis)
 
@@ -107,14 +113,16 @@ def cwt_time(data, wavelet, widths, dt, axis):
     return output
 
 
-def cwt_freq(data, wavelet, widths, dt, axis):
+def cwt_freq(data, wavelet, widths, dt, axis, backend=None):
     # compute in frequency
     # next highest power of two for padding
     N = data.shape[axis]
     pN = int(2 ** np.ceil(np.log2(N)))
     # N.B. padding in fft adds zeros to the *end* of the array,
     # not equally either end.
-    fft_data = scipy.fft(data, n=pN, axis=axis)
+    fft = scipy.fft.fft if backend is None else backend.fft
+    ifft = scipy.fft.ifft if backend is None else backend.ifft
+    fft_data = fft(data, n=pN, axis=axis)
     # frequencies
     w_k = np.fft.fftfreq(pN, d=dt) * 2 * np.pi
 
@@ -129,13 +137,15 @@ def cwt_freq(data, wavelet, widths, dt, axis):
     # perform the convolution in frequency space
     slices = [slice(None)] + [None for _ in data.shape]
     slices[axis] = slice(None)
+    slices = tuple(slices)
 
-    out = scipy.ifft(fft_data[None] * wavelet_data.conj()[slices],
-                     n=pN, axis=axis)
+    out = ifft(fft_data[None] * wavelet_data.conj()[slices],
+               n=pN, axis=axis)
 
     # remove zero padding
     slices = [slice(None) for _ in out.shape]
     slices[axis] = slice(None, N)
+    slices = tuple(slices)
 
     if data.ndim == 1:
         return out[slices].squeeze()
@@ -5,22 +5,32 @@
 
 # Builtin/3rd party package imports
 import os
+import json
 import tempfile
 import time
+from types import SimpleNamespace
 import pytest
+import psutil
 import numpy as np
 from glob import glob
 from scipy import signal
 
 # Local imports
+import syncopy as spy
 from syncopy import __dask__
 if __dask__:
     import dask.distributed as dd
 from syncopy.datatype import AnalogData
 from syncopy.datatype.base_data import Selector
 from syncopy.io import load
-from syncopy.shared.computational_routine import ComputationalRoutine
+from syncopy.shared import computational_routine
+from syncopy.shared.computational_routine import ComputationalRoutine, compute_batch
+from syncopy.shared.pipeline import ComputationalPipeline
+from syncopy.shared.errors import SPYValueError, SPYTypeError, SPYParallelError
 from syncopy.shared.kwarg_decorators import unwrap_io, unwrap_cfg, unwrap_select
+from syncopy.shared.profiling import profileFields
+from syncopy.shared import handle_pool
+from syncopy.shared.handle_pool import HandlePool, workerPool, read_chunk, read_selection
 from syncopy.tests.misc import generate_artificial_data
 
 # Decorator to decide whether or not to run dask-related tests
@@ -63,7 +73,9 @@ class LowPassFilter(ComputationalRoutine):
 @unwrap_select
 def filter_manager(data, b=None, a=None, 
                    out=None, select=None, chan_per_worker=None, keeptrials=True,
-                   parallel=False, parallel_store=None, log_dict=None):
+                   parallel=False, parallel_store=None, log_dict=None,
+                   trials_per_task=None, prefetch=None, resume=False, retries=0,
+                   profile=False):
     myfilter = LowPassFilter(b, a=a)
     myfilter.initialize(data, chan_per_worker=chan_per_worker, keeptrials=keeptrials)
     newOut = False
@@ -73,10 +85,91 @@ def filter_manager(data, b=None, a=None,
     myfilter.compute(data, out, 
                      parallel=parallel, 
                      parallel_store=parallel_store, 
-                     log_dict=log_dict)
+                     log_dict=log_dict,
+                     trials_per_task=trials_per_task,
+                     prefetch=prefetch,
+                     resume=resume,
+                     retries=retries,
+                     profile=profile)
     return out if newOut else None
 
 
+@unwrap_io
+def flaky_lowpass(arr, b, trlno, a=None, markerdir=None, noCompute=None, chunkShape=None):
+    if noCompute:
+        return arr.shape, arr.dtype
+    # fail as long as "fail<trlno>" exists, fail exactly once if "once<trlno>" exists
+    if os.path.isfile(os.path.join(markerdir, "fail{}".format(trlno))):
+        raise RuntimeError("trial {} failed".format(trlno))
+    once = os.path.join(markerdir, "once{}".format(trlno))
+    if os.path.isfile(once):
+        os.unlink(once)
+        raise RuntimeError("trial {} failed once".format(trlno))
+    return signal.filtfilt(b, a, arr.T, padlen=200).T
+
+
+class FlakyLowPassFilter(LowPassFilter):
+    computeFunction = staticmethod(flaky_lowpass)
+
+
+@unwrap_io
+def moving_average(arr, width=5, noCompute=None, chunkShape=None):
+    if noCompute:
+        return arr.shape, arr.dtype
+    kernel = np.ones((width,)) / width
+    return np.apply_along_axis(np.convolve, 0, arr, kernel, mode="same")
+
+
+class MovingAverage(LowPassFilter):
+    computeFunction = staticmethod(moving_average)
+
+    def time_splitting(self):
+        return 1, self.cfg["width"] // 2
+
+
+@unwrap_io
+def time_reversal(arr, noCompute=None, chunkShape=None):
+    if noCompute:
+        return arr.shape, arr.dtype
+    return arr[::-1, :]
+
+
+class TimeReversal(LowPassFilter):
+    computeFunction = staticmethod(time_reversal)
+
+
+@unwrap_io
+def dict_lowpass(arr, coeffs, noCompute=None, chunkShape=None):
+    if noCompute:
+        return arr.shape, arr.dtype
+    return signal.filtfilt(coeffs["b"], coeffs["a"], arr.T, padlen=200).T
+
+
+class DictLowPassFilter(LowPassFilter):
+    computeFunction = staticmethod(dict_lowpass)
+
+
+# Shapes of all trials passed to `counting_lowpass` in dry-runs
+dryRunShapes = []
+
+
+@unwrap_io
+def counting_lowpass(arr, b, a=None, noCompute=None, chunkShape=None):
+    if noCompute:
+        dryRunShapes.append(arr.shape)
+        return arr.shape, arr.dtype
+    return signal.filtfilt(b, a, arr.T, padlen=200).T
+
+
+class CountingLowPassFilter(LowPassFilter):
+    computeFunction = staticmethod(counting_lowpass)
+
+
+class InferringLowPassFilter(CountingLowPassFilter):
+    def output_shapes(self, inShapes, inDtype, argIdx):
+        return inShapes, inDtype
+
+
 class TestComputationalRoutine():
 
     # Construct linear combination of low- and high-frequency sine waves
@@ -290,15 +383,517 @@ class TestComputationalRoutine():
                 assert np.array_equal(dummy.time, dummy2.time)
                 del dummy, dummy2, out_sel
 
+    def test_sequential_prefetch(self):
+        for select in self.sigdataSelections:
+            for keeptrials in [True, False]:
+                ref = filter_manager(self.sigdata, self.b, self.a, select=select,
+                                     keeptrials=keeptrials)
+                for prefetch in [1, 3, self.nTrials + 2]:
+                    out = filter_manager(self.sigdata, self.b, self.a, select=select,
+                                         keeptrials=keeptrials, prefetch=prefetch)
+                    assert np.allclose(out.data, ref.data)
+                    assert np.array_equal(out.channel, ref.channel)
+                    assert np.array_equal(out.time, ref.time)
+                    del out
+                del ref
+
+        # ensure invalid queue depths are caught
+        with pytest.raises(SPYValueError):
+            filter_manager(self.sigdata, self.b, self.a, prefetch=-1)
+
+    def test_local_pools(self):
+        for select in self.sigdataSelections:
+            for chan_per_worker in [None, self.chanPerWrkr]:
+                for keeptrials in [True, False]:
+                    ref = filter_manager(self.sigdata, self.b, self.a, select=select,
+                                         keeptrials=keeptrials)
+                    for pool in ["threads", "processes"]:
+                        out = filter_manager(self.sigdata, self.b, self.a, select=select,
+                                             chan_per_worker=chan_per_worker,
+                                             keeptrials=keeptrials, parallel=pool)
+                        assert np.allclose(out.data, ref.data)
+                        assert np.array_equal(out.channel, ref.channel)
+                        assert np.array_equal(out.time, ref.time)
+                        del out
+                    del ref
+
+        # ensure invalid pool specifications are caught
+        with pytest.raises(SPYValueError):
+            filter_manager(self.sigdata, self.b, self.a, parallel="gpu")
+
+    def test_sequential_timesplit(self):
+        # only allow for results of a quarter trial to be held in memory
+        def average_manager(select=None, keeptrials=True, parallel=False):
+            if select is not None:
+                self.sigdata._selection = select
+            avg = MovingAverage(width=21)
+            avg.initialize(self.sigdata, keeptrials=keeptrials)
+            memThresh = avg.chunkMem / 4 / psutil.virtual_memory().available
+            out = AnalogData(dimord=AnalogData._defaultDimord)
+            try:
+                avg.compute(self.sigdata, out, parallel=parallel, mem_thresh=memThresh)
+            finally:
+                self.sigdata._selection = None
+            return out, avg
+        
+        for select in self.sigdataSelections:
+            sel = Selector(self.sigdata, select)
+            if select is not None:
+                self.sigdata._selection = select
+            ref = MovingAverage(width=21)
+            ref.initialize(self.sigdata)
+            refOut = AnalogData(dimord=AnalogData._defaultDimord)
+            ref.compute(self.sigdata, refOut)
+            self.sigdata._selection = None
+            for parallel in [False, "threads"]:
+                out, avg = average_manager(select=select, parallel=parallel)
+                assert len(avg.sourceLayout) > len(sel.trials)
+                assert np.allclose(out.data, refOut.data)
+                assert np.array_equal(out.trialdefinition, refOut.trialdefinition)
+                del out
+            del refOut
+
+        # trial-averages and routines w/o time-splitting support still fail
+        with pytest.raises(NotImplementedError):
+            average_manager(keeptrials=False)
+        lowpass = LowPassFilter(self.b, a=self.a)
+        lowpass.initialize(self.sigdata)
+        memThresh = lowpass.chunkMem / 4 / psutil.virtual_memory().available
+        with pytest.raises(NotImplementedError):
+            lowpass.compute(self.sigdata, AnalogData(dimord=AnalogData._defaultDimord), 
+                            mem_thresh=memThresh)
+
+    def test_sequential_timesplit_spectral(self, monkeypatch):
+        # time-frequency results of split trials match the ones of whole trials
+        cfgs = [{"method": "mtmconvol", "taper": "hann", "t_ftimwin": 0.1, "toi": "all"},
+                {"method": "wavelet", "foi": np.arange(40, 101, 5), "toi": "all"}]
+        refs = [spy.freqanalysis(self.sigdata, parallel=False, **cfg) for cfg in cfgs]
+
+        # only allow for results of half a trial to be held in memory
+        compute = ComputationalRoutine.compute
+        routines = []
+        def split_compute(routine, data, out, **kwargs):
+            routines.append(routine)
+            kwargs["mem_thresh"] = routine.chunkMem / 2 / psutil.virtual_memory().available
+            return compute(routine, data, out, **kwargs)
+        monkeypatch.setattr(ComputationalRoutine, "compute", split_compute)
+
+        for cfg, ref in zip(cfgs, refs):
+            routines.clear()
+            spec = spy.freqanalysis(self.sigdata, parallel=False, **cfg)
+            assert len(routines[0].sourceLayout) > len(self.sigdata.trials)
+            assert np.array_equal(spec.trialdefinition, ref.trialdefinition)
+            if cfg["method"] == "mtmconvol":
+                assert np.allclose(spec.data, ref.data)
+            else:
+                # wavelets have infinite support: the margin of time-blocks is approximate
+                assert np.allclose(spec.data, ref.data, atol=1e-3 * np.abs(ref.data[()]).max())
+            del spec
+        del refs
+
+    def test_auto_chan_per_worker(self, monkeypatch):
+        # pin available memory and no. of cores, so that block sizes do not depend 
+        # on the host (available memory is changed below)
+        memory = {"available": 2**34}
+        monkeypatch.setattr(psutil, "virtual_memory", 
+                            lambda: SimpleNamespace(available=memory["available"]))
+        for nCores in [1, 4]:
+            monkeypatch.setattr(os, "cpu_count", lambda: nCores)
+            for select in self.sigdataSelections:
+                sel = Selector(self.sigdata, select)
+                ref = filter_manager(self.sigdata, self.b, self.a, select=select)
+
+                # results of channel-blocks must fit into a quarter of a core's memory
+                # (blocks are sized exactly at this limit and have to be accepted by
+                # `compute` even if available memory shrinks in the meantime)
+                trialMem = ref.data.size / len(sel.trials) * ref.data.dtype.itemsize
+                memThresh = trialMem / 4 / (memory["available"] / nCores)
+                if select is not None:
+                    self.sigdata._selection = select
+                for parallel in [False, "threads"]:
+                    memory["available"] = 2**34
+                    myfilter = LowPassFilter(self.b, a=self.a)
+                    myfilter.initialize(self.sigdata, chan_per_worker="auto", 
+                                        mem_thresh=memThresh)
+                    assert len(myfilter.sourceLayout) >= 4 * len(sel.trials)
+                    assert myfilter.chunkMem <= myfilter.chanBlockMem
+                    memory["available"] *= 0.9
+                    out = AnalogData(dimord=AnalogData._defaultDimord)
+                    myfilter.compute(self.sigdata, out, parallel=parallel)
+                    assert myfilter.memThresh == memThresh
+                    assert np.allclose(out.data, ref.data)
+                    assert np.array_equal(out.channel, ref.channel)
+                    del out
+                self.sigdata._selection = None
+
+                # w/o memory constraints, channel-blocks are only used to balance workloads
+                out = filter_manager(self.sigdata, self.b, self.a, select=select, 
+                                     chan_per_worker="auto")
+                assert np.allclose(out.data, ref.data)
+                del out, ref
+
+        with pytest.raises(SPYValueError):
+            filter_manager(self.sigdata, self.b, self.a, chan_per_worker="many")
+
+    def test_fused_pipeline(self):
+        for select in self.sigdataSelections:
+
+            # reference: filter and moving average computed one after the other
+            filtered = filter_manager(self.sigdata, self.b, self.a, select=select)
+            ref = MovingAverage(width=21)
+            ref.initialize(filtered)
+            refOut = AnalogData(dimord=AnalogData._defaultDimord)
+            ref.compute(filtered, refOut)
+            del filtered
+
+            for kwargs in [{}, {"parallel": "threads"}, {"chan_per_worker": 2}]:
+                if select is not None:
+                    self.sigdata._selection = select
+                parallel = kwargs.get("parallel", False)
+                pipeline = ComputationalPipeline(LowPassFilter(self.b, a=self.a),
+                                                 MovingAverage(width=21))
+                pipeline.initialize(self.sigdata,
+                                    chan_per_worker=kwargs.get("chan_per_worker"))
+                out = AnalogData(dimord=AnalogData._defaultDimord)
+                pipeline.compute(self.sigdata, out, parallel=parallel)
+                self.sigdata._selection = None
+                assert np.allclose(out.data, refOut.data)
+                assert np.array_equal(out.trialdefinition, refOut.trialdefinition)
+                assert np.array_equal(out.channel, refOut.channel)
+                assert [stage["computeFunction"] for stage in out.cfg["stages"]] == \
+                    ["lowpass", "moving_average"]
+                del out
+
+            # only the last stage averages across trials
+            if select is not None:
+                self.sigdata._selection = select
+            pipeline = ComputationalPipeline(LowPassFilter(self.b, a=self.a),
+                                             MovingAverage(width=21))
+            pipeline.initialize(self.sigdata, keeptrials=False)
+            out = AnalogData(dimord=AnalogData._defaultDimord)
+            pipeline.compute(self.sigdata, out)
+            self.sigdata._selection = None
+            assert np.allclose(out.data, np.mean(np.array(refOut.trials), axis=0))
+            del out, refOut
+
+        with pytest.raises(SPYValueError):
+            ComputationalPipeline()
+        with pytest.raises(SPYTypeError):
+            ComputationalPipeline(LowPassFilter(self.b, a=self.a), lowpass)
+
+    def test_sequential_nanaverage(self):
+        nandata = self._nandata()
+        ref = filter_manager(nandata, self.b, self.a)
+        reference = np.nanmean(np.array(ref.trials), axis=0)
+        for kwargs in [{}, {"prefetch": 2}, {"parallel": "threads"}]:
+            out = filter_manager(nandata, self.b, self.a, keeptrials=False, **kwargs)
+            assert np.allclose(out.data, reference, equal_nan=True)
+            assert np.all(np.isnan(out.data[:, 0]))
+            del out
+
+    def test_sequential_profile(self):
+        for select in self.sigdataSelections:
+            sel = Selector(self.sigdata, select)
+            ref = filter_manager(self.sigdata, self.b, self.a, select=select)
+            for kwargs in [{}, {"prefetch": 2}, {"parallel": "threads"},
+                           {"chan_per_worker": self.chanPerWrkr}]:
+                out = filter_manager(self.sigdata, self.b, self.a, select=select,
+                                     profile=True, **kwargs)
+                assert np.allclose(out.data, ref.data)
+                self._check_profile(out, sel.trials)
+                del out
+            assert "profile" not in ref.cfg.keys()
+            del ref
+
+        # averages are profiled as well
+        out = filter_manager(self.sigdata, self.b, self.a, keeptrials=False, profile=True)
+        self._check_profile(out, list(range(self.nTrials)))
+
+        # export per-chunk records and summary
+        with tempfile.TemporaryDirectory() as tdir:
+            csvname = os.path.join(tdir, "profile.csv")
+            spy.export_profile(out, csvname)
+            with open(csvname, "r") as fid:
+                lines = fid.read().splitlines()
+            assert lines[0].split(",") == profileFields
+            assert len(lines) == self.nTrials + 1
+            jsonname = os.path.join(tdir, "profile.json")
+            spy.export_profile(out.cfg["profile"], jsonname)
+            with open(jsonname, "r") as fid:
+                assert json.load(fid) == json.loads(json.dumps(out.cfg["profile"]))
+            with pytest.raises(SPYValueError):
+                spy.export_profile(out, os.path.join(tdir, "profile.txt"))
+        with pytest.raises(SPYTypeError):
+            spy.export_profile(self.sigdata, "profile.json")
+
+    def _check_profile(self, out, trials):
+        # every chunk has been recorded, totals add up
+        profile = out.cfg["profile"]
+        chunkTrials = [rec["trial"] for rec in profile["chunks"]]
+        assert sorted(set(chunkTrials)) == sorted(trials)
+        assert profile["read_bytes"] > 0
+        assert profile["compute_time"] > 0
+        assert profile["peak_rss"] > 0
+        assert np.isclose(profile["read_time"],
+                          sum(rec["read_time"] for rec in profile["chunks"]))
+        assert all(rec["worker"] for rec in profile["chunks"])
+        assert 0 <= profile["io_fraction"] <= 1
+
+    def test_shared_arguments(self):
+        # arguments identical for all trials are not subject to size limits...
+        ref = filter_manager(self.sigdata, self.b, self.a)
+        for parallel in [False, "processes"]:
+            myfilter = LowPassFilter(self.b, a=self.a)
+            myfilter._maxArgSize = 0
+            myfilter.initialize(self.sigdata)
+            assert myfilter.sharedArgs == [0]
+            out = AnalogData(dimord=AnalogData._defaultDimord)
+            myfilter.compute(self.sigdata, out, parallel=parallel)
+            assert np.allclose(out.data, ref.data)
+            del out
+
+        # ...by-trial arguments are
+        flaky = FlakyLowPassFilter(self.b, list(range(self.nTrials)), a=self.a)
+        flaky._maxArgSize = 0
+        with pytest.raises(SPYValueError):
+            flaky.initialize(self.sigdata)
+
+        # memory footprint of arrays is given by their buffer size (also for views)
+        arr = np.zeros((1024, 1024))
+        assert myfilter._sizeof(arr[:, :512]) == 4
+
+    def test_handle_pool(self):
+        # handles are re-used, least recently used ones are closed first
+        pool = HandlePool(maxHandles=2)
+        origdata = AnalogData(data=self.orig, samplerate=self.fs, trialdefinition=self.trl,
+                              dimord=["time", "channel"])
+        h5sig = pool.hdf5(self.sigdata.filename)
+        assert pool.hdf5(self.sigdata.filename) is h5sig
+        h5orig = pool.hdf5(origdata.filename)
+        pool.hdf5(self.sigdata.filename)
+        with tempfile.TemporaryDirectory() as tdir:
+            npyname = os.path.join(tdir, "sig.npy")
+            np.save(npyname, self.sig)
+            assert np.array_equal(pool.npy(npyname), self.sig)
+            assert not h5orig
+            assert h5sig
+            assert len(pool) == 2
+            pool.release()
+            assert not h5sig
+            assert len(pool) == 0
+
+        # pools of workers are cleared once the computation is done
+        for parallel in [False, "threads"]:
+            out = filter_manager(self.sigdata, self.b, self.a, parallel=parallel)
+            assert len(workerPool) == 0
+            assert np.allclose(out.data, filter_manager(self.sigdata, self.b, self.a).data)
+            del out
+
+    def test_buffered_reads(self):
+        # chunks are read into a single re-usable buffer
+        pool = HandlePool()
+        dset = pool.hdf5(self.sigdata.filename)[self.sigdata.data.name]
+        grids = [(slice(0, 100), slice(None)), (slice(200, 250), [1, 3, 5])]
+        arrs = []
+        for grid in grids:
+            arr = read_chunk(dset, grid, True, pool)
+            assert np.array_equal(arr, dset[grid])
+            arrs.append(arr)
+        assert np.shares_memory(arrs[0], arrs[1])
+        assert not np.shares_memory(read_chunk(dset, grids[1], True), arrs[1])
+        pool.release()
+
+        # results that are views of the source data must not be overwritten
+        reference = np.vstack([trl[::-1, :] for trl in self.sigdata.trials])
+        for parallel in [False, "threads", "processes"]:
+            for kwargs in [{}, {"prefetch": 2}] if parallel is False else [{}]:
+                reversal = TimeReversal()
+                reversal.initialize(self.sigdata)
+                out = AnalogData(dimord=AnalogData._defaultDimord)
+                reversal.compute(self.sigdata, out, parallel=parallel, **kwargs)
+                assert np.array_equal(out.data, reference)
+                del out
+            reversal = TimeReversal()
+            reversal.initialize(self.sigdata, keeptrials=False)
+            out = AnalogData(dimord=AnalogData._defaultDimord)
+            reversal.compute(self.sigdata, out, parallel=parallel)
+            assert np.allclose(out.data, np.mean(np.array(self.sigdata.trials), axis=0)[::-1, :])
+            del out
+
+    def test_storage(self):
+        # compressed results with trial-aligned chunks
+        ref = filter_manager(self.sigdata, self.b, self.a)
+        storage = {"chunks": "trials", "compression": "gzip", "compression_opts": 4,
+                   "shuffle": True}
+        for parallel in [False, "threads"]:
+            myfilter = LowPassFilter(self.b, a=self.a)
+            myfilter.initialize(self.sigdata)
+            out = AnalogData(dimord=AnalogData._defaultDimord)
+            myfilter.compute(self.sigdata, out, parallel=parallel, storage=storage)
+            assert np.allclose(out.data, ref.data)
+            assert out.data.compression == "gzip"
+            assert out.data.shuffle
+            trlLen = max(trl.shape[0] for trl in self.sigdata.trials)
+            assert out.data.chunks[0] <= trlLen
+
+            # layout is kept when saving (unless told otherwise)
+            with tempfile.TemporaryDirectory() as tdir:
+                fname = os.path.join(tdir, "dummy")
+                out.save(fname)
+                dummy = load(fname)
+                assert dummy.data.compression == "gzip"
+                assert dummy.data.chunks == out.data.chunks
+                assert np.array_equal(dummy.data, out.data)
+                dummy.save(fname + "2", storage={"compression": None})
+                dummy2 = load(fname + "2")
+                assert dummy2.data.compression is None
+                assert np.array_equal(dummy2.data, out.data)
+                del dummy, dummy2
+            del out
+
+        # package-wide default
+        default = dict(spy.__storageopts__)
+        spy.__storageopts__["compression"] = "lzf"
+        try:
+            out = filter_manager(self.sigdata, self.b, self.a)
+            assert out.data.compression == "lzf"
+            del out
+        finally:
+            spy.__storageopts__.update(default)
+        
+        myfilter = LowPassFilter(self.b, a=self.a)
+        myfilter.initialize(self.sigdata)
+        with pytest.raises(SPYValueError):
+            myfilter.compute(self.sigdata, AnalogData(dimord=AnalogData._defaultDimord),
+                             storage={"compression": "zstd"})
+
+    def test_dry_run_inference(self):
+        ref = LowPassFilter(self.b, a=self.a)
+        ref.initialize(self.sigdata, chan_per_worker=self.chanPerWrkr)
+        for chan_per_worker in [None, self.chanPerWrkr]:
+
+            # trials of identical shapes are only dry-run once
+            del dryRunShapes[:]
+            myfilter = CountingLowPassFilter(self.b, a=self.a)
+            myfilter.initialize(self.sigdata, chan_per_worker=chan_per_worker)
+            nShapes = len(set(trl.shape for trl in self.sigdata.trials))
+            if chan_per_worker is None:
+                assert len(dryRunShapes) == nShapes
+            else:
+                nBlocks = len(set([self.chanPerWrkr, self.nChannels % self.chanPerWrkr]))
+                assert len(dryRunShapes) == nShapes + 1 + nShapes * nBlocks
+
+            # vectorized shape inference does not dry-run trials at all (except 
+            # for identifying the output channel axis)
+            del dryRunShapes[:]
+            inferred = InferringLowPassFilter(self.b, a=self.a)
+            inferred.initialize(self.sigdata, chan_per_worker=chan_per_worker)
+            assert len(dryRunShapes) == int(chan_per_worker is not None)
+            for attr in ["outputShape", "sourceLayout", "targetLayout", "targetShapes"]:
+                assert getattr(inferred, attr) == getattr(myfilter, attr)
+            if chan_per_worker is not None:
+                assert myfilter.targetLayout == ref.targetLayout
+            out = AnalogData(dimord=AnalogData._defaultDimord)
+            inferred.compute(self.sigdata, out)
+            assert np.allclose(out.data, filter_manager(self.sigdata, self.b, self.a).data)
+            del out
+
+    def test_coalesced_reads(self):
+        # fancy selections (unordered, w/repetitions) only read selected runs
+        dset = HandlePool().hdf5(self.sigdata.filename)[self.sigdata.data.name]
+        ingrid = (slice(100, 400), slice(2, 30))
+        bbox = dset[ingrid]
+        sigrids = [(np.arange(300), np.array([0, 27])),
+                   (np.array([5, 3, 3, 4, 250, 251]), np.array([27, 0, 1, 2, 2, 10])),
+                   (self.seed.choice(300, 50), np.arange(28)[::-1])]
+        for sigrid in sigrids:
+            ref = bbox[np.ix_(*sigrid)]
+            assert np.array_equal(read_selection(dset, ingrid, sigrid), ref)
+            assert np.array_equal(read_selection(dset, ingrid, sigrid, HandlePool()), ref)
+
+            # too many runs: fall back to reading the bounding box
+            maxReads = handle_pool.maxHyperslabReads
+            handle_pool.maxHyperslabReads = 0
+            try:
+                assert np.array_equal(read_selection(dset, ingrid, sigrid), ref)
+            finally:
+                handle_pool.maxHyperslabReads = maxReads
+
+    def _nandata(self):
+        # Inject NaNs in trial #2 (rendering channel 0 invalid in all trials)
+        sig = self.sig.copy()
+        sig[2 * self.fs + 100 : 3 * self.fs, 1:4] = np.nan
+        sig[:, 0] = np.nan
+        return AnalogData(data=sig, samplerate=self.fs, trialdefinition=self.trl,
+                          dimord=["time", "channel"])
+
+    def test_result_cache(self, monkeypatch):
+        spy.io.utils._evict_cache(limit=0)
+        for select in self.sigdataSelections:
+            sel = Selector(self.sigdata, select)
+            for keeptrials in [True, False]:
+                if select is not None:
+                    self.sigdata._selection = select
+                outs = []
+                for attempt in range(2):
+                    myfilter = LowPassFilter(self.b, a=self.a)
+                    out = AnalogData(dimord=AnalogData._defaultDimord)
+                    hit = myfilter.fetch_cached(self.sigdata, out, keeptrials=keeptrials)
+                    assert hit == (attempt == 1)
+                    if not hit:
+                        myfilter.initialize(self.sigdata, keeptrials=keeptrials)
+                        myfilter.compute(self.sigdata, out)
+                    outs.append(out)
+                self.sigdata._selection = None
+                assert np.array_equal(outs[0].data, outs[1].data)
+                assert np.array_equal(outs[0].channel, outs[1].channel)
+                assert np.array_equal(outs[0].trialdefinition, outs[1].trialdefinition)
+                assert outs[0].samplerate == outs[1].samplerate
+                assert outs[0].cfg == outs[1].cfg
+                if keeptrials:
+                    for tk in range(len(sel.trials)):
+                        assert np.array_equal(outs[0].time[tk], outs[1].time[tk])
+
+        # a different filter must not re-use cached results
+        myfilter = LowPassFilter(self.b, a=self.a[::-1])
+        out = AnalogData(dimord=AnalogData._defaultDimord)
+        assert not myfilter.fetch_cached(self.sigdata, out)
+
+        # cache entries are removed once the cache exceeds its limit
+        assert len(glob(os.path.join(spy.__cache__, "*.h5"))) == 2 * len(self.sigdataSelections)
+        spy.io.utils._evict_cache(limit=0)
+        assert len(glob(os.path.join(spy.__cache__, "*.h5"))) == 0
+
+        # the key is computed only once (not altered by `initialize`) and the 
+        # checksums of saved containers are not re-computed
+        with tempfile.TemporaryDirectory() as tdir:
+            fname = os.path.join(tdir, "dummy")
+            AnalogData(data=self.sig, samplerate=self.fs, trialdefinition=self.trl,
+                       dimord=["time", "channel"]).save(fname)
+            dummy = load(fname, mode="r")
+            checksum = spy.io.utils.hash_file(dummy.filename)
+            assert computational_routine._file_checksum(dummy.filename) == checksum
+            def no_hashing(fname, bsize=65536):
+                raise AssertionError("re-computed checksum of " + fname)
+            monkeypatch.setattr(spy.io.utils, "hash_file", no_hashing)
+            myfilter = LowPassFilter(self.b, a=self.a)
+            out = AnalogData(dimord=AnalogData._defaultDimord)
+            assert not myfilter.fetch_cached(dummy, out)
+            cacheKey = myfilter.cacheKey
+            myfilter.initialize(dummy, keeptrials=True)
+            assert myfilter._cache_key(dummy) == cacheKey
+            myfilter.compute(dummy, out)
+            assert np.array_equal(out.data, filter_manager(self.sigdata, self.b, self.a).data)
+            monkeypatch.undo()
+            del dummy, out
+        spy.io.utils._evict_cache(limit=0)
+
     @skip_without_dask
     def test_parallel_equidistant(self, testcluster):
         client = dd.Client(testcluster)
         for parallel_store in [True, False]:
             for chan_per_worker in [None, self.chanPerWrkr]:
                 for sk, select in enumerate(self.sigdataSelections):
-                    # FIXME: remove as soon as channel-parallelization works w/channel selectors
-                    if chan_per_worker is not None:
-                        select = None
                     sel = Selector(self.sigdata, select)
                     out = filter_manager(self.sigdata, self.b, self.a, select=select,
                                          chan_per_worker=chan_per_worker, parallel=True,
@@ -386,9 +981,6 @@ class TestComputationalRoutine():
             for parallel_store in [True, False]:
                 for chan_per_worker in [None, self.chanPerWrkr]:
                     for select in self.artdataSelections:
-                        # FIXME: remove as soon as channel-parallelization works w/channel selectors
-                        if chan_per_worker is not None:
-                            select = None
                         sel = Selector(nonequidata, select)
                         out = filter_manager(nonequidata, self.b, self.a, select=select,
                                              chan_per_worker=chan_per_worker, parallel=True,
@@ -430,6 +1022,287 @@ class TestComputationalRoutine():
 
         client.close()
 
+    @skip_without_dask
+    def test_parallel_batched(self, testcluster):
+        client = dd.Client(testcluster)
+        for parallel_store in [True, False]:
+            for chan_per_worker in [None, self.chanPerWrkr]:
+                for trials_per_task in [3, "auto"]:
+                    for sk, select in enumerate(self.sigdataSelections):
+                        sel = Selector(self.sigdata, select)
+                        out = filter_manager(self.sigdata, self.b, self.a, select=select,
+                                             chan_per_worker=chan_per_worker, parallel=True,
+                                             parallel_store=parallel_store,
+                                             trials_per_task=trials_per_task)
+                        assert out.data.is_virtual == parallel_store
+
+                        # batched computation must be identical to un-batched one
+                        ref = filter_manager(self.sigdata, self.b, self.a, select=select,
+                                             chan_per_worker=chan_per_worker, parallel=True,
+                                             parallel_store=parallel_store)
+                        assert np.array_equal(out.data, ref.data)
+                        assert np.array_equal(out.channel, ref.channel)
+                        for tk in range(len(sel.trials)):
+                            assert np.array_equal(out.time[tk], ref.time[tk])
+
+                        # one HDF5 file per task (not per chunk)
+                        if parallel_store and trials_per_task == 3:
+                            nfiles = len(glob(os.path.join(os.path.splitext(out.filename)[0], "*.h5")))
+                            nChunks = len(glob(os.path.join(os.path.splitext(ref.filename)[0], "*.h5")))
+                            assert nfiles == int(np.ceil(nChunks / trials_per_task))
+
+                    out = filter_manager(self.sigdata, self.b, self.a, parallel=True,
+                                         parallel_store=parallel_store, keeptrials=False,
+                                         trials_per_task=trials_per_task)
+                    ref = filter_manager(self.sigdata, self.b, self.a, parallel=True,
+                                         parallel_store=parallel_store, keeptrials=False)
+                    assert np.allclose(out.data, ref.data)
+
+        # invalid batch sizes
+        with pytest.raises(SPYValueError):
+            filter_manager(self.sigdata, self.b, self.a, parallel=True, trials_per_task=0)
+        with pytest.raises(SPYValueError):
+            filter_manager(self.sigdata, self.b, self.a, parallel=True, trials_per_task="all")
+
+        client.close()
+
+    @skip_without_dask
+    def test_parallel_nanaverage(self, testcluster):
+        client = dd.Client(testcluster)
+        nandata = self._nandata()
+        ref = filter_manager(nandata, self.b, self.a)
+        reference = np.nanmean(np.array(ref.trials), axis=0)
+        for parallel_store in [None, False]:
+            for trials_per_task in [None, 1, 3]:
+                out = filter_manager(nandata, self.b, self.a, keeptrials=False,
+                                     parallel=True, parallel_store=parallel_store,
+                                     trials_per_task=trials_per_task)
+                assert not out.data.is_virtual
+                assert np.allclose(out.data, reference, equal_nan=True)
+                del out
+        client.close()
+
+    @skip_without_dask
+    def test_parallel_profile(self, testcluster):
+        client = dd.Client(testcluster)
+        for select in self.sigdataSelections:
+            sel = Selector(self.sigdata, select)
+            for kwargs in [{}, {"trials_per_task": 3}, {"parallel_store": False},
+                           {"keeptrials": False}]:
+                out = filter_manager(self.sigdata, self.b, self.a, select=select,
+                                     parallel=True, profile=True, **kwargs)
+                self._check_profile(out, sel.trials)
+                del out
+        client.close()
+
+    @skip_without_dask
+    def test_parallel_shared_arguments(self, testcluster):
+        client = dd.Client(testcluster)
+        ref = filter_manager(self.sigdata, self.b, self.a)
+        for trials_per_task in [None, 3]:
+            myfilter = FlakyLowPassFilter(self.b, list(range(self.nTrials)), a=self.a,
+                                          markerdir=spy.__storage__)
+            myfilter._maxArgSize = 1
+            myfilter.initialize(self.sigdata)
+            assert myfilter.sharedArgs == [0]
+            out = AnalogData(dimord=AnalogData._defaultDimord)
+            myfilter.compute(self.sigdata, out, parallel=True,
+                             trials_per_task=trials_per_task)
+            assert np.allclose(out.data, ref.data)
+            del out
+
+        # containers are broadcast as a whole (not as collections of futures)
+        myfilter = DictLowPassFilter({"b": self.b, "a": self.a})
+        myfilter.initialize(self.sigdata)
+        assert myfilter.sharedArgs == [0]
+        out = AnalogData(dimord=AnalogData._defaultDimord)
+        myfilter.compute(self.sigdata, out, parallel=True)
+        assert np.allclose(out.data, ref.data)
+        del out
+        client.close()
+
+    @skip_without_dask
+    def test_parallel_longest_first(self, testcluster):
+        client = dd.Client(testcluster)
+        nonequidata = generate_artificial_data(nTrials=self.nTrials,
+                                               nChannels=self.nChannels,
+                                               equidistant=False,
+                                               inmemory=False)
+        ref = filter_manager(nonequidata, self.b, self.a)
+        for trials_per_task in [None, 2]:
+            myfilter = LowPassFilter(self.b, a=self.a)
+            myfilter.initialize(nonequidata)
+            out = AnalogData(dimord=AnalogData._defaultDimord)
+            myfilter.compute(nonequidata, out, parallel=True,
+                             trials_per_task=trials_per_task)
+            assert sorted(chk for task in myfilter.taskLayout for chk in task) == \
+                list(range(len(myfilter.sourceLayout)))
+            assert myfilter.taskMem == sorted(myfilter.taskMem, reverse=True)
+            assert np.allclose(out.data, ref.data)
+            del out
+
+        client.close()
+
+        # memory-annotated tasks only run on workers offering the resource
+        cluster = dd.LocalCluster(n_workers=1, threads_per_worker=2,
+                                  resources={"MEMORY": 2**40})
+        client = dd.Client(cluster)
+        myfilter = LowPassFilter(self.b, a=self.a)
+        myfilter.initialize(nonequidata)
+        out = AnalogData(dimord=AnalogData._defaultDimord)
+        myfilter.compute(nonequidata, out, parallel=True, memory_resource="MEMORY")
+        assert myfilter.memoryResource == "MEMORY"
+        priorities = list(myfilter.keyPriorities.values())
+        assert priorities == sorted(priorities, reverse=True)
+        assert [res["MEMORY"] for res in myfilter.keyResources.values()] == myfilter.taskMem
+        assert np.allclose(out.data, ref.data)
+        del out
+        client.close()
+        cluster.close()
+
+    @skip_without_dask
+    def test_parallel_shards(self, testcluster):
+        client = dd.Client(testcluster)
+        ref = filter_manager(self.sigdata, self.b, self.a)
+        for chan_per_worker in [None, self.chanPerWrkr]:
+            for trials_per_task in [None, 2]:
+                myfilter = LowPassFilter(self.b, a=self.a)
+                myfilter.initialize(self.sigdata, chan_per_worker=chan_per_worker)
+                out = AnalogData(dimord=AnalogData._defaultDimord)
+                myfilter.compute(self.sigdata, out, parallel=True, parallel_store="shards",
+                                 trials_per_task=trials_per_task)
+                assert out.data.is_virtual
+                assert np.allclose(out.data, ref.data)
+                shards = glob(os.path.join(os.path.splitext(out.filename)[0], "*.h5"))
+                assert 0 < len(shards) <= len(client.cluster.workers)
+                assert all(os.path.basename(shard).startswith("shard_") for shard in shards)
+                del out
+
+        # consolidated results are regular contiguous datasets (w/o source files)
+        for parallel_store in [True, "shards"]:
+            myfilter = LowPassFilter(self.b, a=self.a)
+            myfilter.initialize(self.sigdata)
+            out = AnalogData(dimord=AnalogData._defaultDimord)
+            myfilter.compute(self.sigdata, out, parallel=True, parallel_store=parallel_store,
+                             consolidate=True)
+            assert not out.data.is_virtual
+            assert not os.path.isdir(os.path.splitext(out.filename)[0])
+            assert np.allclose(out.data, ref.data)
+            del out
+
+        myfilter = LowPassFilter(self.b, a=self.a)
+        myfilter.initialize(self.sigdata)
+        with pytest.raises(SPYValueError):
+            myfilter.compute(self.sigdata, AnalogData(dimord=AnalogData._defaultDimord),
+                             parallel=True, parallel_store="files")
+        client.close()
+
+    @skip_without_dask
+    def test_parallel_multi_object(self, testcluster, monkeypatch):
+        client = dd.Client(testcluster)
+
+        # record how many objects are processed by a single task graph
+        awaited = []
+        await_futures = computational_routine._await_futures
+        def counting_await(routines, client):
+            awaited.append(len(routines))
+            return await_futures(routines, client)
+        monkeypatch.setattr(computational_routine, "_await_futures", counting_await)
+
+        nonequidata = generate_artificial_data(nTrials=self.nTrials,
+                                               nChannels=self.nChannels,
+                                               equidistant=False, inmemory=False)
+        objs = [self.sigdata, nonequidata]
+        for select in [None, {"trials": [3, 1, 0], "channels": range(0, 16)}]:
+            refs = [filter_manager(obj, self.b, self.a, select=select) for obj in objs]
+            for parallel_store in [True, False]:
+                awaited.clear()
+                outs = compute_batch(filter_manager, objs, self.b, self.a, select=select,
+                                     parallel=True, parallel_store=parallel_store)
+                assert awaited == [len(objs)]
+                assert len(outs) == len(objs)
+                for obj, out, ref in zip(objs, outs, refs):
+                    assert obj._selection is None
+                    assert out.data.is_virtual == parallel_store
+                    assert np.allclose(out.data, ref.data)
+                    assert np.array_equal(out.channel, ref.channel)
+                    assert np.array_equal(out.trialdefinition, ref.trialdefinition)
+                    del out
+
+        # sequential computations are not queued but performed right away
+        refs = [filter_manager(obj, self.b, self.a) for obj in objs]
+        awaited.clear()
+        outs = compute_batch(filter_manager, objs, self.b, self.a, parallel=False)
+        assert awaited == []
+        for out, ref in zip(outs, refs):
+            assert np.allclose(out.data, ref.data)
+        client.close()
+
+    @skip_without_dask
+    def test_parallel_resume(self, testcluster):
+        client = dd.Client(testcluster)
+        ref = filter_manager(self.sigdata, self.b, self.a)
+
+        def flaky_filter(markerdir, **kwargs):
+            myfilter = FlakyLowPassFilter(self.b, list(range(self.nTrials)), 
+                                          a=self.a, markerdir=markerdir)
+            myfilter.initialize(self.sigdata, chan_per_worker=None, keeptrials=True)
+            out = AnalogData(dimord=AnalogData._defaultDimord)
+            myfilter.compute(self.sigdata, out, parallel=True, **kwargs)
+            return out, myfilter
+        
+        with tempfile.TemporaryDirectory() as tdir:
+
+            # first run: one trial keeps failing, all others are recorded in the manifest
+            failing = 5
+            open(os.path.join(tdir, "fail{}".format(failing)), "w").close()
+            ckptPattern = os.path.join(spy.__checkpoints__, "*")
+            oldCkpts = set(glob(ckptPattern))
+            with pytest.raises(SPYParallelError) as spyval:
+                flaky_filter(tdir, resume=True)
+            assert "resume=True" in str(spyval.value)
+            ckptdir = list(set(glob(ckptPattern)).difference(oldCkpts))
+            assert len(ckptdir) == 1
+            ckptdir = ckptdir[0]
+            with open(os.path.join(ckptdir, "manifest.json"), "r") as manifest:
+                completed = json.load(manifest)["completed"]
+            assert completed == [tk for tk in range(self.nTrials) if tk != failing]
+            mtimes = {tk: os.path.getmtime(os.path.join(ckptdir, "{}.h5".format(tk)))
+                      for tk in completed}
+
+            # second run: only the previously failed trial is processed
+            os.unlink(os.path.join(tdir, "fail{}".format(failing)))
+            time.sleep(0.1)
+            out, myfilter = flaky_filter(tdir, resume=True)
+            assert myfilter.completedTasks == completed
+            assert not os.path.isdir(ckptdir)
+            vdsdir = os.path.splitext(out.filename)[0]
+            for tk in completed:
+                assert os.path.getmtime(os.path.join(vdsdir, "{}.h5".format(tk))) == mtimes[tk]
+            assert np.array_equal(out.data, ref.data)
+            
+            # sporadically failing tasks are re-scheduled
+            for tk in [0, 3]:
+                open(os.path.join(tdir, "once{}".format(tk)), "w").close()
+            with pytest.raises(SPYParallelError):
+                flaky_filter(tdir, retries=0)
+            open(os.path.join(tdir, "once0"), "w").close()
+            out, _ = flaky_filter(tdir, retries=1)
+            assert np.array_equal(out.data, ref.data)
+            with pytest.raises(SPYValueError):
+                flaky_filter(tdir, retries=-1)
+            del out
+
+            # fail-fast: remaining tasks are cancelled once the first task failed
+            open(os.path.join(tdir, "fail0"), "w").close()
+            with pytest.raises(SPYParallelError) as spyval:
+                flaky_filter(tdir, fail_fast=True)
+            assert "tasks failed or stalled" in str(spyval.value)
+            with pytest.raises(SPYTypeError):
+                flaky_filter(tdir, fail_fast="yes")
+
+        client.close()
+
     @skip_without_dask
     def test_parallel_saveload(self, testcluster):
         client = dd.Client(testcluster)
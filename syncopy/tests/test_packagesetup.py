@@ -85,3 +85,38 @@ def test_cleanup():
     shutil.rmtree(tmpDir)
     del os.environ["SPYTMPDIR"]
     time.sleep(1)
+
+
+# check that `cleanup` does not touch checkpoints of interrupted computations
+def test_cleanup_checkpoints():
+    # in a fresh $SPYTMPDIR, mimic an interrupted resumable computation (manifest 
+    # + one completed task) and leave some dangling data behind
+    tmpDir = os.path.join(tempfile.gettempdir(), "spy_checkpoints")
+    os.environ["SPYTMPDIR"] = tmpDir
+    commandStr = \
+        "import os; " +\
+        "import syncopy as spy; " +\
+        "ckpt = os.path.join(spy.__checkpoints__, 'deadbeef'); " +\
+        "os.makedirs(ckpt); " +\
+        "open(os.path.join(ckpt, 'manifest.json'), 'w').close(); " +\
+        "open(os.path.join(ckpt, '0.h5'), 'w').close(); " +\
+        "open(os.path.join(spy.__storage__, 'spy_dead_beef.analog'), 'w').close(); " +\
+        "spy.cleanup(older_than=1, interactive=False)"
+    subprocess.run([sys.executable, "-c", commandStr], check=True)
+
+    # dangling data is gone, but the (recent) checkpoint survives
+    ckptDir = os.path.join(tmpDir, "checkpoints", "deadbeef")
+    assert not os.path.exists(os.path.join(tmpDir, "spy_dead_beef.analog"))
+    assert os.path.isfile(os.path.join(ckptDir, "manifest.json"))
+    assert os.path.isfile(os.path.join(ckptDir, "0.h5"))
+
+    # abandoned checkpoints are removed based on their age
+    commandStr = \
+        "import syncopy as spy; " +\
+        "spy.cleanup(older_than=0, interactive=False)"
+    subprocess.run([sys.executable, "-c", commandStr], check=True)
+    assert not os.path.exists(ckptDir)
+
+    shutil.rmtree(tmpDir)
+    del os.environ["SPYTMPDIR"]
+    time.sleep(1)
@@ -13,8 +13,8 @@ from collections import OrderedDict
 
 # Local imports
 from syncopy.shared.parsers import (io_parser, scalar_parser, array_parser, 
-                                    filename_parser, data_parser)
-from syncopy.shared.tools import get_defaults
+                                    filename_parser, data_parser, storage_parser)
+from syncopy.shared.tools import get_defaults, storage_kwargs
 from syncopy.shared.errors import SPYValueError, SPYTypeError, SPYIOError
 from syncopy import AnalogData, SpectralData
 
@@ -217,6 +217,49 @@ class TestArrayParser():
             assert errmsg in str(spyval.value)
 
 
+class TestStorageParser():
+
+    def test_defaults(self):
+        opts = storage_parser(None)
+        assert set(opts.keys()) == set(["chunks", "compression", "compression_opts", "shuffle"])
+        assert storage_kwargs(opts, (100, 10), np.float32) == {}
+
+    def test_valid(self):
+        opts = storage_parser({"chunks": "trials", "compression": "gzip", 
+                               "compression_opts": 3, "shuffle": True})
+        kwargs = storage_kwargs(opts, (10000, 64), np.float64, blockShape=(5000, 64))
+        assert kwargs["compression"] == "gzip"
+        assert kwargs["compression_opts"] == 3
+        assert kwargs["shuffle"]
+        assert np.prod(kwargs["chunks"]) * 8 <= 1024**2
+        assert all(c <= b for c, b in zip(kwargs["chunks"], (5000, 64)))
+        kwargs = storage_kwargs(storage_parser({"chunks": [50, 100]}), (100, 10), np.float32)
+        assert kwargs == {"chunks": (50, 10)}
+        kwargs = storage_kwargs(storage_parser({"compression": "lzf"}), (100, 10), np.float32)
+        assert kwargs == {"compression": "lzf", "chunks": True}
+        assert storage_kwargs(opts, (0, 10), np.float32) == {}
+
+    def test_invalid(self):
+        with pytest.raises(SPYTypeError):
+            storage_parser("lzf")
+        with pytest.raises(SPYValueError):
+            storage_parser({"filters": "lzf"})
+        with pytest.raises(SPYValueError):
+            storage_parser({"chunks": "channels"})
+        with pytest.raises(SPYValueError):
+            storage_parser({"chunks": (0, 10)})
+        with pytest.raises(SPYValueError):
+            storage_parser({"compression": "zstd"})
+        with pytest.raises(SPYValueError):
+            storage_parser({"compression": "lzf", "compression_opts": 4})
+        with pytest.raises(SPYValueError):
+            storage_parser({"compression": "gzip", "compression_opts": 10})
+        with pytest.raises(SPYTypeError):
+            storage_parser({"shuffle": 1})
+        with pytest.raises(SPYValueError):
+            storage_kwargs(storage_parser({"chunks": (10,)}), (100, 10), np.float32)
+
+
 class TestFilenameParser():
     referenceResult = {
         "filename": "sessionName_testTag.analog",
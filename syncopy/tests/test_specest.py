@@ -12,14 +12,20 @@ import pytest
 import numpy as np
 import scipy.signal as scisig
 from numpy.lib.format import open_memmap
-from syncopy import __dask__
+from syncopy import __dask__, __fftbackend__
 if __dask__:
     import dask.distributed as dd
     
 # Local imports
 from syncopy.tests.misc import generate_artificial_data
 from syncopy.specest.freqanalysis import freqanalysis
-from syncopy.shared.errors import SPYValueError
+import syncopy.specest.mtmfft as mtmfft
+import syncopy.specest.mtmconvol as mtmconvol
+from syncopy.specest.fft_backend import (FFTBackend, fft_backend_parser,
+                                         get_fft_backend)
+from syncopy.specest.taper_cache import (TaperCache, taperCache, taper_cache_info,
+                                         warm_taper_cache)
+from syncopy.shared.errors import SPYValueError, SPYTypeError
 from syncopy.datatype.methods.padding import _nextpow2
 from syncopy.datatype.base_data import VirtualData, Selector
 from syncopy.datatype import AnalogData, SpectralData, padding
@@ -374,6 +380,56 @@ class TestMTMFFT():
             assert np.max(spec.freq - freqs) < self.ftol
             assert spec.taper.size == 1
 
+    def test_taper_blocks(self):
+        # batched transforms (in blocks of tapers) match taper-by-taper FFTs
+        trl = self.adata.trials[0]
+        nSamples = trl.shape[0]
+        taperopt = {"NW": 4, "Kmax": 7}
+        win = scisig.windows.dpss(nSamples, **taperopt)
+        foi = np.arange(0, 513, 2, dtype=float)
+        freqs = np.linspace(0, self.fs / 2, int(nSamples / 2) + 1)
+        fidx = np.array([np.abs(freqs - f).argmin() for f in foi])
+        ref = np.array([np.fft.rfft(trl * taper[:, np.newaxis], axis=0)[fidx, :]
+                        for taper in win])
+        maxBytes = mtmfft.maxTaperBytes
+        try:
+            for blockBytes in [maxBytes, 3 * trl.size * 24]:
+                mtmfft.maxTaperBytes = blockBytes
+                for keeptapers in [True, False]:
+                    spec = mtmfft.mtmfft(trl, samplerate=self.fs, foi=foi, nTaper=7,
+                                         taper=scisig.windows.dpss, taperopt=taperopt,
+                                         pad=None, keeptapers=keeptapers,
+                                         output_fmt="fourier")
+                    expected = ref if keeptapers else ref.mean(axis=0, keepdims=True)
+                    assert spec.shape == (1,) + expected.shape
+                    assert np.allclose(spec[0], expected)
+        finally:
+            mtmfft.maxTaperBytes = maxBytes
+
+    def test_pruned_transform(self):
+        # narrow-band requests only evaluate requested bins (w/identical results)
+        backend = get_fft_backend("numpy")
+        for nSamples in [2**14, 3 * 5**4, 4093]:
+            tapered = np.random.randn(2, nSamples, 3)
+            ref = np.fft.rfft(tapered, axis=1)
+            for fidx in [np.arange(10, 110), np.array([3, 250, nSamples // 2]),
+                         np.arange(0, nSamples // 2 + 1, 97)]:
+                for nFold in mtmfft._divisors(nSamples)[1:]:
+                    res = mtmfft._pruned_rfft(tapered, fidx, nFold, backend)
+                    assert np.allclose(res, ref[:, fidx, :])
+
+        # cost model: full FFT for broad, pruned transforms for narrow bands
+        assert mtmfft._fold_factor(2**14, 2**13 + 1, mtmfft.maxTaperBytes) == 1
+        assert mtmfft._fold_factor(2**14, 100, mtmfft.maxTaperBytes) > 1
+        assert mtmfft._fold_factor(4093, 1, mtmfft.maxTaperBytes) == 4093
+
+        # end-to-end: narrow `foilim` matches full-spectrum computation
+        spec = freqanalysis(self.adata, method="mtmfft", taper="hann", 
+                            foilim=[10, 20], output="fourier", pad=None)
+        full = freqanalysis(self.adata, method="mtmfft", taper="hann", 
+                            output="fourier", pad=None)
+        fidx = np.searchsorted(full.freq, spec.freq)
+        assert np.allclose(spec.data[()], full.data[:, :, fidx, :])
 
     @pytest.mark.skip(reason="VirtualData is currently not supported")
     def test_vdata(self):
@@ -852,6 +908,29 @@ class TestMTMConvol():
         for tk, origTime in enumerate(cfg.data.time):
             assert np.array_equal(origTime, tfSpec.time[tk])
             
+    def test_tf_windowed_rfft(self):
+        # batched transforms of non-equidistant windows match window-wise `stft`
+        nperseg = 64
+        dat = np.random.randn(2000, 3)
+        win = scisig.windows.dpss(nperseg, NW=2, Kmax=3)
+        starts = np.array([0, 7, 100, 101, 555, 1200, 2000 - nperseg])
+        fIdx = np.arange(2, 20)
+        maxBytes = mtmconvol.maxWindowBytes
+        try:
+            for blockBytes in [maxBytes, 2 * win.size * 3 * 24]:
+                mtmconvol.maxWindowBytes = blockBytes
+                spec = mtmconvol._windowed_rfft(dat, starts, win, fIdx, 
+                                                lambda x: x, get_fft_backend())
+                assert spec.shape == (starts.size, win.shape[0], fIdx.size, 3)
+                for tk, start in enumerate(starts):
+                    for taperIdx, taper in enumerate(win):
+                        _, _, pxx = scisig.stft(dat[start : start + nperseg, :], 
+                                                window=taper, nperseg=nperseg, 
+                                                boundary=None, padded=False, axis=0)
+                        assert np.allclose(spec[tk, taperIdx], pxx[fIdx, :, 0])
+        finally:
+            mtmconvol.maxWindowBytes = maxBytes
+
     @skip_without_dask
     def test_tf_parallel(self, testcluster):
         # collect all tests of current class and repeat them running concurrently
@@ -1211,3 +1290,87 @@ class TestWavelet():
         assert tfSpec.data.shape == (tfSpec.time[0].size, 1, expectedFreqs.size, self.nChannels)
 
         client.close()
+
+
+class TestTaperCache():
+
+    taperopt = {"NW": 4, "Kmax": 7}
+
+    def test_cache(self):
+        cache = TaperCache()
+        win = cache.get(scisig.windows.dpss, 512, self.taperopt)
+        assert win.shape == (7, 512)
+        assert not win.flags.writeable
+        assert np.allclose(win, scisig.windows.dpss(512, **self.taperopt))
+
+        # identical windows are re-used (irrespective of the order of options)
+        again = cache.get(scisig.windows.dpss, 512, {"Kmax": 7, "NW": 4})
+        assert again is win
+        assert cache.info()["hits"] == 1 and cache.info()["misses"] == 1
+        cache.get(scisig.windows.dpss, 1024, self.taperopt)
+        cache.get(scisig.windows.hann, 512)
+        assert cache.info()["misses"] == 3 and len(cache) == 3
+
+        # least recently used windows are evicted first
+        cache = TaperCache(maxBytes=2 * 7 * 512 * 8)
+        first = cache.get(scisig.windows.dpss, 512, self.taperopt)
+        cache.get(scisig.windows.dpss, 512, {"NW": 3, "Kmax": 7})
+        cache.get(scisig.windows.dpss, 512, self.taperopt)
+        cache.get(scisig.windows.dpss, 512, {"NW": 2, "Kmax": 7})
+        assert len(cache) == 2
+        assert cache.get(scisig.windows.dpss, 512, self.taperopt) is first
+        assert cache.info()["bytes"] <= cache.maxBytes
+        cache.clear()
+        assert cache.info() == {"hits": 0, "misses": 0, "windows": 0, "bytes": 0}
+
+    def test_shared_tapers(self):
+        # windows of equal-length trials are computed once across all trials
+        taperCache.clear()
+        adata = generate_artificial_data(nTrials=5, nChannels=4, inmemory=True)
+        freqanalysis(adata, method="mtmfft", taper="dpss", tapsmofrq=4, parallel=False)
+        info = taper_cache_info()
+        assert info["misses"] == 1
+        assert info["hits"] == len(adata.trials) - 1
+        warm_taper_cache([(scisig.windows.dpss, 256, self.taperopt)])
+        assert taper_cache_info()["windows"] == 2
+
+
+class TestFFTBackend():
+
+    def test_parser(self):
+        assert fft_backend_parser(None) == __fftbackend__
+        assert fft_backend_parser("scipy") == {"backend": "scipy", "workers": None}
+        assert fft_backend_parser({"backend": "scipy", "workers": -1})["workers"] == -1
+        with pytest.raises(SPYValueError):
+            fft_backend_parser("mkl")
+        with pytest.raises(SPYValueError):
+            fft_backend_parser({"backend": "scipy", "threads": 2})
+        with pytest.raises(SPYValueError):
+            fft_backend_parser({"backend": "scipy", "workers": 0})
+        with pytest.raises(SPYTypeError):
+            fft_backend_parser({"backend": "scipy", "workers": 1.5})
+        with pytest.raises(SPYTypeError):
+            fft_backend_parser(3)
+
+    def test_transforms(self):
+        sig = np.random.randn(256, 3)
+        for backend in [FFTBackend("numpy"), FFTBackend("scipy", workers=2)]:
+            assert np.allclose(backend.rfft(sig, axis=0), np.fft.rfft(sig, axis=0))
+            assert np.allclose(backend.ifft(backend.fft(sig, n=512, axis=0), axis=0)[:256, :], sig)
+            with backend.context():
+                assert np.allclose(scisig.fftconvolve(sig[:, 0], sig[:, 1]),
+                                   np.convolve(sig[:, 0], sig[:, 1]))
+        assert get_fft_backend("scipy").backend == "scipy"
+
+    def test_kernels(self):
+        # all spectral estimation methods yield identical results w/all backends
+        adata = generate_artificial_data(nTrials=2, nChannels=4, inmemory=True)
+        settings = [{"method": "mtmfft", "taper": "dpss", "tapsmofrq": 4},
+                    {"method": "mtmconvol", "t_ftimwin": 1.0, "toi": 0.0},
+                    {"method": "wavelet", "toi": "all"}]
+        for cfg in settings:
+            ref = freqanalysis(adata, parallel=False, **cfg)
+            spec = freqanalysis(adata, parallel=False,
+                                fft_backend={"backend": "scipy", "workers": 2}, **cfg)
+            assert np.allclose(spec.data[()], ref.data[()], equal_nan=True)
+            del ref, spec
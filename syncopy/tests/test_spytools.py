@@ -8,7 +8,8 @@ import numpy as np
 import pytest
 
 # Local imports
-from syncopy.shared.tools import best_match
+from syncopy.shared.tools import (best_match, nan_partial_sum, combine_partial_sums,
+                                  partial_mean)
 from syncopy.shared.errors import SPYValueError
 
 
@@ -77,4 +78,21 @@ class TestBestMatch():
                 expectedVal = np.array([elem for elem in source 
                                         if selection.min() <= elem <= selection.max()])
                 expectedIdx = np.array([np.where(source == elem)[0][0] for elem in expectedVal])
-                
\ No newline at end of file
+                
+
+
+class TestPartialSums():
+
+    def test_partial_mean(self):
+        arrs = [np.array([1., np.nan, 3.]), np.array([3., np.nan, np.nan])]
+        partial = None
+        for arr in arrs:
+            partial = nan_partial_sum(arr, partial)
+        mean = partial_mean(combine_partial_sums([None, partial]))
+        assert np.allclose(mean, [2., np.nan, 3.], equal_nan=True)
+
+        # nothing to average (e.g., empty selections or failed chunks)
+        assert combine_partial_sums([None, None]) is None
+        with pytest.raises(SPYValueError) as spyval:
+            partial_mean(None)
+        assert "no results to average" in str(spyval.value)